@@ -0,0 +1,100 @@
+"""
+Benchmark of bulk file hashing.
+
+Builds a synthetic tree of mostly small files with some multi-megabyte assets,
+then times hashing every file: serially with 4 KiB reads (as before the hash
+cache), with `FileHashCache.get_hashes` for MD5 and the fast digest on a cold
+cache, and again on a warm cache. Path ids of the images are timed per
+language with `get_unique_id` and once with `get_unique_ids`.
+
+Usage:
+    python benchmarks/bench_bulk_hash.py [--files 50000] [--languages 10]
+"""
+
+import argparse
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from co_op_translator.utils.common.file_utils import get_unique_id, get_unique_ids
+from co_op_translator.utils.common.hash_cache import (
+    FAST_HASH_ALGORITHM,
+    FileHashCache,
+)
+from co_op_translator.utils.common.project_index import ProjectIndex
+
+OLD_MTIME_NS = 10**18  # Outside the window of recently modified files
+
+
+def make_tree(root, files):
+    small = os.urandom(8 * 1024)
+    large = os.urandom(4 * 1024 * 1024)
+    for i in range(files):
+        directory = root / f"part{i % 50}" / f"chapter{i % 1000}"
+        directory.mkdir(parents=True, exist_ok=True)
+        if i % 500 == 0:
+            path = directory / f"asset{i}.png"
+            path.write_bytes(large + i.to_bytes(4, "little"))
+        elif i % 5 == 0:
+            path = directory / f"figure{i}.png"
+            path.write_bytes(small * 8 + i.to_bytes(4, "little"))
+        else:
+            path = directory / f"page{i}.md"
+            path.write_bytes(small[: 2048 + i % 4096])
+        os.utime(path, ns=(OLD_MTIME_NS, OLD_MTIME_NS))
+
+
+def serial_md5(files):
+    for path in files:
+        hasher = hashlib.md5()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(4096), b""):
+                hasher.update(chunk)
+        hasher.hexdigest()
+
+
+def timed(name, function):
+    start = time.perf_counter()
+    function()
+    print(f"{name:32s} {time.perf_counter() - start:.2f}s")
+
+
+def main(files, languages):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_tree(root, files)
+        index = ProjectIndex(root)
+        paths = index.get_files()
+        total = sum(stat.st_size for stat in index.stats.values())
+        print(f"{len(paths)} files, {total / 1e6:.0f} MB")
+
+        timed("serial MD5, 4 KiB reads", lambda: serial_md5(paths))
+        for algorithm in ("md5", FAST_HASH_ALGORITHM):
+            cache = FileHashCache()
+            timed(
+                f"bulk {algorithm}, cold",
+                lambda: cache.get_hashes(paths, algorithm, stats=index.stats),
+            )
+            timed(
+                f"bulk {algorithm}, warm",
+                lambda: cache.get_hashes(paths, algorithm, stats=index.stats),
+            )
+
+        images = index.get_files(".png")
+        timed(
+            f"get_unique_id x {languages} languages",
+            lambda: [
+                get_unique_id(path, root) for path in images for _ in range(languages)
+            ],
+        )
+        timed("get_unique_ids", lambda: get_unique_ids(images, root))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--languages", type=int, default=10)
+    args = parser.parse_args()
+    main(args.files, args.languages)
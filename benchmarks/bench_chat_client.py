@@ -0,0 +1,134 @@
+"""
+Microbenchmark of the per-request client overhead of LLM calls.
+
+Compares, against a local keep-alive HTTP server so that network latency does
+not hide the difference:
+
+- "per-call client": a new HTTP client (and connection) for every request, as
+  happens when each translator builds its own client stack
+- "shared pooled client": the process-wide pooled client from
+  ``co_op_translator.core.llm.chat_client``
+
+If semantic_kernel is installed, it also times building and registering a
+prompt function per call, which the direct chat path no longer does.
+
+Usage:
+    python benchmarks/bench_chat_client.py [--requests 500] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from co_op_translator.core.llm.chat_client import (
+    close_shared_http_client,
+    create_http_client,
+    get_shared_http_client,
+)
+
+RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: application/json\r\n"
+    b"Content-Length: 2\r\n"
+    b"Connection: keep-alive\r\n\r\n{}"
+)
+
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            request = await reader.readuntil(b"\r\n\r\n")
+            if not request:
+                break
+            writer.write(RESPONSE)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run_requests(url, requests, concurrency, get_client, per_call):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            client = get_client()
+            try:
+                response = await client.get(url)
+                response.raise_for_status()
+            finally:
+                if per_call:
+                    await client.aclose()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+def time_prompt_registration(iterations):
+    try:
+        from semantic_kernel import Kernel
+        from semantic_kernel.prompt_template.prompt_template_config import (
+            PromptTemplateConfig,
+        )
+    except ImportError:
+        return None
+
+    kernel = Kernel()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        config = PromptTemplateConfig(
+            template="Translate the following text.\n\n# Title\nSome text.",
+            name="translate",
+            template_format="semantic-kernel",
+        )
+        kernel.add_function(
+            function_name="translate_function",
+            plugin_name="translate_plugin",
+            prompt_template_config=config,
+        )
+    return time.perf_counter() - start
+
+
+async def main(requests, concurrency):
+    server = await asyncio.start_server(handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    url = f"http://127.0.0.1:{port}/chat/completions"
+
+    async with server:
+        per_call = await run_requests(
+            url, requests, concurrency, create_http_client, per_call=True
+        )
+        shared = await run_requests(
+            url, requests, concurrency, get_shared_http_client, per_call=False
+        )
+        await close_shared_http_client()
+
+    print(f"{requests} requests, concurrency {concurrency} (httpx {httpx.__version__})")
+    print(
+        f"  per-call client:      {per_call:.3f}s total, "
+        f"{per_call / requests * 1000:.3f} ms/request"
+    )
+    print(
+        f"  shared pooled client: {shared:.3f}s total, "
+        f"{shared / requests * 1000:.3f} ms/request"
+    )
+    print(f"  speedup:              {per_call / shared:.1f}x")
+
+    registration = time_prompt_registration(requests)
+    if registration is not None:
+        print(
+            f"  prompt function registration (removed): "
+            f"{registration / requests * 1000:.3f} ms/request"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
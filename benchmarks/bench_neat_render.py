@@ -0,0 +1,167 @@
+"""
+Benchmark of neat-mode image rendering on large, text-dense images.
+
+Compares, on a synthetic diagram with many text lines:
+
+- "full-frame": the previous compositing, where every line allocates a
+  full-size fill mask and a full-size warped text layer and alpha-composites
+  both over the whole image
+- "region-local": ``ImageRenderer.plot_annotated_image``, which fills and warps
+  each line only within its bounding box region of a single working buffer
+
+Also reports the largest per-channel difference between the two outputs.
+
+Usage:
+    python benchmarks/bench_neat_render.py [--width 3840] [--height 2160] [--lines 200]
+"""
+
+import argparse
+import math
+import random
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision.image_renderer import ImageRenderer
+from co_op_translator.utils.vision.image_utils import (
+    adjust_bg_color,
+    create_filled_polygon_mask,
+    draw_text_on_image,
+    get_dominant_color,
+    get_text_color,
+    group_bounding_boxes,
+    pad_text_image_to_target_aspect,
+    warp_image_to_bounding_box,
+)
+
+
+def make_diagram(path, width, height, lines, seed=0):
+    """Draw a diagram with `lines` text boxes and return their OCR-like records."""
+    rng = random.Random(seed)
+    image = Image.new("RGBA", (width, height), (245, 245, 240, 255))
+    draw = ImageDraw.Draw(image)
+    font = ImageFont.truetype(FontConfig().get_font_path("en"), 28)
+    columns = max(1, int(math.sqrt(lines * width / height)))
+    rows = math.ceil(lines / columns)
+    cell_w, cell_h = width // columns, height // rows
+
+    records = []
+    for i in range(lines):
+        x0 = (i % columns) * cell_w + rng.randint(5, 20)
+        y0 = (i // columns) * cell_h + rng.randint(5, 10)
+        box_w = min(cell_w - 30, rng.randint(150, 400))
+        box_h = min(cell_h - 15, 40)
+        fill = tuple(rng.randint(0, 255) for _ in range(3))
+        draw.rectangle([x0, y0, x0 + box_w, y0 + box_h], fill=fill)
+        text = f"Component {i}"
+        draw.text((x0 + 5, y0 + 5), text, font=font, fill=get_text_color(fill))
+        records.append(
+            {
+                "text": text,
+                "bounding_box": [
+                    x0,
+                    y0,
+                    x0 + box_w,
+                    y0,
+                    x0 + box_w,
+                    y0 + box_h,
+                    x0,
+                    y0 + box_h,
+                ],
+                "confidence": 0.99,
+            }
+        )
+    image.save(path)
+    return records
+
+
+def render_full_frame(image_path, records, translations, output_path):
+    """The previous neat-mode loop: full-size mask and warp per line."""
+    image = Image.open(image_path).convert("RGBA")
+    font = ImageFont.truetype(FontConfig().get_font_path("fr"), 40)
+    grouped_boxes = group_bounding_boxes(records)
+    texts = iter(translations)
+    for group in grouped_boxes:
+        alignment = "center" if len(group) == 1 else "left"
+        for line in group:
+            bounding_box = line["bounding_box"]
+            bg_color, _ = get_dominant_color(image, bounding_box)
+            final_bg_color = adjust_bg_color(bg_color)
+            mask_image = create_filled_polygon_mask(
+                bounding_box, image.size, final_bg_color
+            )
+            image = Image.alpha_composite(image, mask_image)
+
+            text_image = np.array(
+                draw_text_on_image(next(texts), font, get_text_color(final_bg_color))
+            )
+            pts = np.array(bounding_box, dtype=np.float32).reshape(4, 2)
+            max_width = max(
+                np.linalg.norm(pts[0] - pts[1]), np.linalg.norm(pts[2] - pts[3])
+            )
+            max_height = max(
+                np.linalg.norm(pts[0] - pts[3]), np.linalg.norm(pts[1] - pts[2])
+            )
+            target_aspect = max_width / max_height if max_height != 0 else 1
+            padded = pad_text_image_to_target_aspect(
+                text_image, target_aspect, alignment
+            )
+            warped = warp_image_to_bounding_box(
+                padded, bounding_box, image.width, image.height
+            )
+            image = Image.alpha_composite(image, Image.fromarray(warped))
+    image.save(output_path)
+    return output_path
+
+
+def main(width, height, lines, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        image_path = tmp / "diagram.png"
+        records = make_diagram(image_path, width, height, lines)
+        # Records are grouped, so pass translations in grouped order
+        translations = [
+            f"Composant {line['text'].split()[-1]}"
+            for group in group_bounding_boxes(records)
+            for line in group
+        ]
+        renderer = ImageRenderer(tmp)
+
+        full_frame = region_local = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            legacy_path = render_full_frame(
+                image_path, records, translations, tmp / "legacy.png"
+            )
+            full_frame = min(full_frame, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            new_path = renderer.plot_annotated_image(
+                image_path, records, translations, "fr", tmp / "out"
+            )
+            region_local = min(region_local, time.perf_counter() - start)
+
+        difference = np.abs(
+            np.asarray(Image.open(legacy_path), dtype=np.int16)
+            - np.asarray(Image.open(new_path), dtype=np.int16)
+        ).max()
+
+    print(f"{width}x{height} image, {lines} text lines (best of {repeat})")
+    print(f"  full-frame:   {full_frame:.3f}s")
+    print(f"  region-local: {region_local:.3f}s")
+    print(f"  speedup:      {full_frame / region_local:.1f}x")
+    print(f"  max pixel difference: {difference}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.width, args.height, args.lines, args.repeat)
@@ -0,0 +1,53 @@
+"""
+Benchmark of OCR upload sizes.
+
+Prepares the OCR upload of synthetic diagrams, drawn at 1920x1080 and saved as
+they would be by high-density screens (scaled up 2x and 3x), and reports the
+bytes sent, the time spent preparing them, and the transfer time they stand
+for at a given uplink speed.
+
+Usage:
+    python benchmarks/bench_ocr_upload.py [--lines 40] [--mbps 20]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image
+
+from bench_neat_render import make_diagram
+from co_op_translator.core.vision.ocr_upload import prepare_ocr_upload
+
+
+def main(lines, mbps):
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = Path(tmp) / "diagram.png"
+        make_diagram(base_path, 1920, 1080, lines)
+        base = Image.open(base_path)
+        for factor in (1, 2, 3):
+            path = Path(tmp) / f"diagram@{factor}x.png"
+            base.resize((1920 * factor, 1080 * factor), Image.LANCZOS).save(path)
+            original = path.stat().st_size
+
+            start = time.perf_counter()
+            upload = prepare_ocr_upload(path)
+            elapsed = time.perf_counter() - start
+
+            sent = len(upload.data)
+            saved = (original - sent) * 8 / (mbps * 1e6)
+            print(
+                f"{factor}x ({1920 * factor}x{1080 * factor}): "
+                f"{original / 1e6:.2f} MB -> {sent / 1e6:.2f} MB "
+                f"(scale {upload.scale_x:.2f}), prepared in {elapsed:.2f}s, "
+                f"{saved:.2f}s less upload at {mbps:g} Mbit/s"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lines", type=int, default=40)
+    parser.add_argument("--mbps", type=float, default=20)
+    args = parser.parse_args()
+    main(args.lines, args.mbps)
@@ -0,0 +1,81 @@
+"""
+Benchmark of project discovery scans.
+
+Builds a synthetic project with sources spread over nested directories and a
+large `node_modules` tree, then times the discovery a translation run makes:
+once as separate `rglob` scans per stage and file type, filtered afterwards
+(as before the project index), and once as a single pruned `ProjectIndex`.
+
+Usage:
+    python benchmarks/bench_project_scan.py [--dirs 2000] [--vendor-files 50000]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from co_op_translator.config.constants import EXCLUDED_DIRS
+from co_op_translator.utils.common.project_index import ProjectIndex
+
+
+def make_project(root, dirs, vendor_files):
+    for i in range(dirs):
+        directory = root / f"part{i % 20}" / f"chapter{i}"
+        directory.mkdir(parents=True)
+        (directory / "README.md").write_text("# Chapter")
+        (directory / "figure.png").write_bytes(b"png")
+        if i % 10 == 0:
+            (directory / "lab.ipynb").write_text("{}")
+    for i in range(vendor_files):
+        directory = root / "node_modules" / f"pkg{i // 50}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file{i}.md").write_text("vendor")
+
+
+def rglob_scans(root):
+    """Discovery as separate scans: files for markdown, notebooks, images and
+    the evaluator, then directories for syncing."""
+
+    def filter_files(extension=None):
+        return [
+            path
+            for path in root.rglob("*")
+            if path.is_file()
+            and (extension is None or path.suffix.lower() == extension)
+            and not any(excluded in path.parts for excluded in EXCLUDED_DIRS)
+        ]
+
+    filter_files()
+    filter_files(".ipynb")
+    filter_files()
+    [p for p in root.rglob("*.md") if not any(e in str(p) for e in EXCLUDED_DIRS)]
+    for path in root.rglob("*"):
+        if path.is_dir() and not any(e in str(path) for e in EXCLUDED_DIRS):
+            any(path.glob("*.md"))
+
+
+def index_scan(root):
+    index = ProjectIndex(root, EXCLUDED_DIRS)
+    index.get_files(".md")
+    index.get_files(".ipynb")
+    index.get_files(".png", ".jpg")
+    index.get_dirs_containing(".md")
+
+
+def main(dirs, vendor_files):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        make_project(root, dirs, vendor_files)
+        for name, scan in [("rglob scans", rglob_scans), ("project index", index_scan)]:
+            start = time.perf_counter()
+            scan(root)
+            print(f"{name:14s} {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dirs", type=int, default=2000)
+    parser.add_argument("--vendor-files", type=int, default=50000)
+    args = parser.parse_args()
+    main(args.dirs, args.vendor_files)
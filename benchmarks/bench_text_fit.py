@@ -0,0 +1,101 @@
+"""
+Benchmark of font sizing for fast-mode rendering on text-heavy images.
+
+Compares, for every line of a synthetic diagram:
+
+- "per-line": the previous fitting, which loads the font at a base size,
+  measures the text, rescales, loads the font again at the new size and
+  measures once more
+- "fitter": ``TextFitter.fit``, which reuses cached fonts and glyph metrics
+
+and times a full fast-mode render with ``ImageRenderer.plot_annotated_image``.
+
+Usage:
+    python benchmarks/bench_text_fit.py [--width 3840] [--height 2160] [--lines 400]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+from bench_neat_render import make_diagram
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision.image_renderer import ImageRenderer
+from co_op_translator.core.vision.text_fitter import TextFitter, load_font
+from co_op_translator.utils.common.shared_instances import close_shared_instances
+from co_op_translator.utils.vision.image_utils import group_bounding_boxes
+
+
+def fit_per_line(font_path, text, box_width, box_height):
+    """The previous fast-mode sizing: two font loads and two measurements."""
+    font = ImageFont.truetype(font_path, 40)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    bbox = draw.textbbox((0, 0), text, font=font, anchor="la")
+    text_width, text_height = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    scale = min(box_width * 0.90 / text_width, box_height * 0.95 / text_height)
+    font = ImageFont.truetype(font_path, max(1, int(40 * scale)))
+    bbox = draw.textbbox((0, 0), text, font=font, anchor="la")
+    return font
+
+
+def main(width, height, lines, repeat):
+    font_path = FontConfig().get_font_path("fr")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        image_path = tmp / "diagram.png"
+        records = make_diagram(image_path, width, height, lines)
+        translations = [
+            f"Composant de traitement numéro {line['text'].split()[-1]}"
+            for group in group_bounding_boxes(records)
+            for line in group
+        ]
+        boxes = [
+            (
+                record["bounding_box"][2] - record["bounding_box"][0],
+                record["bounding_box"][5] - record["bounding_box"][1],
+            )
+            for record in records
+        ]
+
+        per_line = fitter_time = render_time = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for text, (box_width, box_height) in zip(translations, boxes):
+                fit_per_line(font_path, text, box_width, box_height)
+            per_line = min(per_line, time.perf_counter() - start)
+
+            # Start each round cold so font loading is included
+            load_font.cache_clear()
+            close_shared_instances()
+            start = time.perf_counter()
+            fitter = TextFitter.for_font(font_path)
+            for text, (box_width, box_height) in zip(translations, boxes):
+                fitter.fit(text, box_width * 0.90, box_height * 0.95)
+            fitter_time = min(fitter_time, time.perf_counter() - start)
+
+            renderer = ImageRenderer(tmp)
+            renderer.get_render_plan(image_path, records)
+            start = time.perf_counter()
+            renderer.plot_annotated_image(
+                image_path, records, translations, "fr", tmp / "out", fast_mode=True
+            )
+            render_time = min(render_time, time.perf_counter() - start)
+
+    print(f"{width}x{height} image, {lines} text lines (best of {repeat})")
+    print(f"  per-line sizing:  {per_line:.3f}s")
+    print(f"  fitter sizing:    {fitter_time:.3f}s")
+    print(f"  speedup:          {per_line / fitter_time:.1f}x")
+    print(f"  fast-mode render: {render_time:.3f}s (render plan cached)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=3840)
+    parser.add_argument("--height", type=int, default=2160)
+    parser.add_argument("--lines", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.width, args.height, args.lines, args.repeat)
@@ -0,0 +1,83 @@
+"""
+Benchmark of peak memory when rendering a very large image.
+
+Renders a synthetic poster (12000x8000 by default) once as a whole image and
+once in tiles, each in a fresh process, and reports the wall time and the peak
+resident memory of each process. The poster is generated in its own process
+beforehand so that its allocations are not counted.
+
+Usage:
+    python benchmarks/bench_tiled_render.py [--width 12000] [--height 8000] [--lines 600]
+"""
+
+import argparse
+import json
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+from bench_neat_render import make_diagram
+
+
+def generate(image_path, width, height, lines, queue):
+    records = make_diagram(image_path, width, height, lines)
+    Path(image_path).with_suffix(".json").write_text(json.dumps(records))
+    queue.put(None)
+
+
+def render(image_path, tiled, fast_mode, queue):
+    from co_op_translator.core.vision.image_renderer import ImageRenderer
+
+    records = json.loads(Path(image_path).with_suffix(".json").read_text())
+    translations = [f"Composant {line['text'].split()[-1]}" for line in records]
+    threshold = None if tiled else float("inf")
+    renderer = ImageRenderer(
+        Path(image_path).parent, tiled_threshold_megapixels=threshold
+    )
+    start = time.perf_counter()
+    renderer.plot_annotated_image(
+        image_path,
+        records,
+        translations,
+        "fr",
+        Path(image_path).parent / ("tiled" if tiled else "whole"),
+        fast_mode=fast_mode,
+    )
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in kilobytes on Linux
+    queue.put((elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024))
+
+
+def run_in_process(target, *args):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=target, args=(*args, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main(width, height, lines, fast_mode):
+    with tempfile.TemporaryDirectory() as tmp:
+        image_path = Path(tmp) / "poster.png"
+        run_in_process(generate, image_path, width, height, lines)
+        whole_time, whole_rss = run_in_process(render, image_path, False, fast_mode)
+        tiled_time, tiled_rss = run_in_process(render, image_path, True, fast_mode)
+
+    mode = "fast" if fast_mode else "neat"
+    print(f"{width}x{height} poster, {lines} text lines ({mode} mode)")
+    print(f"  whole image: {whole_time:.2f}s, peak RSS {whole_rss:.0f} MB")
+    print(f"  tiled:       {tiled_time:.2f}s, peak RSS {tiled_rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=12000)
+    parser.add_argument("--height", type=int, default=8000)
+    parser.add_argument("--lines", type=int, default=600)
+    parser.add_argument("--fast", action="store_true")
+    args = parser.parse_args()
+    main(args.width, args.height, args.lines, args.fast)
@@ -9,6 +9,7 @@ from pathlib import Path
 
 from co_op_translator.core.project.project_evaluator import ProjectEvaluator
 from co_op_translator.config.base_config import Config
+from co_op_translator.utils.common.shared_instances import close_shared_instances
 
 logger = logging.getLogger(__name__)
 
@@ -172,13 +173,11 @@ def evaluate_command(language_code, root_dir, min_confidence, debug, fast, deep)
 
                 # Read file to get issues for reference
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
                     from co_op_translator.utils.common.metadata_utils import (
-                        extract_metadata_from_content,
+                        read_metadata,
                     )
 
-                    metadata = extract_metadata_from_content(content)
+                    metadata = read_metadata(file_path)
                     issues = []
                     if metadata and "evaluation" in metadata:
                         # Only check issues field
@@ -227,3 +226,5 @@ def evaluate_command(language_code, root_dir, min_confidence, debug, fast, deep)
         if debug:
             logger.exception("An error occurred during evaluation")
         raise click.ClickException(str(e))
+    finally:
+        close_shared_instances()
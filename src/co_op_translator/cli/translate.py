@@ -13,6 +13,13 @@ from pathlib import Path
 from co_op_translator.core.project.project_translator import ProjectTranslator
 from co_op_translator.config.base_config import Config
 from co_op_translator.config.vision_config.config import VisionConfig
+from co_op_translator.config.constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
+    DEFAULT_TEXT_SCORE_THRESHOLD,
+    CACHE_DIR_NAME,
+)
+from co_op_translator.utils.common.shared_instances import close_shared_instances
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +72,59 @@ logger = logging.getLogger(__name__)
     is_flag=True,
     help="Automatically confirm all prompts (useful for CI/CD pipelines).",
 )
+@click.option(
+    "--max-concurrency",
+    default=DEFAULT_MAX_CONCURRENCY,
+    type=click.IntRange(min=1),
+    show_default=True,
+    help="Upper bound on files and API requests in flight. The live level adapts to provider throttling and latency.",
+)
+@click.option(
+    "--image-megapixel-budget",
+    default=DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
+    type=click.FloatRange(min=0, min_open=True),
+    show_default=True,
+    help="Decoded image area, in megapixels, allowed across images rendered at once. Larger images run alone.",
+)
+@click.option(
+    "--text-score-threshold",
+    default=DEFAULT_TEXT_SCORE_THRESHOLD,
+    type=click.IntRange(min=0),
+    show_default=True,
+    help="Lined-up character shapes an image needs, found locally, to be sent to OCR. Images below it are copied unchanged; 0 sends every image to OCR.",
+)
+@click.option(
+    "--rpm",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Maximum LLM requests per minute (default: unlimited).",
+)
+@click.option(
+    "--tpm",
+    default=None,
+    type=click.IntRange(min=1),
+    help="Maximum LLM tokens per minute, prompt and completion combined (default: unlimited).",
+)
+@click.option(
+    "--refresh-disclaimers",
+    is_flag=True,
+    help="Regenerate the stored disclaimer translations for the given languages and exit.",
+)
+@click.option(
+    "--rebuild-state",
+    is_flag=True,
+    help="Regenerate the translation state database from the metadata of translated files and exit.",
+)
+@click.option(
+    "--multi-language",
+    is_flag=True,
+    help="Translate markdown into several languages per request to save input tokens.",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Retranslate only the changed sections of outdated markdown translations.",
+)
 def translate_command(
     language_codes,
     root_dir,
@@ -77,6 +137,15 @@ def translate_command(
     fast,
     yes,
     min_confidence,
+    max_concurrency,
+    image_megapixel_budget,
+    text_score_threshold,
+    rpm,
+    tpm,
+    multi_language,
+    refresh_disclaimers,
+    rebuild_state,
+    incremental,
 ):
     """
     CLI for translating project files.
@@ -114,6 +183,21 @@ def translate_command(
     10. Use fast mode for image translation:
        translate -l "ko" -img -f
 
+    11. Keep up to 8 files in flight within your deployment's quota:
+       translate -l "ko" --max-concurrency 8 --rpm 300 --tpm 200000
+
+    12. Translate markdown into many languages with shared requests:
+       translate -l "all" -md --multi-language
+
+    13. Regenerate the disclaimer store for every supported language:
+       translate -l "all" --refresh-disclaimers
+
+    14. Retranslate only the edited sections of changed markdown files:
+       translate -l "ko" -md --incremental
+
+    15. Rebuild the translation state after editing translations by hand:
+       translate -l "all" --rebuild-state
+
     Debug mode example:
     - translate -l "ko" -d: Enable debug logging.
     """
@@ -181,26 +265,28 @@ def translate_command(
 
         # Show warning if 'all' is selected
         if language_codes == "all":
-            click.echo(
-                "Warning: Translating all languages at once can take a significant amount of time, especially when dealing with large markdown-based open-source projects that have many documents."
-            )
-            click.echo(
-                "For better efficiency, it's recommended that contributors handle individual languages and upload their translations separately."
-            )
-            # Option to proceed or not
-            if not yes:
-                confirmation_all = click.prompt(
-                    "Do you still want to proceed with translating all languages? Type 'yes' to continue",
-                    type=str,
+            # Refreshing disclaimers is cheap, so it needs no confirmation
+            if not refresh_disclaimers and not rebuild_state:
+                click.echo(
+                    "Warning: Translating all languages at once can take a significant amount of time, especially when dealing with large markdown-based open-source projects that have many documents."
+                )
+                click.echo(
+                    "For better efficiency, it's recommended that contributors handle individual languages and upload their translations separately."
                 )
+                # Option to proceed or not
+                if not yes:
+                    confirmation_all = click.prompt(
+                        "Do you still want to proceed with translating all languages? Type 'yes' to continue",
+                        type=str,
+                    )
 
-                if confirmation_all.lower() != "yes":
-                    click.echo("Translation for 'all' languages cancelled.")
-                    return
+                    if confirmation_all.lower() != "yes":
+                        click.echo("Translation for 'all' languages cancelled.")
+                        return
+                    else:
+                        click.echo("Proceeding with translation for all languages...")
                 else:
-                    click.echo("Proceeding with translation for all languages...")
-            else:
-                click.echo("Auto-confirming translation for all languages...")
+                    click.echo("Auto-confirming translation for all languages...")
 
             try:
                 with importlib.resources.path(
@@ -247,9 +333,36 @@ def translate_command(
 
         # Initialize ProjectTranslator with determined settings
         translator = ProjectTranslator(
-            language_codes, root_dir, markdown_only=markdown and not images
+            language_codes,
+            root_dir,
+            markdown_only=markdown and not images,
+            max_concurrency=max_concurrency,
+            image_megapixel_budget=image_megapixel_budget,
+            text_score_threshold=text_score_threshold,
+            requests_per_minute=rpm,
+            tokens_per_minute=tpm,
+            multi_language=multi_language,
+            incremental=incremental,
         )
 
+        if refresh_disclaimers:
+            count = asyncio.run(
+                translator.markdown_translator.prepare_disclaimers(
+                    translator.language_codes, refresh=True
+                )
+            )
+            click.echo(
+                f"Regenerated {count} disclaimer translation(s) in {root_path / CACHE_DIR_NAME}"
+            )
+            return
+
+        if rebuild_state:
+            count = translator.rebuild_translation_state()
+            click.echo(
+                f"Rebuilt the translation state from {count} translated file(s) in {root_path / CACHE_DIR_NAME}"
+            )
+            return
+
         if fix:
             click.echo(f"Fixing translations with confidence below {min_confidence}...")
 
@@ -327,3 +440,5 @@ def translate_command(
         if debug:
             logger.exception("An error occurred during translation")
         raise click.ClickException(str(e))
+    finally:
+        close_shared_instances()
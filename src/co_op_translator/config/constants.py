@@ -23,8 +23,24 @@ EXCLUDED_DIRS = {
     ".idea",
     ".devcontainer",
     ".pytest_cache",
+    ".co_op_translator",
 }
 
+# Per-project directory for caches and stores kept between runs
+CACHE_DIR_NAME = ".co_op_translator"
+
 # Maximum allowed difference in line breaks between original and translated text
 # A margin is needed to account for added disclaimer and metadata
 LINE_BREAK_MARGIN = 15
+
+# Default maximum number of files and API requests processed concurrently
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Number of API requests allowed in flight before the adaptive controller ramps up
+DEFAULT_INITIAL_CONCURRENCY = 2
+
+# Decoded image area, in megapixels, allowed across image jobs rendering at once
+DEFAULT_IMAGE_MEGAPIXEL_BUDGET = 200
+
+# Lined-up glyph-like shapes an image needs locally before it is sent to OCR
+DEFAULT_TEXT_SCORE_THRESHOLD = 2  # A two-letter label such as "OK"
@@ -0,0 +1,184 @@
+"""
+Pooled async chat-completion client shared by the LLM translators and evaluators.
+
+One ``httpx.AsyncClient`` is kept per event loop for the whole process, with
+keep-alive connection pooling and HTTP/2 (from the ``httpx[http2]`` extra),
+and chat requests are sent directly to the provider.
+"""
+
+import asyncio
+import importlib.util
+import logging
+import weakref
+
+import httpx
+from openai import AsyncAzureOpenAI, AsyncOpenAI
+
+from co_op_translator.config.llm_config.azure_openai import AzureOpenAIConfig
+from co_op_translator.config.llm_config.openai import OpenAIConfig
+from co_op_translator.config.llm_config.provider import LLMProvider
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+HTTP_MAX_CONNECTIONS = 64  # Upper bound on open connections per process
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32  # Idle connections kept for reuse
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 60  # Idle time before a pooled connection is closed
+HTTP_CONNECT_TIMEOUT_SECONDS = 10
+HTTP_READ_TIMEOUT_SECONDS = 300  # Matches the translation timeout of a chunk
+
+# h2 comes with httpx[http2]; without it requests fall back to HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pools are bound to the event loop they were created on
+_http_clients = weakref.WeakKeyDictionary()
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client configured for pooled, long-lived connections.
+
+    Returns:
+        httpx.AsyncClient: A new client using HTTP/2 when available.
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=httpx.Timeout(
+            HTTP_READ_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS
+        ),
+    )
+
+
+def get_shared_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client for the running event loop.
+
+    Returns:
+        httpx.AsyncClient: The shared client, created on first use.
+    """
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = create_http_client()
+        _http_clients[loop] = client
+        logger.debug(
+            f"Created shared HTTP client ({'HTTP/2' if HTTP2_AVAILABLE else 'HTTP/1.1'})"
+        )
+    return client
+
+
+async def close_shared_http_client():
+    """Close the shared HTTP client of the running event loop, if any."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+class ChatClient:
+    """Send chat-completion requests over the shared HTTP connection pool.
+
+    Instances are shared per (provider, model, retries) so that the markdown,
+    notebook and evaluator code paths reuse the same SDK clients.
+    """
+
+    def __init__(self, provider: LLMProvider, model: str, max_retries: int = 0):
+        """Initialize the chat client.
+
+        Args:
+            provider: LLM provider to send requests to
+            model: Model id (OpenAI) or deployment name (Azure OpenAI)
+            max_retries: Retries done by the SDK itself; keep at 0 when the caller
+                handles throttling so that it sees every 429/503 response
+        """
+        self.provider = provider
+        self.model = model
+        self.max_retries = max_retries
+        self._clients = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_provider(
+        cls, provider: LLMProvider, model: str, max_retries: int = 0
+    ) -> "ChatClient":
+        """Return the shared chat client for a provider and model.
+
+        Args:
+            provider: LLM provider to send requests to
+            model: Model id (OpenAI) or deployment name (Azure OpenAI)
+            max_retries: Retries done by the SDK itself
+
+        Returns:
+            ChatClient instance
+        """
+        return get_shared_instance(
+            cls,
+            (provider, model, max_retries),
+            lambda: cls(provider, model, max_retries),
+        )
+
+    def _create_client(self, http_client: httpx.AsyncClient):
+        """Create the provider SDK client on top of the shared HTTP client."""
+        if self.provider == LLMProvider.AZURE_OPENAI:
+            return AsyncAzureOpenAI(
+                azure_endpoint=AzureOpenAIConfig.get_endpoint(),
+                api_key=AzureOpenAIConfig.get_api_key(),
+                api_version=AzureOpenAIConfig.get_api_version(),
+                max_retries=self.max_retries,
+                http_client=http_client,
+            )
+        if self.provider == LLMProvider.OPENAI:
+            return AsyncOpenAI(
+                api_key=OpenAIConfig.get_api_key(),
+                organization=OpenAIConfig.get_org_id(),
+                base_url=OpenAIConfig.get_base_url(),
+                max_retries=self.max_retries,
+                http_client=http_client,
+            )
+        raise ValueError(f"Unsupported LLM provider '{self.provider}'")
+
+    def get_client(self):
+        """Return the SDK client bound to the running event loop."""
+        http_client = get_shared_http_client()
+        cached = self._clients.get(asyncio.get_running_loop())
+        if cached is None or cached[0] is not http_client:
+            cached = (http_client, self._create_client(http_client))
+            self._clients[asyncio.get_running_loop()] = cached
+        return cached[1]
+
+    async def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        system_prompt: str = None,
+    ) -> str:
+        """Send a chat request for a single user message and return the completion text.
+
+        Args:
+            prompt: User message content
+            max_tokens: Maximum number of completion tokens
+            temperature: Sampling temperature
+            top_p: Nucleus sampling probability mass
+            system_prompt: Optional system message sent before the prompt
+
+        Returns:
+            The content of the first choice, or an empty string if there is none
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        response = await self.get_client().chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+        )
+        if not response.choices:
+            return ""
+        return response.choices[0].message.content or ""
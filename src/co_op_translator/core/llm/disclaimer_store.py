@@ -0,0 +1,108 @@
+"""
+Persistent store for translated disclaimer notices.
+
+Every translated document ends with the same disclaimer paragraph, so each
+(language, disclaimer text, model) combination only needs to be translated once.
+Translations are kept in a JSON file inside the project's cache directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from co_op_translator.config.constants import CACHE_DIR_NAME
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+DISCLAIMER_TEXT = """**Disclaimer**:
+This document has been translated using AI translation service [Co-op Translator](https://github.com/Azure/co-op-translator). While we strive for accuracy, please be aware that automated translations may contain errors or inaccuracies. The original document in its native language should be considered the authoritative source. For critical information, professional human translation is recommended. We are not liable for any misunderstandings or misinterpretations arising from the use of this translation."""
+
+DISCLAIMER_STORE_FILENAME = "disclaimers.json"
+
+
+def get_disclaimer_text_hash(text: str = DISCLAIMER_TEXT) -> str:
+    """Return a short, stable hash identifying a disclaimer text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class DisclaimerStore:
+    """JSON-backed mapping of (language, disclaimer hash, model) to translated disclaimers.
+
+    Stores are shared per file path so that all translators of a project see
+    the same entries. A store without a path only keeps entries in memory.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the store and load existing entries.
+
+        Args:
+            path: Location of the JSON file, or None for an in-memory store
+        """
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self.load()
+
+    @classmethod
+    def for_project(cls, root_dir: Path | None) -> "DisclaimerStore":
+        """Return the shared store for a project root.
+
+        Args:
+            root_dir: Root directory of the project, or None for an in-memory store
+
+        Returns:
+            DisclaimerStore instance
+        """
+        if root_dir is None:
+            return cls()
+        path = (Path(root_dir) / CACHE_DIR_NAME / DISCLAIMER_STORE_FILENAME).resolve()
+        return get_shared_instance(cls, path, lambda: cls(path))
+
+    @staticmethod
+    def make_key(language_code: str, model: str, text: str = DISCLAIMER_TEXT) -> str:
+        """Build the lookup key for a disclaimer translation."""
+        return f"{language_code}:{get_disclaimer_text_hash(text)}:{model}"
+
+    def load(self):
+        """Load entries from disk, ignoring a missing or corrupted file."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self.entries.update(
+                    {k: v for k, v in data.items() if isinstance(v, str)}
+                )
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable disclaimer store {self.path}: {e}")
+
+    def save(self):
+        """Write entries to disk atomically."""
+        if not self.path:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save disclaimer store {self.path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def get(self, language_code: str, model: str) -> str | None:
+        """Return the stored disclaimer for a language and model, if any."""
+        return self.entries.get(self.make_key(language_code, model))
+
+    def set(self, language_code: str, model: str, disclaimer: str):
+        """Store the disclaimer for a language and model (call `save` to persist)."""
+        self.entries[self.make_key(language_code, model)] = disclaimer
+
+    def missing(self, language_codes: list[str], model: str) -> list[str]:
+        """Return the language codes without a stored disclaimer for the model."""
+        return [code for code in language_codes if self.get(code, model) is None]
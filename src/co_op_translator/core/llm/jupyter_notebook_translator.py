@@ -11,6 +11,14 @@ from pathlib import Path
 from typing import Dict, Any, List
 
 from .markdown_translator import MarkdownTranslator
+from co_op_translator.utils.common.metadata_utils import (
+    NOTEBOOK_METADATA_KEY,
+    create_metadata,
+)
+from co_op_translator.utils.common.rate_limiter import RateLimiter
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,14 +30,26 @@ class JupyterNotebookTranslator:
     and the overall notebook structure.
     """
 
-    def __init__(self, root_dir: Path = None):
+    def __init__(
+        self,
+        root_dir: Path = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_controller: AdaptiveConcurrencyController = None,
+        markdown_translator: MarkdownTranslator = None,
+    ):
         """Initialize the notebook translator.
 
         Args:
             root_dir: Root directory of the project for path calculations
+            rate_limiter: Optional limiter enforcing request and token budgets
+            concurrency_controller: Optional adaptive limit on requests in flight
+            markdown_translator: Markdown translator to reuse for the markdown cells;
+                a new one is created if not given
         """
         self.root_dir = root_dir
-        self.markdown_translator = MarkdownTranslator.create(root_dir)
+        self.markdown_translator = markdown_translator or MarkdownTranslator.create(
+            root_dir, rate_limiter, concurrency_controller
+        )
 
     async def translate_notebook(
         self,
@@ -41,7 +61,7 @@ class JupyterNotebookTranslator:
 
         Extracts markdown cells from the notebook, translates them using
         the existing markdown translator, and reconstructs the notebook
-        with translated content.
+        with translated content and translation metadata.
 
         Args:
             notebook_path: Path to the .ipynb file
@@ -121,19 +141,33 @@ class JupyterNotebookTranslator:
             f"in {notebook_path.name}"
         )
 
+        # Record the source like the metadata comment of translated markdown
+        notebook.setdefault("metadata", {})[NOTEBOOK_METADATA_KEY] = create_metadata(
+            notebook_path, language_code, self.root_dir
+        )
+
         # Return the modified notebook as JSON string
         return json.dumps(notebook, ensure_ascii=False, indent=1)
 
     @classmethod
-    def create(cls, root_dir: Path = None) -> "JupyterNotebookTranslator":
+    def create(
+        cls,
+        root_dir: Path = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_controller: AdaptiveConcurrencyController = None,
+        markdown_translator: MarkdownTranslator = None,
+    ) -> "JupyterNotebookTranslator":
         """Create a Jupyter Notebook translator instance.
 
         Factory method for creating the translator.
 
         Args:
             root_dir: Root directory of the project for path calculations
+            rate_limiter: Optional limiter enforcing request and token budgets
+            concurrency_controller: Optional adaptive limit on requests in flight
+            markdown_translator: Markdown translator to reuse for the markdown cells
 
         Returns:
             JupyterNotebookTranslator instance
         """
-        return cls(root_dir)
+        return cls(root_dir, rate_limiter, concurrency_controller, markdown_translator)
@@ -1,20 +1,42 @@
 from abc import ABC, abstractmethod
 import asyncio
+import difflib
 import logging
+import time
 from pathlib import Path
 from co_op_translator.config.llm_config.provider import LLMProvider
 from co_op_translator.utils.llm.markdown_utils import (
-    process_markdown,
+    process_markdown_with_token_counts,
+    split_markdown_sections,
+    compute_section_hashes,
+    get_section_heading_level,
     update_links,
     generate_prompt_template,
+    generate_multilingual_prompt_template,
+    TRANSLATION_PROMPT_VERSION,
+    parse_multilingual_response,
+    validate_translated_chunk,
     replace_code_blocks,
     restore_code_blocks,
 )
 from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.llm.disclaimer_store import DisclaimerStore, DISCLAIMER_TEXT
+from co_op_translator.core.llm.translation_memory import (
+    TranslationMemory,
+    split_paragraphs,
+)
 from co_op_translator.config.llm_config.config import LLMConfig
+from co_op_translator.utils.common.rate_limiter import RateLimiter
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    get_retry_after,
+    is_throttling_error,
+)
 from co_op_translator.utils.common.metadata_utils import (
     calculate_file_hash,
     create_metadata,
+    extract_content_without_metadata,
+    extract_metadata_from_content,
     format_metadata_comment,
 )
 
@@ -28,15 +50,44 @@ class MarkdownTranslator(ABC):
     """
 
     TRANSLATION_TIMEOUT_SECONDS = 300  # Translation timeout in seconds
-
-    def __init__(self, root_dir: Path = None):
+    PROMPT_OVERHEAD_TOKENS = 250  # Approximate tokens used by prompt instructions
+    DISCLAIMER_TOKENS = 600  # Approximate tokens used by a disclaimer request
+    MAX_THROTTLE_RETRIES = 5  # Retries for a prompt rejected with 429/503
+    THROTTLE_BACKOFF_SECONDS = 2  # Base backoff when no Retry-After is given
+    MAX_CONCURRENT_CHUNKS = 4  # Chunks of a single document translated at once
+    MULTI_LANGUAGE_BATCH_SIZE = 3  # Target languages requested in one prompt
+    # Smaller chunks so that several translations fit in one completion
+    MULTI_LANGUAGE_MAX_CHUNK_TOKENS = 1000
+
+    def __init__(
+        self,
+        root_dir: Path = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_controller: AdaptiveConcurrencyController = None,
+    ):
         """Initialize translator with project configuration.
 
         Args:
             root_dir: Root directory of the project for path calculations
+            rate_limiter: Optional limiter enforcing request and token budgets
+            concurrency_controller: Optional adaptive limit on requests in flight
         """
         self.root_dir = root_dir
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
         self.font_config = FontConfig()
+        self.disclaimer_store = DisclaimerStore.for_project(root_dir)
+        self.translation_memory = TranslationMemory.for_project(root_dir)
+
+    def get_model_name(self) -> str:
+        """Return the name of the model used for translation.
+
+        Used to key cached results so that they are not reused across models.
+
+        Returns:
+            Model or deployment name
+        """
+        return type(self).__name__
 
     def calculate_file_hash(self, file_path: Path) -> str:
         """Calculate MD5 hash of a file for change detection.
@@ -47,7 +98,7 @@ class MarkdownTranslator(ABC):
         Returns:
             MD5 hash of the file content
         """
-        return calculate_file_hash(file_path)
+        return calculate_file_hash(file_path, self.root_dir)
 
     def create_metadata(self, original_file: Path, language_code: str) -> dict:
         """Create metadata for a translated file.
@@ -102,12 +153,6 @@ class MarkdownTranslator(ABC):
         """
         md_file_path = Path(md_file_path)
 
-        # Create and format metadata (only if requested)
-        metadata_comment = ""
-        if add_metadata:
-            metadata = self.create_metadata(md_file_path, language_code)
-            metadata_comment = self.format_metadata_comment(metadata)
-
         # Step 1: Replace code blocks and inline code with placeholders
         (
             document_with_placeholders,
@@ -115,23 +160,191 @@ class MarkdownTranslator(ABC):
         ) = replace_code_blocks(document)
 
         # Step 2: Split the document into chunks
-        document_chunks = process_markdown(document_with_placeholders)
+        document_chunks = process_markdown_with_token_counts(document_with_placeholders)
 
-        # Step 3: Generate translation prompts and translate each chunk
-        language_name = self.font_config.get_language_name(language_code)
-        is_rtl = self.font_config.is_rtl(language_code)
-        prompts = [
-            generate_prompt_template(language_code, language_name, chunk, is_rtl)
-            for chunk in document_chunks
-        ]
-        results = await self._run_prompts_sequentially(prompts, md_file_path)
+        # Step 3: Translate the chunks concurrently, reusing the translation memory
+        results = await self._translate_chunks(
+            document_chunks, language_code, md_file_path
+        )
+        # Results come back in chunk order regardless of completion order
         translated_content = "\n".join(results)
 
-        # Step 4: Restore the code blocks and inline code from placeholders
+        # Steps 4-6: Restore code blocks, update links, add metadata and disclaimer
+        return await self._finalize_translation(
+            translated_content,
+            placeholder_map,
+            language_code,
+            md_file_path,
+            markdown_only=markdown_only,
+            add_metadata=add_metadata,
+            add_disclaimer=add_disclaimer,
+            source_document=document,
+        )
+
+    async def translate_markdown_multilingual(
+        self,
+        document: str,
+        language_codes: list[str],
+        md_file_path: str | Path,
+        markdown_only: bool = False,
+        add_metadata: bool = True,
+        add_disclaimer: bool = True,
+    ) -> dict[str, str]:
+        """Translate markdown document to several target languages at once.
+
+        Each chunk is sent once per batch of `MULTI_LANGUAGE_BATCH_SIZE` languages
+        and the JSON response is split back into per-language translations. Chunk
+        translations that are missing or fail validation are retried with a
+        single-language request for that language only.
+
+        Args:
+            document: Content of the markdown file
+            language_codes: Target language codes
+            md_file_path: Path to the markdown file
+            markdown_only: Skip embedded image translation if True
+            add_metadata: Whether to add metadata comment at the beginning
+            add_disclaimer: Whether to add disclaimer at the end
+
+        Returns:
+            dict[str, str]: Translated content for each language code.
+        """
+        md_file_path = Path(md_file_path)
+
+        document_with_placeholders, placeholder_map = replace_code_blocks(document)
+        document_chunks = process_markdown_with_token_counts(
+            document_with_placeholders, self.MULTI_LANGUAGE_MAX_CHUNK_TOKENS
+        )
+        batches = [
+            language_codes[i : i + self.MULTI_LANGUAGE_BATCH_SIZE]
+            for i in range(0, len(language_codes), self.MULTI_LANGUAGE_BATCH_SIZE)
+        ]
+        total = len(document_chunks)
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+
+        async def translate_batch(chunk_index, batch):
+            chunk, chunk_tokens = document_chunks[chunk_index]
+            languages = [
+                (
+                    code,
+                    self.font_config.get_language_name(code),
+                    self.font_config.is_rtl(code),
+                )
+                for code in batch
+            ]
+            prompt = generate_multilingual_prompt_template(languages, chunk)
+            async with semaphore:
+                response = await self._run_chunk_prompt(
+                    prompt,
+                    chunk_index + 1,
+                    total,
+                    self.estimate_request_tokens(chunk_tokens, len(batch)),
+                    md_file_path,
+                )
+            translations = parse_multilingual_response(response, batch)
+            return {
+                code: text
+                for code, text in translations.items()
+                if validate_translated_chunk(chunk, text)
+            }
+
+        async def translate_single(chunk_index, language_code):
+            chunk, chunk_tokens = document_chunks[chunk_index]
+            prompt = generate_prompt_template(
+                language_code,
+                self.font_config.get_language_name(language_code),
+                chunk,
+                self.font_config.is_rtl(language_code),
+            )
+            async with semaphore:
+                return await self._run_chunk_prompt(
+                    prompt,
+                    chunk_index + 1,
+                    total,
+                    self.estimate_request_tokens(chunk_tokens),
+                    md_file_path,
+                )
+
+        jobs = [
+            (chunk_index, batch) for chunk_index in range(total) for batch in batches
+        ]
+        batch_results = await asyncio.gather(
+            *(translate_batch(chunk_index, batch) for chunk_index, batch in jobs)
+        )
+
+        chunk_translations = [dict() for _ in range(total)]
+        for (chunk_index, _), translations in zip(jobs, batch_results):
+            chunk_translations[chunk_index].update(translations)
+
+        # Fall back to single-language requests only for the failed languages
+        fallbacks = [
+            (chunk_index, code)
+            for chunk_index in range(total)
+            for code in language_codes
+            if code not in chunk_translations[chunk_index]
+        ]
+        if fallbacks:
+            logger.warning(
+                f"Multi-language translation of '{md_file_path.name}' incomplete for "
+                f"{len(fallbacks)} chunk translation(s), retrying them one language at a time"
+            )
+            fallback_results = await asyncio.gather(
+                *(
+                    translate_single(chunk_index, code)
+                    for chunk_index, code in fallbacks
+                )
+            )
+            for (chunk_index, code), text in zip(fallbacks, fallback_results):
+                chunk_translations[chunk_index][code] = text
+
+        results = {}
+        for code in language_codes:
+            translated_content = "\n".join(
+                translations[code] for translations in chunk_translations
+            )
+            results[code] = await self._finalize_translation(
+                translated_content,
+                placeholder_map,
+                code,
+                md_file_path,
+                markdown_only=markdown_only,
+                add_metadata=add_metadata,
+                add_disclaimer=add_disclaimer,
+                source_document=document,
+            )
+        return results
+
+    async def _finalize_translation(
+        self,
+        translated_content: str,
+        placeholder_map: dict,
+        language_code: str,
+        md_file_path: Path,
+        markdown_only: bool = False,
+        add_metadata: bool = True,
+        add_disclaimer: bool = True,
+        source_document: str = None,
+    ) -> str:
+        """Restore placeholders, update links and add metadata and disclaimer.
+
+        Args:
+            translated_content: Reassembled translation with code placeholders
+            placeholder_map: Mapping of placeholders to the original code blocks
+            language_code: Target language code
+            md_file_path: Path to the markdown file
+            markdown_only: Skip embedded image translation if True
+            add_metadata: Whether to add metadata comment at the beginning
+            add_disclaimer: Whether to add disclaimer at the end
+            source_document: Source markdown whose section hashes are recorded in
+                the metadata for incremental retranslation
+
+        Returns:
+            str: The final translated document
+        """
+        # Restore the code blocks and inline code from placeholders
         translated_content = restore_code_blocks(translated_content, placeholder_map)
 
-        # Step 5: Update links
-        updated_content = update_links(
+        # Update links
+        result = update_links(
             md_file_path,
             translated_content,
             language_code,
@@ -139,53 +352,419 @@ class MarkdownTranslator(ABC):
             markdown_only=markdown_only,
         )
 
-        # Step 6: Add metadata and disclaimer (only if requested)
-        result = updated_content
+        # Add metadata and disclaimer (only if requested)
         if add_metadata:
-            result = metadata_comment + result
+            metadata = self.create_metadata(md_file_path, language_code)
+            if source_document is not None:
+                metadata["source_sections"] = compute_section_hashes(source_document)
+            result = self.format_metadata_comment(metadata) + result
         if add_disclaimer:
             disclaimer = await self.generate_disclaimer(language_code)
             result = result + "\n\n" + disclaimer
 
         return result
 
-    async def _run_prompts_sequentially(self, prompts, md_file_path):
-        """Execute translation prompts in sequence with timeout protection.
+    async def translate_markdown_incremental(
+        self,
+        document: str,
+        existing_translation: str,
+        language_code: str,
+        md_file_path: str | Path,
+        markdown_only: bool = False,
+    ) -> str:
+        """Retranslate only the sections of a document that changed.
+
+        The section hashes recorded in the metadata of the existing translation
+        are aligned with the sections of the new document. Unchanged sections
+        reuse their existing translation; each run of changed or inserted
+        sections is translated as one document and spliced back in place. If the
+        existing translation cannot be aligned, the whole document is translated.
 
         Args:
-            prompts: List of translation prompts to process
-            md_file_path: Path to the markdown file being translated
+            document: Current content of the markdown file
+            existing_translation: Content of the previous translated file
+            language_code: Target language code
+            md_file_path: Path to the markdown file
+            markdown_only: Skip embedded image translation if True
+
+        Returns:
+            str: The translated content with metadata and disclaimer.
+        """
+        md_file_path = Path(md_file_path)
+
+        aligned = self._split_existing_translation(existing_translation, language_code)
+        if aligned is None:
+            logger.info(
+                f"No section alignment for '{md_file_path.name}' ({language_code}), "
+                f"translating the whole document"
+            )
+            return await self.translate_markdown(
+                document, language_code, md_file_path, markdown_only=markdown_only
+            )
+
+        old_hashes, old_translations = aligned
+        new_sections = split_markdown_sections(document)
+        new_hashes = compute_section_hashes(document)
+
+        # Map every unchanged section of the new document to its old translation
+        reused = [None] * len(new_sections)
+        matcher = difflib.SequenceMatcher(None, old_hashes, new_hashes, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag != "equal":
+                continue
+            for old_index, new_index in zip(range(i1, i2), range(j1, j2)):
+                translation = old_translations[old_index]
+                if get_section_heading_level(translation) == get_section_heading_level(
+                    new_sections[new_index]
+                ):
+                    reused[new_index] = translation
+
+        # Group consecutive changed sections into runs translated together
+        pieces = []
+        runs = []
+        for section, translation in zip(new_sections, reused):
+            if translation is not None:
+                pieces.append(translation)
+            elif runs and runs[-1][0] == len(pieces) - 1:
+                runs[-1][1].append(section)
+            else:
+                pieces.append(None)
+                runs.append((len(pieces) - 1, [section]))
+
+        changed_count = sum(1 for translation in reused if translation is None)
+        logger.info(
+            f"Incremental translation of '{md_file_path.name}' ({language_code}): "
+            f"{changed_count}/{len(new_sections)} sections changed"
+        )
+
+        run_translations = await asyncio.gather(
+            *(
+                self.translate_markdown(
+                    "\n\n".join(sections),
+                    language_code,
+                    md_file_path,
+                    markdown_only=markdown_only,
+                    add_metadata=False,
+                    add_disclaimer=False,
+                )
+                for _, sections in runs
+            )
+        )
+        for (position, _), translation in zip(runs, run_translations):
+            pieces[position] = translation.strip("\n")
+
+        metadata = self.create_metadata(md_file_path, language_code)
+        metadata["source_sections"] = new_hashes
+        disclaimer = await self.generate_disclaimer(language_code)
+        return (
+            self.format_metadata_comment(metadata)
+            + "\n\n".join(pieces)
+            + "\n\n"
+            + disclaimer
+        )
+
+    def _split_existing_translation(
+        self, existing_translation: str, language_code: str
+    ) -> tuple[list[str], list[str]] | None:
+        """Split a previous translation into sections aligned with its source.
+
+        Args:
+            existing_translation: Content of the previous translated file
+            language_code: Target language code
+
+        Returns:
+            Tuple of (source section hashes, translated sections), or None if the
+            translation has no section metadata or its sections do not line up
+        """
+        old_hashes = extract_metadata_from_content(existing_translation).get(
+            "source_sections"
+        )
+        if not isinstance(old_hashes, list):
+            return None
+
+        body = extract_content_without_metadata(existing_translation)
+        disclaimer = self.disclaimer_store.get(language_code, self.get_model_name())
+        if not disclaimer or not body.endswith(disclaimer.strip()):
+            return None
+        body = body[: -len(disclaimer.strip())]
+
+        sections = split_markdown_sections(body)
+        if len(sections) != len(old_hashes):
+            return None
+        return old_hashes, sections
+
+    def estimate_request_tokens(
+        self, chunk_tokens: int, language_count: int = 1
+    ) -> int:
+        """Estimate the total tokens a chunk translation request will consume.
+
+        Counts the chunk once as input and once as output per target language,
+        plus the prompt instructions.
+
+        Args:
+            chunk_tokens: Number of tokens in the source chunk
+            language_count: Number of target languages requested in the prompt
+
+        Returns:
+            Estimated prompt and completion tokens for the request
+        """
+        return (1 + language_count) * chunk_tokens + self.PROMPT_OVERHEAD_TOKENS
+
+    async def _run_rate_limited_prompt(
+        self, prompt: str, index, total: int, token_estimate: int
+    ) -> str:
+        """Wait for a concurrency slot and rate limit budget, then execute a single prompt.
+
+        Throttled prompts (HTTP 429/503) shrink the concurrency limit and are
+        retried after the provider's Retry-After delay or an exponential backoff.
+        Each request is limited to TRANSLATION_TIMEOUT_SECONDS.
+
+        Args:
+            prompt: Translation instruction prompt content
+            index: Current chunk index (or prompt label) for progress tracking
+            total: Total number of chunks for progress reporting
+            token_estimate: Estimated prompt and completion tokens for the request
 
         Returns:
-            List of translated text chunks or error messages
+            Translated text content
         """
-        results = []
-        for index, prompt in enumerate(prompts):
+        controller = self.concurrency_controller
+        for attempt in range(self.MAX_THROTTLE_RETRIES + 1):
+            if controller:
+                await controller.acquire()
             try:
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire(token_estimate)
+                start_time = time.monotonic()
+                # Only the request is timed, not the waits for a slot or budget
                 result = await asyncio.wait_for(
-                    self._run_prompt(prompt, index + 1, len(prompts)),
+                    self._run_prompt(prompt, index, total),
                     timeout=self.TRANSLATION_TIMEOUT_SECONDS,
                 )
-                results.append(result)
-            except asyncio.TimeoutError:
+                if controller:
+                    controller.record_success(time.monotonic() - start_time)
+                return result
+            except Exception as e:
+                if not is_throttling_error(e) or attempt == self.MAX_THROTTLE_RETRIES:
+                    raise
+                retry_after = get_retry_after(e)
                 logger.warning(
-                    f"Translation timeout for chunk {index + 1} of file '{md_file_path.name}': "
-                    f"Request exceeded {self.TRANSLATION_TIMEOUT_SECONDS} seconds. "
-                    f"Check your network connection and API response time."
+                    f"Prompt {index}/{total} throttled by provider "
+                    f"(attempt {attempt + 1}/{self.MAX_THROTTLE_RETRIES + 1})"
                 )
-                results.append(
-                    f"Translation for chunk {index + 1} of '{md_file_path.name}' skipped due to timeout."
+                if controller:
+                    controller.record_throttle(retry_after)
+                    if retry_after:
+                        # The controller pauses new requests until Retry-After expires.
+                        continue
+                await asyncio.sleep(
+                    retry_after or self.THROTTLE_BACKOFF_SECONDS * 2**attempt
                 )
-            except Exception as e:
-                logger.error(
-                    f"Translation failed for chunk {index + 1} of file '{md_file_path.name}': {str(e)}. "
-                    f"Check your API configuration and network connection."
+            finally:
+                if controller:
+                    controller.release()
+
+    async def _run_chunk_prompt(
+        self, prompt: str, index: int, total: int, token_estimate: int, md_file_path
+    ) -> str:
+        """Execute one chunk prompt with timeout protection.
+
+        Args:
+            prompt: Translation prompt for the chunk
+            index: 1-based chunk index
+            total: Total number of chunks in the document
+            token_estimate: Estimated token cost of the prompt
+            md_file_path: Path to the markdown file being translated
+
+        Returns:
+            Translated text chunk or an error message
+        """
+        text, _ = await self._try_chunk_prompt(
+            prompt, index, total, token_estimate, md_file_path
+        )
+        return text
+
+    async def _try_chunk_prompt(
+        self, prompt: str, index: int, total: int, token_estimate: int, md_file_path
+    ) -> tuple[str, bool]:
+        """Execute one chunk prompt and report whether it succeeded.
+
+        Args:
+            prompt: Translation prompt for the chunk
+            index: 1-based chunk index
+            total: Total number of chunks in the document
+            token_estimate: Estimated token cost of the prompt
+            md_file_path: Path to the markdown file being translated
+
+        Returns:
+            Tuple of (translated text or error message, success flag)
+        """
+        try:
+            result = await self._run_rate_limited_prompt(
+                prompt, index, total, token_estimate
+            )
+            return result, bool(result)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Translation timeout for chunk {index} of file '{md_file_path.name}': "
+                f"Request exceeded {self.TRANSLATION_TIMEOUT_SECONDS} seconds. "
+                f"Check your network connection and API response time."
+            )
+            return (
+                f"Translation for chunk {index} of '{md_file_path.name}' skipped due to timeout.",
+                False,
+            )
+        except Exception as e:
+            logger.error(
+                f"Translation failed for chunk {index} of file '{md_file_path.name}': {str(e)}. "
+                f"Check your API configuration and network connection."
+            )
+            return (
+                f"Error translating chunk {index} of '{md_file_path.name}': {str(e)}",
+                False,
+            )
+
+    async def _translate_chunks(
+        self, document_chunks, language_code: str, md_file_path: Path
+    ) -> list[str]:
+        """Translate document chunks, reusing the translation memory where possible.
+
+        A chunk found in the memory is reused as-is. Otherwise its paragraphs are
+        looked up individually and only the missing paragraphs are sent for
+        translation; if the response cannot be aligned with them, the whole
+        chunk is translated instead. New translations are added to the memory.
+
+        Args:
+            document_chunks: List of (chunk, token_count) tuples
+            language_code: Target language code
+            md_file_path: Path to the markdown file being translated
+
+        Returns:
+            List of translated text chunks or error messages, in chunk order
+        """
+        language_name = self.font_config.get_language_name(language_code)
+        is_rtl = self.font_config.is_rtl(language_code)
+        total = len(document_chunks)
+        results = [None] * total
+
+        # Each request is (chunk index, text to translate, token count, partial plan)
+        requests = []
+        for index, (chunk, chunk_tokens) in enumerate(document_chunks):
+            if self.translation_memory is None:
+                requests.append((index, chunk, chunk_tokens, None))
+                continue
+
+            cached = self._recall(chunk, language_code)
+            if cached is not None:
+                results[index] = cached
+                continue
+
+            paragraphs = split_paragraphs(chunk)
+            if len(paragraphs) > 1:
+                cached_paragraphs = [self._recall(p, language_code) for p in paragraphs]
+                missing = [
+                    p for p, c in zip(paragraphs, cached_paragraphs) if c is None
+                ]
+                if not missing:
+                    results[index] = "\n\n".join(cached_paragraphs)
+                    continue
+                if len(missing) < len(paragraphs):
+                    text = "\n\n".join(missing)
+                    tokens = max(1, chunk_tokens * len(text) // max(1, len(chunk)))
+                    plan = (chunk, paragraphs, cached_paragraphs)
+                    requests.append((index, text, tokens, plan))
+                    continue
+            requests.append((index, chunk, chunk_tokens, None))
+
+        if self.translation_memory is not None and total:
+            logger.info(
+                f"Translation memory reused {total - len(requests)}/{total} chunks of "
+                f"'{md_file_path.name}' ({language_code})"
+            )
+
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+
+        async def run(index, text, tokens):
+            prompt = generate_prompt_template(
+                language_code, language_name, text, is_rtl
+            )
+            async with semaphore:
+                return await self._try_chunk_prompt(
+                    prompt,
+                    index + 1,
+                    total,
+                    self.estimate_request_tokens(tokens),
+                    md_file_path,
                 )
-                results.append(
-                    f"Error translating chunk {index + 1} of '{md_file_path.name}': {str(e)}"
+
+        outcomes = await asyncio.gather(
+            *(run(index, text, tokens) for index, text, tokens, _ in requests)
+        )
+
+        retries = []
+        for (index, text, _, plan), (translation, ok) in zip(requests, outcomes):
+            if not ok:
+                results[index] = translation
+            elif plan is None:
+                results[index] = translation
+                self._remember(text, translation, language_code)
+            else:
+                chunk, paragraphs, cached_paragraphs = plan
+                translated = split_paragraphs(translation)
+                missing_count = sum(1 for c in cached_paragraphs if c is None)
+                if len(translated) != missing_count:
+                    retries.append(index)
+                    continue
+                new_paragraphs = iter(translated)
+                merged = [
+                    c if c is not None else next(new_paragraphs)
+                    for c in cached_paragraphs
+                ]
+                results[index] = "\n\n".join(merged)
+                self._remember(chunk, results[index], language_code)
+
+        if retries:
+            # Partial responses that could not be aligned: translate the whole chunk
+            retry_outcomes = await asyncio.gather(
+                *(
+                    run(index, document_chunks[index][0], document_chunks[index][1])
+                    for index in retries
                 )
+            )
+            for index, (translation, ok) in zip(retries, retry_outcomes):
+                results[index] = translation
+                if ok:
+                    self._remember(
+                        document_chunks[index][0], translation, language_code
+                    )
+
         return results
 
+    def _recall(self, segment: str, language_code: str) -> str | None:
+        """Look up a segment translation in the translation memory."""
+        return self.translation_memory.get(
+            segment, language_code, self.get_model_name(), TRANSLATION_PROMPT_VERSION
+        )
+
+    def _remember(self, segment: str, translation: str, language_code: str):
+        """Store a chunk translation and, when they align, its paragraph translations."""
+        if self.translation_memory is None:
+            return
+        model = self.get_model_name()
+        memory = self.translation_memory
+        memory.put(
+            segment, language_code, model, TRANSLATION_PROMPT_VERSION, translation
+        )
+        source_paragraphs = split_paragraphs(segment)
+        translated_paragraphs = split_paragraphs(translation)
+        if len(source_paragraphs) > 1 and len(source_paragraphs) == len(
+            translated_paragraphs
+        ):
+            for source, translated in zip(source_paragraphs, translated_paragraphs):
+                memory.put(
+                    source, language_code, model, TRANSLATION_PROMPT_VERSION, translated
+                )
+
     @abstractmethod
     async def _run_prompt(self, prompt: str, index: int, total: int) -> str:
         """Execute a single translation prompt against LLM provider.
@@ -201,10 +780,66 @@ class MarkdownTranslator(ABC):
         pass
 
     async def generate_disclaimer(self, output_lang: str) -> str:
-        """Generate a translated disclaimer notice.
+        """Return the translated disclaimer notice for a language.
 
-        Creates standardized disclaimer about machine translation quality
-        in the target language.
+        Disclaimers are read from the persistent disclaimer store; only a
+        language missing from the store costs a translation request.
+
+        Args:
+            output_lang: Target language code
+
+        Returns:
+            Translated disclaimer text
+        """
+        model = self.get_model_name()
+        disclaimer = self.disclaimer_store.get(output_lang, model)
+        if disclaimer is not None:
+            return disclaimer
+
+        disclaimer = await self._translate_disclaimer(output_lang)
+        if disclaimer:
+            self.disclaimer_store.set(output_lang, model, disclaimer)
+            self.disclaimer_store.save()
+        return disclaimer
+
+    async def prepare_disclaimers(
+        self, language_codes: list[str], refresh: bool = False
+    ) -> int:
+        """Translate disclaimers for several languages into the disclaimer store.
+
+        Args:
+            language_codes: Target language codes
+            refresh: Regenerate disclaimers that are already stored
+
+        Returns:
+            Number of disclaimers translated
+        """
+        model = self.get_model_name()
+        if refresh:
+            pending = list(language_codes)
+        else:
+            pending = self.disclaimer_store.missing(language_codes, model)
+        if not pending:
+            return 0
+
+        logger.info(f"Translating disclaimer for {len(pending)} language(s)")
+        results = await asyncio.gather(
+            *(self._translate_disclaimer(code) for code in pending),
+            return_exceptions=True,
+        )
+
+        count = 0
+        for code, disclaimer in zip(pending, results):
+            if isinstance(disclaimer, Exception) or not disclaimer:
+                logger.warning(f"Failed to translate disclaimer for {code}")
+                continue
+            self.disclaimer_store.set(code, model, disclaimer)
+            count += 1
+        self.disclaimer_store.save()
+        return count
+
+    async def _translate_disclaimer(self, output_lang: str) -> str:
+        """Translate the disclaimer notice with the LLM provider.
 
         Args:
             output_lang: Target language code
@@ -215,15 +850,19 @@ class MarkdownTranslator(ABC):
         language_name = self.font_config.get_language_name(output_lang)
         disclaimer_prompt = f""" Translate the following text to {language_name} ({output_lang}).
 
-        **Disclaimer**: 
-        This document has been translated using AI translation service [Co-op Translator](https://github.com/Azure/co-op-translator). While we strive for accuracy, please be aware that automated translations may contain errors or inaccuracies. The original document in its native language should be considered the authoritative source. For critical information, professional human translation is recommended. We are not liable for any misunderstandings or misinterpretations arising from the use of this translation."""
-
-        disclaimer = await self._run_prompt(disclaimer_prompt, "disclaimer prompt", 1)
+        {DISCLAIMER_TEXT}"""
 
-        return disclaimer
+        return await self._run_rate_limited_prompt(
+            disclaimer_prompt, "disclaimer prompt", 1, self.DISCLAIMER_TOKENS
+        )
 
     @classmethod
-    def create(cls, root_dir: Path = None) -> "MarkdownTranslator":
+    def create(
+        cls,
+        root_dir: Path = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_controller: AdaptiveConcurrencyController = None,
+    ) -> "MarkdownTranslator":
         """Create appropriate markdown translator based on configured provider.
 
         Factory method that instantiates the correct implementation based on
@@ -231,6 +870,8 @@ class MarkdownTranslator(ABC):
 
         Args:
             root_dir: Root directory of the project for path calculations
+            rate_limiter: Optional limiter enforcing request and token budgets
+            concurrency_controller: Optional adaptive limit on requests in flight
 
         Returns:
             Appropriate translator implementation instance
@@ -249,13 +890,17 @@ class MarkdownTranslator(ABC):
                 AzureMarkdownTranslator,
             )
 
-            return AzureMarkdownTranslator(root_dir)
+            return AzureMarkdownTranslator(
+                root_dir, rate_limiter, concurrency_controller
+            )
         elif provider == LLMProvider.OPENAI:
             from co_op_translator.core.llm.providers.openai.markdown_translator import (
                 OpenAIMarkdownTranslator,
             )
 
-            return OpenAIMarkdownTranslator(root_dir)
+            return OpenAIMarkdownTranslator(
+                root_dir, rate_limiter, concurrency_controller
+            )
         else:
             raise ValueError(
                 f"Unsupported LLM provider '{provider}'. Supported providers: AZURE_OPENAI, OPENAI. Please check your configuration."
@@ -1,13 +1,15 @@
 from pathlib import Path
-import asyncio
 import logging
 import time
-from semantic_kernel import Kernel
-from semantic_kernel.connectors.ai.open_ai import AzureChatCompletion
-from semantic_kernel.prompt_template.prompt_template_config import PromptTemplateConfig
+from co_op_translator.core.llm.chat_client import ChatClient
 from co_op_translator.config.llm_config.azure_openai import AzureOpenAIConfig
 from co_op_translator.config.llm_config.provider import LLMProvider
 from co_op_translator.core.llm.markdown_translator import MarkdownTranslator
+from co_op_translator.utils.common.rate_limiter import RateLimiter
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    is_throttling_error,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,33 +17,28 @@ logger = logging.getLogger(__name__)
 class AzureMarkdownTranslator(MarkdownTranslator):
     """Azure OpenAI implementation for markdown translation."""
 
-    def __init__(self, root_dir: Path = None):
+    def __init__(
+        self,
+        root_dir: Path = None,
+        rate_limiter: RateLimiter = None,
+        concurrency_controller: AdaptiveConcurrencyController = None,
+    ):
         """Initialize translator with Azure-specific configuration.
 
         Args:
             root_dir: Optional root directory for the project
+            rate_limiter: Optional limiter enforcing request and token budgets
+            concurrency_controller: Optional adaptive limit on requests in flight
         """
-        super().__init__(root_dir)
-        self.kernel = self._initialize_kernel()
-
-    def _initialize_kernel(self):
-        """Create and configure Semantic Kernel with Azure OpenAI service.
-
-        Returns:
-            Configured Semantic Kernel instance
-        """
-        kernel = Kernel()
-        service_id = LLMProvider.AZURE_OPENAI.value
-
-        kernel.add_service(
-            AzureChatCompletion(
-                service_id=service_id,
-                deployment_name=AzureOpenAIConfig.get_chat_deployment_name(),
-                endpoint=AzureOpenAIConfig.get_endpoint(),
-                api_key=AzureOpenAIConfig.get_api_key(),
-            )
+        super().__init__(root_dir, rate_limiter, concurrency_controller)
+        # Throttled requests are retried by the caller, not by the SDK
+        self.chat_client = ChatClient.for_provider(
+            LLMProvider.AZURE_OPENAI, AzureOpenAIConfig.get_chat_deployment_name()
         )
-        return kernel
+
+    def get_model_name(self) -> str:
+        """Return the configured chat model used for translation."""
+        return AzureOpenAIConfig.get_chat_deployment_name() or super().get_model_name()
 
     async def _run_prompt(self, prompt: str, index: int, total: int) -> str:
         """
@@ -54,16 +51,11 @@ class AzureMarkdownTranslator(MarkdownTranslator):
 
         Returns:
             Translated text content or empty string on error
+
+        Raises:
+            Exception: If the request was throttled by the provider (HTTP 429/503)
         """
         try:
-            # Configure model parameters for translation quality
-            req_settings = self.kernel.get_prompt_execution_settings_from_service_id(
-                LLMProvider.AZURE_OPENAI.value
-            )
-            req_settings.max_tokens = 4096
-            req_settings.temperature = 0
-            req_settings.top_p = 0.8
-
             # Use different logging format for system vs. content prompts
             if index == "disclaimer" or isinstance(index, str):
                 logger.info(f"Running system prompt: {index}")
@@ -72,28 +64,19 @@ class AzureMarkdownTranslator(MarkdownTranslator):
 
             start_time = time.time()
 
-            prompt_template_config = PromptTemplateConfig(
-                template=prompt,
-                name="translate",
-                description="Translate a text to another language",
-                template_format="semantic-kernel",
-                execution_settings=req_settings,
+            # Send the prompt as-is: no template rendering or function registration
+            result = await self.chat_client.complete(
+                prompt, max_tokens=4096, temperature=0, top_p=0.8
             )
-
-            function = self.kernel.add_function(
-                function_name="translate_function",
-                plugin_name="translate_plugin",
-                prompt_template_config=prompt_template_config,
-            )
-
-            result = await self.kernel.invoke(function)
             end_time = time.time()
             logger.info(
                 f"Prompt {index}/{total} completed in {end_time - start_time} seconds"
             )
 
-            await asyncio.sleep(1)
-            return str(result)
+            return result
         except Exception as e:
+            if is_throttling_error(e):
+                # Let the caller back off and retry throttled requests
+                raise
             logger.error(f"Error in prompt {index}/{total} - {prompt}: {e}")
             return ""
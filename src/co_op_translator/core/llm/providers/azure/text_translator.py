@@ -1,5 +1,7 @@
 from openai import AzureOpenAI
 from co_op_translator.core.llm.text_translator import TextTranslator
+from co_op_translator.core.llm.chat_client import ChatClient
+from co_op_translator.config.llm_config.provider import LLMProvider
 from co_op_translator.config.llm_config.azure_openai import AzureOpenAIConfig
 
 
@@ -28,3 +30,11 @@ class AzureTextTranslator(TextTranslator):
     def get_model_name(self):
         """Retrieve the configured Azure OpenAI model name."""
         return AzureOpenAIConfig.get_model_name()
+
+    def get_chat_client(self) -> ChatClient:
+        """Return the async chat client for the configured chat deployment."""
+        return ChatClient.for_provider(
+            LLMProvider.AZURE_OPENAI,
+            AzureOpenAIConfig.get_chat_deployment_name(),
+            max_retries=2,
+        )
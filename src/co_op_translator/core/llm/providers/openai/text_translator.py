@@ -1,5 +1,7 @@
 from openai import OpenAI
 from co_op_translator.core.llm.text_translator import TextTranslator
+from co_op_translator.core.llm.chat_client import ChatClient
+from co_op_translator.config.llm_config.provider import LLMProvider
 from co_op_translator.config.llm_config.openai import OpenAIConfig
 
 
@@ -28,3 +30,9 @@ class OpenAITextTranslator(TextTranslator):
     def get_model_name(self) -> str:
         """Retrieve the configured OpenAI model name."""
         return OpenAIConfig.get_chat_model_id()
+
+    def get_chat_client(self) -> ChatClient:
+        """Return the async chat client for the configured OpenAI model."""
+        return ChatClient.for_provider(
+            LLMProvider.OPENAI, OpenAIConfig.get_chat_model_id(), max_retries=2
+        )
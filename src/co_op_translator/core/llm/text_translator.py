@@ -1,16 +1,22 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
 from co_op_translator.utils.llm.text_utils import (
     gen_image_translation_prompt,
+    gen_multilingual_image_translation_prompt,
+    parse_multilingual_image_translation,
     remove_code_backticks,
     extract_yaml_lines,
 )
 from co_op_translator.config.llm_config.config import LLMConfig
 from co_op_translator.config.llm_config.provider import LLMProvider
 from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.llm.chat_client import ChatClient
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are a helpful assistant."
+
 
 class TextTranslator(ABC):
     """Define interface for text translation services.
@@ -18,6 +24,16 @@ class TextTranslator(ABC):
     Provides common functionality and abstract methods to be implemented by providers.
     """
 
+    MAX_COMPLETION_TOKENS = 4096  # Completion limit of the smallest deployments
+    IMAGE_TEXT_MAX_TOKENS = 2000  # Completion tokens of a single-language request
+    # Completion tokens reserved per language in a multi-language request; a
+    # longer response fails to parse and its languages are translated one by one
+    IMAGE_TEXT_TOKENS_PER_LANGUAGE = 1000
+    # Target languages requested in one image text prompt
+    IMAGE_LANGUAGES_PER_REQUEST = (
+        MAX_COMPLETION_TOKENS // IMAGE_TEXT_TOKENS_PER_LANGUAGE
+    )
+
     def __init__(self):
         self.client = self.get_openai_client()
         self.font_config = FontConfig()
@@ -36,6 +52,15 @@ class TextTranslator(ABC):
         """Retrieve the configured model name for the provider."""
         pass
 
+    @abstractmethod
+    def get_chat_client(self) -> ChatClient:
+        """Return the async chat client used by the `*_async` methods.
+
+        Returns:
+            ChatClient for the provider, on the shared connection pool
+        """
+        pass
+
     def translate_image_text(self, text_data: list, target_language: str) -> list:
         """Translate extracted text from images to target language.
 
@@ -49,18 +74,117 @@ class TextTranslator(ABC):
         Returns:
             List of translated text lines
         """
-        language_name = self.font_config.get_language_name(target_language)
-        prompt = gen_image_translation_prompt(text_data, target_language, language_name)
+        prompt = self._build_image_text_prompt(text_data, target_language)
         response = self.client.chat.completions.create(
             model=self.get_model_name(),
             messages=[
-                {"role": "system", "content": "You are a helpful assistant."},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": prompt},
             ],
             max_tokens=2000,
             temperature=0,
         )
-        translated_text = remove_code_backticks(response.choices[0].message.content)
+        return self._parse_image_text_response(response.choices[0].message.content)
+
+    async def translate_image_text_async(
+        self, text_data: list, target_language: str
+    ) -> list:
+        """Translate extracted text from images without blocking the event loop.
+
+        Args:
+            text_data: List of text lines to translate
+            target_language: Target language code
+
+        Returns:
+            List of translated text lines
+        """
+        prompt = self._build_image_text_prompt(text_data, target_language)
+        response = await self.get_chat_client().complete(
+            prompt, max_tokens=2000, temperature=0, system_prompt=SYSTEM_PROMPT
+        )
+        return self._parse_image_text_response(response)
+
+    async def translate_image_text_multilingual_async(
+        self, text_data: list, target_languages: list[str]
+    ) -> dict:
+        """Translate extracted text from an image into several languages at once.
+
+        Languages are requested `IMAGE_LANGUAGES_PER_REQUEST` at a time in one
+        structured (JSON) prompt. Languages of a failed request, missing from a
+        response, or whose line count does not match are translated individually.
+
+        Args:
+            text_data: List of text lines to translate
+            target_languages: Target language codes
+
+        Returns:
+            Mapping of language code to the list of translated text lines
+        """
+        batches = [
+            target_languages[i : i + self.IMAGE_LANGUAGES_PER_REQUEST]
+            for i in range(0, len(target_languages), self.IMAGE_LANGUAGES_PER_REQUEST)
+        ]
+        translations = {}
+        results = await asyncio.gather(
+            *(self._translate_image_text_batch(text_data, batch) for batch in batches),
+            return_exceptions=True,
+        )
+        for batch, batch_translations in zip(batches, results):
+            if isinstance(batch_translations, Exception):
+                logger.warning(
+                    f"Image text translation failed for languages "
+                    f"{', '.join(batch)}: {batch_translations}"
+                )
+                continue
+            translations.update(batch_translations)
+
+        missing = [code for code in target_languages if code not in translations]
+        if missing:
+            logger.warning(
+                f"Retranslating image text individually for languages: {', '.join(missing)}"
+            )
+            retranslated = await asyncio.gather(
+                *(self.translate_image_text_async(text_data, code) for code in missing)
+            )
+            translations.update(zip(missing, retranslated))
+        return translations
+
+    async def _translate_image_text_batch(
+        self, text_data: list, language_codes: list[str]
+    ) -> dict:
+        """Request the translation of image text lines into a batch of languages."""
+        if len(language_codes) == 1:
+            code = language_codes[0]
+            return {code: await self.translate_image_text_async(text_data, code)}
+
+        prompt = gen_multilingual_image_translation_prompt(
+            text_data,
+            [
+                (code, self.font_config.get_language_name(code))
+                for code in language_codes
+            ],
+        )
+        response = await self.get_chat_client().complete(
+            prompt,
+            max_tokens=min(
+                self.IMAGE_TEXT_TOKENS_PER_LANGUAGE * len(language_codes),
+                self.MAX_COMPLETION_TOKENS,
+            ),
+            temperature=0,
+            system_prompt=SYSTEM_PROMPT,
+        )
+        return parse_multilingual_image_translation(
+            response, language_codes, len(text_data)
+        )
+
+    def _build_image_text_prompt(self, text_data: list, target_language: str) -> str:
+        """Build the prompt asking for a line-by-line translation of OCR text."""
+        language_name = self.font_config.get_language_name(target_language)
+        return gen_image_translation_prompt(text_data, target_language, language_name)
+
+    def _parse_image_text_response(self, response: str) -> list:
+        """Extract the translated lines from a model response."""
+        translated_text = remove_code_backticks(response)
         logger.debug(f"Raw translation response: {translated_text}")
         result = extract_yaml_lines(translated_text)
         logger.debug(f"Extracted translation lines: {result}")
@@ -89,6 +213,22 @@ class TextTranslator(ABC):
         translated_text = remove_code_backticks(response.choices[0].message.content)
         return translated_text
 
+    async def translate_text_async(self, text: str, target_language: str) -> str:
+        """Translate plain text to specified target language without blocking.
+
+        Args:
+            text: Source text content to translate
+            target_language: Target language code
+
+        Returns:
+            Translated text content
+        """
+        prompt = f"Translate the following text into {target_language}:\n\n{text}"
+        response = await self.get_chat_client().complete(
+            prompt, max_tokens=2000, temperature=0, system_prompt=SYSTEM_PROMPT
+        )
+        return remove_code_backticks(response)
+
     @classmethod
     def create(cls) -> "TextTranslator":
         """Create appropriate text translator implementation based on configuration.
@@ -0,0 +1,234 @@
+"""
+Content-addressed translation memory for markdown segments.
+
+Translated segments are stored in a SQLite database under the project's cache
+directory, keyed by the hash of the normalized source segment, the target
+language, the model and the prompt version. Unchanged segments of an edited
+document can then be reused instead of being translated again. The database is
+bounded in size and evicts the least recently used segments first.
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from co_op_translator.config.constants import CACHE_DIR_NAME
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_MEMORY_FILENAME = "translation_memory.sqlite"
+
+
+def normalize_segment(text: str) -> str:
+    """
+    Normalize a source segment so that insignificant whitespace changes still match.
+
+    Args:
+        text (str): The source segment.
+
+    Returns:
+        str: The segment with unified line endings, no trailing spaces and no surrounding blank lines.
+    """
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    lines = [line.rstrip() for line in text.split("\n")]
+    return "\n".join(lines).strip("\n")
+
+
+def split_paragraphs(text: str) -> list[str]:
+    """
+    Split a markdown segment into paragraphs separated by blank lines.
+
+    Args:
+        text (str): The markdown segment.
+
+    Returns:
+        list[str]: Non-empty paragraphs in order.
+    """
+    paragraphs = re.split(r"\n(?:[ \t]*\n)+", normalize_segment(text))
+    return [p for p in paragraphs if p.strip()]
+
+
+class TranslationMemory:
+    """SQLite-backed, size-bounded LRU store of translated segments."""
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Upper bound on stored translation text
+    EVICTION_TARGET = 0.9  # Evict down to this fraction of the bound
+
+    def __init__(self, path: Path | str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Open (or create) the translation memory database.
+
+        Args:
+            path: Location of the SQLite file, or ":memory:" for a temporary store
+            max_bytes: Maximum total size of stored translations in bytes
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS segments (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS segments_last_used ON segments (last_used)"
+        )
+        self._conn.commit()
+        self.total_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM segments"
+        ).fetchone()[0]
+
+    @classmethod
+    def for_project(cls, root_dir: Path | None) -> "TranslationMemory | None":
+        """Return the shared translation memory for a project root.
+
+        Args:
+            root_dir: Root directory of the project
+
+        Returns:
+            TranslationMemory instance, or None if no root directory is given or
+            the database cannot be opened
+        """
+        if root_dir is None:
+            return None
+        path = (Path(root_dir) / CACHE_DIR_NAME / TRANSLATION_MEMORY_FILENAME).resolve()
+
+        def create():
+            try:
+                return cls(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Translation memory disabled, cannot open {path}: {e}")
+                return None
+
+        return get_shared_instance(cls, path, create)
+
+    @staticmethod
+    def make_key(
+        segment: str, language_code: str, model: str, prompt_version: str
+    ) -> str:
+        """Build the content-addressed key for a source segment."""
+        digest = hashlib.sha256(normalize_segment(segment).encode("utf-8")).hexdigest()
+        return f"{digest}:{language_code}:{model}:{prompt_version}"
+
+    def get(
+        self, segment: str, language_code: str, model: str, prompt_version: str
+    ) -> str | None:
+        """Look up the translation of a segment and mark it as recently used.
+
+        Args:
+            segment: Source segment
+            language_code: Target language code
+            model: Model used for translation
+            prompt_version: Version of the translation prompt
+
+        Returns:
+            The stored translation, or None on a miss
+        """
+        key = self.make_key(segment, language_code, model, prompt_version)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translation FROM segments WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE segments SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            return row[0]
+
+    def put(
+        self,
+        segment: str,
+        language_code: str,
+        model: str,
+        prompt_version: str,
+        translation: str,
+    ):
+        """Store the translation of a segment, evicting old segments if needed.
+
+        Args:
+            segment: Source segment
+            language_code: Target language code
+            model: Model used for translation
+            prompt_version: Version of the translation prompt
+            translation: Translated text
+        """
+        key = self.make_key(segment, language_code, model, prompt_version)
+        size = len(translation.encode("utf-8"))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size FROM segments WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO segments (key, translation, size, last_used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, translation, size, time.time()),
+            )
+            self.total_bytes += size - (row[0] if row else 0)
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        target = self.max_bytes * self.EVICTION_TARGET
+        rows = self._conn.execute(
+            "SELECT key, size FROM segments ORDER BY last_used ASC"
+        )
+        evicted = []
+        for key, size in rows:
+            if self.total_bytes <= target:
+                break
+            evicted.append((key,))
+            self.total_bytes -= size
+        self._conn.executemany("DELETE FROM segments WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+        logger.debug(f"Evicted {len(evicted)} segments from translation memory")
+
+    def stats(self) -> dict:
+        """Return hit/miss statistics and the current size of the memory."""
+        lookups = self.hits + self.misses
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM segments").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "size_bytes": self.total_bytes,
+        }
+
+    def log_stats(self):
+        """Log a one-line summary of the memory statistics."""
+        stats = self.stats()
+        logger.info(
+            f"Translation memory: {stats['hits']} hits, {stats['misses']} misses "
+            f"({stats['hit_rate']:.0%} hit rate), {stats['entries']} entries, "
+            f"{stats['evictions']} evicted"
+        )
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,14 @@
 from pathlib import Path
 import logging
-import json
-from co_op_translator.utils.common.file_utils import get_unique_id
+from co_op_translator.utils.common.file_utils import get_unique_ids
+from co_op_translator.utils.common.metadata_utils import read_metadata
+from co_op_translator.utils.common.project_index import ProjectIndex
 from pathlib import PurePosixPath
 
 logger = logging.getLogger(__name__)
 
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
 
 class DirectoryManager:
     """
@@ -18,6 +21,7 @@ class DirectoryManager:
         translations_dir: Path,
         language_codes: list[str],
         excluded_dirs: list[str],
+        translation_state=None,
     ):
         """Initialize directory manager with project configuration.
 
@@ -26,14 +30,62 @@ class DirectoryManager:
             translations_dir: Directory for translated files
             language_codes: List of target language codes
             excluded_dirs: List of directories to exclude
+            translation_state: TranslationState recording the source of each
+                translation (optional)
         """
         self.root_dir = root_dir
         self.translations_dir = translations_dir
         self.language_codes = language_codes
         self.excluded_dirs = excluded_dirs
+        self.translation_state = translation_state
+
+    def get_project_index(self, project_index: ProjectIndex = None) -> ProjectIndex:
+        """Return the given index of source files, or index the project now."""
+        return project_index or ProjectIndex(self.root_dir, self.excluded_dirs)
+
+    def _remove_orphaned_translation(
+        self,
+        trans_file: Path,
+        translation_dir: Path,
+        original_file: Path,
+        lang_code: str,
+    ) -> int:
+        """Delete a translation whose source is gone, with its emptied directories.
+
+        Args:
+            trans_file: Translation file to delete
+            translation_dir: Language directory the translation belongs to
+            original_file: Missing source file of the translation
+            lang_code: Language code of the translation
+
+        Returns:
+            Number of removed translation files
+        """
+        logger.info(f"Original file not found, deleting: {trans_file}")
+        trans_file.unlink()
+        logger.info(f"Successfully deleted: {trans_file}")
+        if self.translation_state is not None:
+            self.translation_state.remove(original_file, lang_code)
+
+        parent = trans_file.parent
+        while parent != translation_dir:
+            if parent.exists() and not any(parent.iterdir()):
+                try:
+                    parent.rmdir()
+                    logger.info(f"Removed empty directory: {parent}")
+                except OSError as e:
+                    logger.warning(f"Could not remove directory {parent}: {e}")
+                    break
+            else:
+                break
+            parent = parent.parent
+        return 1
 
     def sync_directory_structure(
-        self, markdown: bool = True, images: bool = True
+        self,
+        markdown: bool = True,
+        images: bool = True,
+        project_index: ProjectIndex = None,
     ) -> tuple[int, int, int]:
         """
         Synchronize the directory structure of translations with the original structure.
@@ -47,6 +99,7 @@ class DirectoryManager:
         Args:
             markdown: Whether to sync markdown directories
             images: Whether to sync image directories
+            project_index: Index of the source files (the project is indexed if omitted)
 
         Returns:
             Tuple containing counts of created directories, removed directories,
@@ -56,23 +109,19 @@ class DirectoryManager:
         removed_count = 0
 
         # Get original directory structure (excluding files)
+        project_index = self.get_project_index(project_index)
+        image_dirs = project_index.get_dirs_containing(".png", ".jpg")
+        markdown_dirs = project_index.get_dirs_containing(".md")
         original_dirs = set()
-        for path in self.root_dir.rglob("*"):
-            if path.is_dir() and not any(
-                excluded in str(path) for excluded in self.excluded_dirs
-            ):
-                # For image-only mode, only include image directories
-                if (
-                    not markdown
-                    and not any(path.glob("*.png"))
-                    and not any(path.glob("*.jpg"))
-                ):
-                    continue
-                # For markdown-only mode, only include markdown directories
-                if not images and not any(path.glob("*.md")):
-                    continue
-                # Store relative path for comparison
-                original_dirs.add(path.relative_to(self.root_dir))
+        for path in project_index.dirs:
+            # For image-only mode, only include image directories
+            if not markdown and path not in image_dirs:
+                continue
+            # For markdown-only mode, only include markdown directories
+            if not images and path not in markdown_dirs:
+                continue
+            # Store relative path for comparison
+            original_dirs.add(path.relative_to(project_index.root_dir))
 
         # Sync each language directory
         for lang_code in self.language_codes:
@@ -82,14 +131,18 @@ class DirectoryManager:
                 logger.info(f"Created language directory: {lang_dir}")
 
             # Get existing translation directories
-            translation_dirs = set()
-            if lang_dir.exists():
-                for path in lang_dir.rglob("*"):
-                    if path.is_dir():
-                        try:
-                            translation_dirs.add(path.relative_to(lang_dir))
-                        except ValueError:
-                            continue
+            lang_index = ProjectIndex(lang_dir)
+            translation_dirs = {path.relative_to(lang_dir) for path in lang_index.dirs}
+            relevant_extensions = []
+            if markdown:
+                relevant_extensions.append(".md")
+            if images:
+                relevant_extensions.extend([".png", ".jpg"])
+            relevant_dirs = (
+                lang_index.get_dirs_containing(*relevant_extensions, recursive=True)
+                if relevant_extensions
+                else set()
+            )
 
             # Create missing directories
             for orig_dir in original_dirs:
@@ -107,16 +160,7 @@ class DirectoryManager:
                     target_dir = lang_dir / trans_dir
                     try:
                         # Only remove if empty or contains no relevant files
-                        has_relevant_files = False
-                        if markdown and any(target_dir.rglob("*.md")):
-                            has_relevant_files = True
-                        if images and (
-                            any(target_dir.rglob("*.png"))
-                            or any(target_dir.rglob("*.jpg"))
-                        ):
-                            has_relevant_files = True
-
-                        if not has_relevant_files:
+                        if target_dir not in relevant_dirs:
                             target_dir.rmdir()  # This will only remove empty directories
                             removed_count += 1
                             logger.info(f"Removed empty directory: {target_dir}")
@@ -128,7 +172,10 @@ class DirectoryManager:
         return created_count, removed_count, len(self.language_codes)
 
     def cleanup_orphaned_translations(
-        self, markdown: bool = True, images: bool = True
+        self,
+        markdown: bool = True,
+        images: bool = True,
+        project_index: ProjectIndex = None,
     ) -> int:
         """Remove orphaned translation files that no longer have source files.
 
@@ -139,6 +186,7 @@ class DirectoryManager:
         Args:
             markdown: Whether to clean up markdown files
             images: Whether to clean up image files
+            project_index: Index of the source files (the project is indexed if omitted)
 
         Returns:
             Number of removed translation files
@@ -158,11 +206,16 @@ class DirectoryManager:
 
                 logger.info(f"Checking translations in: {translation_dir}")
 
-                md_files = []
-                try:
-                    md_files = list(translation_dir.rglob("*.md"))
-                except Exception as e:
-                    logger.warning(f"Error scanning for MD files: {e}")
+                md_files = ProjectIndex(translation_dir).get_files(".md")
+                # Recorded sources spare reading the metadata of each translation
+                recorded_sources = {}
+                if self.translation_state is not None:
+                    recorded_sources = {
+                        record.translation_path: record.source_file
+                        for record in self.translation_state.get_records(
+                            lang_code
+                        ).values()
+                    }
 
                 for trans_file in md_files:
                     try:
@@ -170,29 +223,23 @@ class DirectoryManager:
                             continue
 
                         logger.info(f"Processing translation file: {trans_file}")
-                        # Read translation file and find metadata comment
-                        content = trans_file.read_text(encoding="utf-8")
-                        metadata_start = content.find("<!--")
-                        if metadata_start == -1:
-                            logger.warning(f"No metadata found in: {trans_file}")
+                        original_file = recorded_sources.get(trans_file)
+                        if original_file is not None:
+                            if not original_file.exists():
+                                removed_count += self._remove_orphaned_translation(
+                                    trans_file,
+                                    translation_dir,
+                                    original_file,
+                                    lang_code,
+                                )
                             continue
 
-                        metadata_end = content.find("-->", metadata_start)
-                        if metadata_end == -1:
-                            logger.warning(f"Incomplete metadata in: {trans_file}")
+                        # Read the metadata comment at the start of the file
+                        metadata = read_metadata(trans_file, allow_unmarked=True)
+                        if not metadata:
+                            logger.warning(f"No metadata found in: {trans_file}")
                             continue
 
-                        metadata_str = content[
-                            metadata_start + 4 : metadata_end
-                        ].strip()
-                        if "CO_OP_TRANSLATOR_METADATA:" in metadata_str:
-                            _, json_str = metadata_str.split(
-                                "CO_OP_TRANSLATOR_METADATA:", 1
-                            )
-                            metadata = json.loads(json_str.strip())
-                        else:
-                            metadata = json.loads(metadata_str)
-
                         source_file = metadata.get("source_file")
                         if not source_file:
                             logger.warning(f"No source_file in metadata: {trans_file}")
@@ -203,60 +250,26 @@ class DirectoryManager:
 
                         logger.info(f"Checking original file: {original_file}")
                         if not original_file.exists():
-                            logger.info(
-                                f"Original file not found, deleting: {trans_file}"
+                            removed_count += self._remove_orphaned_translation(
+                                trans_file, translation_dir, original_file, lang_code
                             )
-                            trans_file.unlink()
-                            removed_count += 1
-                            logger.info(f"Successfully deleted: {trans_file}")
-
-                            parent = trans_file.parent
-                            while parent != translation_dir:
-                                if parent.exists() and not any(parent.iterdir()):
-                                    try:
-                                        parent.rmdir()
-                                        logger.info(
-                                            f"Removed empty directory: {parent}"
-                                        )
-                                    except OSError as e:
-                                        logger.warning(
-                                            f"Could not remove directory {parent}: {e}"
-                                        )
-                                        break
-                                else:
-                                    break
-                                parent = parent.parent
                         else:
                             logger.info(f"Original file exists, keeping: {trans_file}")
 
-                    except (json.JSONDecodeError, KeyError, FileNotFoundError) as e:
+                    except (KeyError, OSError) as e:
                         logger.warning(f"Error processing {trans_file}: {e}")
                         continue
 
         # Handle image files
         if images:
             # Collect all image files in the original directory
-            original_images = {}  # path_hash -> original_file_path
-            try:
-                for original_img_file in self.root_dir.rglob("*"):
-                    if not original_img_file.is_file():
-                        continue
-
-                    if original_img_file.suffix.lower() not in [
-                        ".png",
-                        ".jpg",
-                        ".jpeg",
-                        ".gif",
-                    ]:
-                        continue
-
-                    try:
-                        path_hash = get_unique_id(original_img_file, self.root_dir)
-                        original_images[path_hash] = original_img_file
-                    except ValueError:
-                        continue
-            except Exception as e:
-                logger.warning(f"Error scanning for original images: {e}")
+            project_index = self.get_project_index(project_index)
+            original_images = {  # path_hash -> original_file_path
+                path_hash: original_img_file
+                for original_img_file, path_hash in get_unique_ids(
+                    project_index.get_files(*IMAGE_EXTENSIONS), self.root_dir
+                ).items()
+            }
 
             for lang_code in self.language_codes:
                 translation_dir = self.translations_dir / lang_code
@@ -268,24 +281,9 @@ class DirectoryManager:
 
                 logger.info(f"Checking translated images in: {translation_dir}")
 
-                image_files = []
-                try:
-                    image_files = list(translation_dir.rglob("*"))
-                except Exception as e:
-                    logger.warning(f"Error scanning for image files: {e}")
+                image_files = ProjectIndex(translation_dir).get_files(*IMAGE_EXTENSIONS)
 
                 for image_file in image_files:
-                    if not image_file.is_file():
-                        continue
-
-                    if image_file.suffix.lower() not in [
-                        ".png",
-                        ".jpg",
-                        ".jpeg",
-                        ".gif",
-                    ]:
-                        continue
-
                     try:
                         parts = image_file.name.split(".")
                         if (
@@ -8,7 +8,12 @@ from typing import List, Tuple
 from tqdm import tqdm
 
 from co_op_translator.core.llm.markdown_evaluator import MarkdownEvaluator
-from co_op_translator.utils.common.metadata_utils import extract_metadata_from_content
+from co_op_translator.core.project.translation_state import TranslationState
+from co_op_translator.utils.common.metadata_utils import (
+    extract_metadata_from_content,
+    read_metadata,
+)
+from co_op_translator.utils.common.project_index import ProjectIndex
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +59,7 @@ class ProjectEvaluator:
         self.markdown_evaluator = markdown_evaluator or MarkdownEvaluator.create(
             root_dir=root_dir, use_llm=self.use_llm, use_rule=self.use_rule
         )
+        self.translation_state = TranslationState.for_project(root_dir)
 
     async def evaluate_project(self, language_code: str) -> Tuple[int, int, float]:
         """
@@ -170,6 +176,7 @@ class ProjectEvaluator:
                 if success and evaluation_result:
                     confidence = evaluation_result.get("confidence_score", 0.0)
                     issues = evaluation_result.get("issues", [])
+                    self._record_evaluation(orig_file, language_code, confidence)
 
                     total_confidence += confidence
 
@@ -224,6 +231,7 @@ class ProjectEvaluator:
                 if success and evaluation_result:
                     confidence = evaluation_result.get("confidence_score", 0.0)
                     issues = evaluation_result.get("issues", [])
+                    self._record_evaluation(orig_file, language_code, confidence)
 
                     total_confidence += confidence
 
@@ -277,6 +285,7 @@ class ProjectEvaluator:
                 if success and evaluation_result:
                     confidence = evaluation_result.get("confidence_score", 0.0)
                     issues = evaluation_result.get("issues", [])
+                    self._record_evaluation(orig_file, language_code, confidence)
 
                     total_confidence += confidence
 
@@ -348,14 +357,8 @@ class ProjectEvaluator:
         Returns:
             List of Path objects for all markdown files
         """
-        markdown_files = []
-        for path in self.root_dir.rglob("*.md"):
-            # Skip files in excluded directories
-            if any(excluded in str(path) for excluded in self.excluded_dirs):
-                continue
-            if path.is_file():
-                markdown_files.append(path)
-        return markdown_files
+        # Excluded directories are pruned while walking
+        return ProjectIndex(self.root_dir, self.excluded_dirs).get_files(".md")
 
     def _get_translation_path(self, original_file: Path, language_code: str) -> Path:
         """
@@ -379,12 +382,28 @@ class ProjectEvaluator:
             # Fallback: use original file name in language directory
             return self.translations_dir / language_code / original_file.name
 
+    def _record_evaluation(
+        self, orig_file: Path, language_code: str, confidence: float
+    ) -> None:
+        """Record an evaluation's confidence score in the translation state."""
+        if self.translation_state is None:
+            return
+        try:
+            self.translation_state.record_evaluation(
+                orig_file, language_code, confidence
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record evaluation of {orig_file}: {e}")
+
     async def get_low_confidence_translations(
         self, language_code: str, threshold: float = 0.7
     ) -> List[Tuple[Path, float]]:
         """
         Get a list of translations with confidence scores below a threshold.
 
+        Scores are taken from the translation state, and read from the metadata of
+        translations the state does not record.
+
         Args:
             language_code: Language code to check
             threshold: Confidence score threshold (translations below this will be returned)
@@ -394,17 +413,21 @@ class ProjectEvaluator:
         """
         translation_pairs = await self._get_translation_pairs(language_code)
         low_confidence_translations = []
+        records = (
+            self.translation_state.get_records(language_code)
+            if self.translation_state is not None
+            else {}
+        )
 
-        for _, trans_file in translation_pairs:
+        for orig_file, trans_file in translation_pairs:
+            record = records.get(orig_file)
+            if record is not None and record.translation_path == trans_file:
+                confidence = record.evaluation_score
+                if confidence is not None and confidence < threshold:
+                    low_confidence_translations.append((trans_file, confidence))
+                continue
             try:
-                with open(trans_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                from co_op_translator.utils.common.metadata_utils import (
-                    extract_metadata_from_content,
-                )
-
-                metadata = extract_metadata_from_content(content)
+                metadata = read_metadata(trans_file)
 
                 if metadata and "evaluation" in metadata:
                     confidence = metadata["evaluation"].get("confidence_score", 1.0)
@@ -432,14 +455,7 @@ class ProjectEvaluator:
 
         for _, trans_file in translation_pairs:
             try:
-                with open(trans_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                from co_op_translator.utils.common.metadata_utils import (
-                    extract_metadata_from_content,
-                )
-
-                metadata = extract_metadata_from_content(content)
+                metadata = read_metadata(trans_file)
 
                 if metadata and "evaluation" in metadata:
                     confidence = metadata["evaluation"].get("confidence_score", 1.0)
@@ -471,14 +487,7 @@ class ProjectEvaluator:
 
         for _, trans_file in translation_pairs:
             try:
-                with open(trans_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                from co_op_translator.utils.common.metadata_utils import (
-                    extract_metadata_from_content,
-                )
-
-                metadata = extract_metadata_from_content(content)
+                metadata = read_metadata(trans_file)
 
                 if metadata and "evaluation" in metadata:
                     confidence = metadata["evaluation"].get("confidence_score", 1.0)
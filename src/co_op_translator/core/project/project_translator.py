@@ -13,6 +13,14 @@ from co_op_translator.config.constants import (
     EXCLUDED_DIRS,
     SUPPORTED_IMAGE_EXTENSIONS,
     SUPPORTED_NOTEBOOK_EXTENSIONS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_INITIAL_CONCURRENCY,
+    DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
+    DEFAULT_TEXT_SCORE_THRESHOLD,
+)
+from co_op_translator.utils.common.rate_limiter import RateLimiter
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
 )
 
 from .directory_manager import DirectoryManager
@@ -28,7 +36,19 @@ class ProjectTranslator:
     and tracking of translation status across the project.
     """
 
-    def __init__(self, language_codes, root_dir=".", markdown_only=False):
+    def __init__(
+        self,
+        language_codes,
+        root_dir=".",
+        markdown_only=False,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute=None,
+        tokens_per_minute=None,
+        multi_language=False,
+        incremental=False,
+        image_megapixel_budget=DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
+        text_score_threshold=DEFAULT_TEXT_SCORE_THRESHOLD,
+    ):
         """Initialize project translation environment.
 
         Sets up translators and managers needed for project translation operations.
@@ -37,6 +57,13 @@ class ProjectTranslator:
             language_codes: Space-separated list of target language codes
             root_dir: Root directory of the project to translate
             markdown_only: Whether to process only markdown files and skip images
+            max_concurrency: Maximum number of files and LLM requests in flight at the same time
+            requests_per_minute: LLM request budget per minute (None for unlimited)
+            tokens_per_minute: LLM token budget per minute (None for unlimited)
+            multi_language: Whether to request several target languages per markdown prompt
+            incremental: Whether to retranslate only the changed sections of outdated markdown files
+            image_megapixel_budget: Decoded image megapixels allowed across images translated at once
+            text_score_threshold: Local text score below which images are copied without OCR (0 to always OCR)
         """
         self.language_codes = language_codes.split()
         self.root_dir = Path(root_dir).resolve()
@@ -44,6 +71,13 @@ class ProjectTranslator:
         self.image_dir = self.root_dir / "translated_images"
         self.markdown_only = markdown_only
 
+        # Shared by all LLM translators so budgets apply to the whole run
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.concurrency_controller = AdaptiveConcurrencyController(
+            initial_limit=min(DEFAULT_INITIAL_CONCURRENCY, max_concurrency),
+            max_limit=max_concurrency,
+        )
+
         # Initialize text translator
         self.text_translator = text_translator.TextTranslator.create()
 
@@ -51,7 +85,9 @@ class ProjectTranslator:
         try:
             if not markdown_only:
                 self.image_translator = image_translator.ImageTranslator.create(
-                    default_output_dir=self.image_dir, root_dir=self.root_dir
+                    default_output_dir=self.image_dir,
+                    root_dir=self.root_dir,
+                    text_score_threshold=text_score_threshold,
                 )
             else:
                 logger.info(
@@ -66,11 +102,16 @@ class ProjectTranslator:
             self.image_translator = None
 
         self.markdown_translator = markdown_translator.MarkdownTranslator.create(
-            self.root_dir
+            self.root_dir, self.rate_limiter, self.concurrency_controller
         )
 
-        # Initialize notebook translator
-        self.notebook_translator = JupyterNotebookTranslator.create(self.root_dir)
+        # Initialize notebook translator, sharing the markdown translator and its client
+        self.notebook_translator = JupyterNotebookTranslator.create(
+            self.root_dir,
+            self.rate_limiter,
+            self.concurrency_controller,
+            self.markdown_translator,
+        )
 
         # Initialize directory and translation managers
         self.directory_manager = DirectoryManager(
@@ -88,6 +129,10 @@ class ProjectTranslator:
             self.image_translator,
             self.notebook_translator,
             self.markdown_only,
+            max_concurrency,
+            multi_language,
+            incremental,
+            image_megapixel_budget,
         )
 
     def translate_project(
@@ -119,6 +164,21 @@ class ProjectTranslator:
             )
         )
 
+        if self.markdown_translator.translation_memory is not None:
+            self.markdown_translator.translation_memory.log_stats()
+
+    def rebuild_translation_state(self) -> int:
+        """Regenerate the translation state from the metadata of translated files.
+
+        Returns:
+            Number of translations recorded
+        """
+        translation_state = self.translation_manager.translation_state
+        if translation_state is None:
+            logger.warning("Translation state is not available for this project")
+            return 0
+        return translation_state.rebuild(self.translations_dir, self.language_codes)
+
     async def check_and_retry_translations(self):
         """Check for outdated translations and translate missing content.
 
@@ -218,19 +278,27 @@ class ProjectTranslator:
         files_to_retranslate = []
         errors = []
 
+        translation_state = self.translation_manager.translation_state
         for trans_file_path, confidence in low_confidence_files:
             trans_file = Path(trans_file_path)
 
+            # The recorded source spares reading the translation's metadata
+            record = (
+                translation_state.get_by_translation(trans_file)
+                if translation_state is not None
+                else None
+            )
+            if record is not None and record.source_file.exists():
+                files_to_retranslate.append((record.source_file, confidence))
+                continue
+
             # Extract metadata to get original file path
             try:
-                with open(trans_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
                 from co_op_translator.utils.common.metadata_utils import (
-                    extract_metadata_from_content,
+                    read_metadata,
                 )
 
-                metadata = extract_metadata_from_content(content)
+                metadata = read_metadata(trans_file)
 
                 if metadata and "source_file" in metadata:
                     # Get original file path from metadata
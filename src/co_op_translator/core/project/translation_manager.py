@@ -2,29 +2,52 @@ from pathlib import Path
 import logging
 from typing import List
 from tqdm import tqdm
-import re
-import json
 import os
 import asyncio
 
 from co_op_translator.utils.common.file_utils import (
     read_input_file,
-    filter_files,
     delete_translated_images_by_language_code,
     delete_translated_markdown_files_by_language_code,
     get_filename_and_extension,
     generate_translated_filename,
+    get_unique_ids,
     handle_empty_document,
 )
-from co_op_translator.utils.common.metadata_utils import calculate_file_hash
+from co_op_translator.utils.common.hash_cache import FileHashCache
+from co_op_translator.utils.common.metadata_utils import (
+    calculate_file_hash,
+    read_metadata,
+)
+from co_op_translator.utils.common.project_index import ProjectIndex
 from co_op_translator.core.llm.markdown_translator import MarkdownTranslator
 from co_op_translator.core.llm.jupyter_notebook_translator import (
     JupyterNotebookTranslator,
 )
 from co_op_translator.core.project.directory_manager import DirectoryManager
-from co_op_translator.config.constants import SUPPORTED_IMAGE_EXTENSIONS
-from co_op_translator.utils.common.task_utils import worker
-from co_op_translator.utils.llm.markdown_utils import compare_line_breaks
+from co_op_translator.core.project.translation_state import (
+    EMPTY,
+    FAILED,
+    TRANSLATED,
+    TranslationRecord,
+    TranslationState,
+)
+from co_op_translator.core.vision.image_pipeline import ImagePipeline
+from co_op_translator.config.constants import (
+    SUPPORTED_IMAGE_EXTENSIONS,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_INITIAL_CONCURRENCY,
+    DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
+)
+from co_op_translator.utils.common.task_utils import run_tasks_concurrently
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    PixelBudgetController,
+)
+from co_op_translator.utils.llm.markdown_utils import (
+    TRANSLATION_PROMPT_VERSION,
+    compare_line_breaks,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +72,10 @@ class TranslationManager:
         image_translator=None,
         notebook_translator=None,
         markdown_only: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        multi_language: bool = False,
+        incremental: bool = False,
+        image_megapixel_budget: float = DEFAULT_IMAGE_MEGAPIXEL_BUDGET,
     ):
         """Initialize translation manager with required components and settings.
 
@@ -66,6 +93,10 @@ class TranslationManager:
             image_translator: Translator instance for image files
             notebook_translator: Translator instance for notebook files
             markdown_only: Whether to only translate markdown files
+            max_concurrency: Maximum number of files and images processed at the same time
+            multi_language: Whether to request several target languages per markdown prompt
+            incremental: Whether to retranslate only the changed sections of outdated markdown files
+            image_megapixel_budget: Decoded image megapixels allowed across images translated at once
         """
         self.root_dir = root_dir
         self.translations_dir = translations_dir
@@ -78,9 +109,51 @@ class TranslationManager:
         self.image_translator = image_translator
         self.notebook_translator = notebook_translator
         self.markdown_only = markdown_only
+        self.max_concurrency = max_concurrency
+        self.multi_language = multi_language
+        self.incremental = incremental
+        # Image tasks get their own controller: their latency profile differs from text requests
+        self.image_concurrency_controller = AdaptiveConcurrencyController(
+            initial_limit=min(DEFAULT_INITIAL_CONCURRENCY, max_concurrency),
+            max_limit=max_concurrency,
+        )
+        # Image memory scales with area, so images are admitted by megapixels
+        self.image_pixel_budget = PixelBudgetController(image_megapixel_budget)
+        # OCR and text translation share the concurrency budget; rendering uses all
+        # cores within the pixel budget
+        self.image_pipeline = (
+            ImagePipeline(
+                image_translator,
+                translation_concurrency=max_concurrency,
+                ocr_controller=self.image_concurrency_controller,
+                pixel_budget=self.image_pixel_budget,
+            )
+            if image_translator
+            else None
+        )
+        # Records each written translation so stages need not parse translated files
+        self.translation_state = TranslationState.for_project(root_dir)
         self.directory_manager = DirectoryManager(
-            root_dir, translations_dir, language_codes, excluded_dirs
+            root_dir,
+            translations_dir,
+            language_codes,
+            excluded_dirs,
+            translation_state=self.translation_state,
         )
+        self._project_index = None  # Shared by the stages of a project run
+
+    def get_project_index(self) -> ProjectIndex:
+        """Return the index of the project's source files.
+
+        During `translate_project_async` every stage shares the index built when
+        the run started; otherwise the project is indexed on each call.
+
+        Returns:
+            ProjectIndex of the root directory without the excluded directories
+        """
+        if self._project_index is not None:
+            return self._project_index
+        return ProjectIndex(self.root_dir, self.excluded_dirs)
 
     async def translate_image(
         self, image_path: Path, language_code: str, fast_mode: bool = False
@@ -118,9 +191,12 @@ class TranslationManager:
             return str(image_path)
 
         try:
-            translated_image_path = self.image_translator.translate_image(
-                image_path, language_code, self.image_dir, fast_mode=fast_mode
+            # The pipeline runs OCR and rendering off the event loop and admits
+            # the rendering by the pixel budget shared with the project run
+            results = await self.image_pipeline.run(
+                [(image_path, [language_code])], self.image_dir, fast_mode
             )
+            translated_image_path = results[0][language_code]
             logger.info(
                 f"Translated image {image_path} to {language_code} and saved to {translated_image_path}"
             )
@@ -148,6 +224,7 @@ class TranslationManager:
                 relative_path = file_path.relative_to(self.root_dir)
                 output_file = self.translations_dir / language_code / relative_path
                 handle_empty_document(file_path, output_file)
+                self._record_translation(file_path, language_code, output_file, EMPTY)
                 return str(output_file)
 
             # Perform initial translation attempt
@@ -158,6 +235,7 @@ class TranslationManager:
                 logger.error(
                     f"Translation failed for {file_path}: Empty translation result"
                 )
+                self._record_translation(file_path, language_code, status=FAILED)
                 return ""
 
             # Validate translation format and line break consistency
@@ -171,27 +249,195 @@ class TranslationManager:
                     logger.error(
                         f"Retry translation failed for {file_path}: Empty translation result"
                     )
+                    self._record_translation(file_path, language_code, status=FAILED)
                     return ""
 
+            return self._save_translation(file_path, language_code, translated_content)
+
+        except Exception as e:
+            logger.error(f"Failed to translate {file_path}: {e}")
+            self._record_translation(file_path, language_code, status=FAILED)
+            return ""
+
+    async def translate_markdown_multilingual(
+        self, file_path: Path, language_codes: list[str]
+    ) -> list[str]:
+        """Translate a markdown file to several languages with shared requests.
+
+        Languages whose translation fails the line break check are retranslated
+        individually.
+
+        Args:
+            file_path: Path to the markdown file
+            language_codes: Target language codes
+
+        Returns:
+            Path to the translated file for each language (in order), or an empty
+            string where translation failed
+        """
+        file_path = Path(file_path).resolve()
+        try:
+            document = read_input_file(file_path)
+            if not document:
+                relative_path = file_path.relative_to(self.root_dir)
+                output_files = []
+                for language_code in language_codes:
+                    output_file = self.translations_dir / language_code / relative_path
+                    handle_empty_document(file_path, output_file)
+                    self._record_translation(
+                        file_path, language_code, output_file, EMPTY
+                    )
+                    output_files.append(str(output_file))
+                return output_files
+
+            translations = (
+                await self.markdown_translator.translate_markdown_multilingual(
+                    document,
+                    language_codes,
+                    file_path,
+                    markdown_only=self.markdown_only,
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to translate {file_path}: {e}")
+            for language_code in language_codes:
+                self._record_translation(file_path, language_code, status=FAILED)
+            return [""] * len(language_codes)
+
+        results = []
+        for language_code in language_codes:
+            translated_content = translations.get(language_code)
+            if not translated_content or compare_line_breaks(
+                document, translated_content
+            ):
+                logger.warning(
+                    f"Multi-language translation failed for {file_path} ({language_code}). "
+                    f"Retrying with a single-language request..."
+                )
+                results.append(await self.translate_markdown(file_path, language_code))
+                continue
+            results.append(
+                self._save_translation(file_path, language_code, translated_content)
+            )
+        return results
+
+    async def translate_markdown_incremental(
+        self, file_path: Path, language_code: str
+    ) -> str:
+        """Update an existing markdown translation by retranslating changed sections.
+
+        Falls back to a full translation when there is no existing translation or
+        the result fails the line break check.
+
+        Args:
+            file_path: Path to the markdown file
+            language_code: Target language code
+
+        Returns:
+            Path to translated markdown file if successful, otherwise empty string
+        """
+        file_path = Path(file_path).resolve()
+        try:
             relative_path = file_path.relative_to(self.root_dir)
             translated_path = self.translations_dir / language_code / relative_path
-            translated_path.parent.mkdir(parents=True, exist_ok=True)
-
-            try:
-                with open(translated_path, "w", encoding="utf-8") as f:
-                    f.write(translated_content)
-                logger.info(
-                    f"Translated {file_path} to {language_code} and saved to {translated_path}"
+            document = read_input_file(file_path)
+            if not document or not translated_path.exists():
+                return await self.translate_markdown(file_path, language_code)
+
+            existing_translation = translated_path.read_text(encoding="utf-8")
+            translated_content = (
+                await self.markdown_translator.translate_markdown_incremental(
+                    document,
+                    existing_translation,
+                    language_code,
+                    file_path,
+                    markdown_only=self.markdown_only,
                 )
-                return str(translated_path)
-            except Exception as e:
-                logger.error(f"Failed to write translation to {translated_path}: {e}")
-                return ""
+            )
+        except Exception as e:
+            logger.error(f"Failed to incrementally translate {file_path}: {e}")
+            self._record_translation(file_path, language_code, status=FAILED)
+            return ""
+
+        if not translated_content or compare_line_breaks(document, translated_content):
+            logger.warning(
+                f"Incremental translation failed for {file_path} ({language_code}). "
+                f"Retranslating the whole file..."
+            )
+            return await self.translate_markdown(file_path, language_code)
+
+        return self._save_translation(file_path, language_code, translated_content)
+
+    def _save_translation(
+        self, file_path: Path, language_code: str, translated_content: str
+    ) -> str:
+        """Write translated content next to the other translations for the language.
+
+        Args:
+            file_path: Path to the original file
+            language_code: Target language code
+            translated_content: Content to write
+
+        Returns:
+            Path to the translated file if successful, otherwise empty string
+        """
+        relative_path = file_path.relative_to(self.root_dir)
+        translated_path = self.translations_dir / language_code / relative_path
+        translated_path.parent.mkdir(parents=True, exist_ok=True)
 
+        try:
+            with open(translated_path, "w", encoding="utf-8") as f:
+                f.write(translated_content)
+            logger.info(
+                f"Translated {file_path} to {language_code} and saved to {translated_path}"
+            )
+            self._record_translation(file_path, language_code, translated_path)
+            return str(translated_path)
         except Exception as e:
-            logger.error(f"Failed to translate {file_path}: {e}")
+            logger.error(f"Failed to write translation to {translated_path}: {e}")
+            self._record_translation(file_path, language_code, status=FAILED)
             return ""
 
+    def _record_translation(
+        self,
+        file_path: Path,
+        language_code: str,
+        translated_path: Path | None = None,
+        status: str = TRANSLATED,
+    ):
+        """Record the outcome of translating a file in the translation state.
+
+        Args:
+            file_path: Path to the original file
+            language_code: Target language code
+            translated_path: Path to the translated file (derived if omitted)
+            status: TRANSLATED, EMPTY or FAILED
+        """
+        if self.translation_state is None:
+            return
+        try:
+            if translated_path is None:
+                relative_path = file_path.relative_to(self.root_dir)
+                translated_path = self.translations_dir / language_code / relative_path
+            if status == FAILED:
+                self.translation_state.record_failure(
+                    file_path, language_code, translated_path
+                )
+            else:
+                self.translation_state.record(
+                    file_path,
+                    language_code,
+                    translated_path,
+                    calculate_file_hash(file_path, self.root_dir),
+                    model=str(self.markdown_translator.get_model_name()),
+                    prompt_version=TRANSLATION_PROMPT_VERSION,
+                    status=status,
+                )
+        except Exception as e:
+            logger.warning(
+                f"Failed to record translation state of {file_path} ({language_code}): {e}"
+            )
+
     async def translate_notebook(self, file_path: Path, language_code: str) -> str:
         """Translate a Jupyter notebook file to the specified language.
 
@@ -211,6 +457,7 @@ class TranslationManager:
                 relative_path = file_path.relative_to(self.root_dir)
                 output_file = self.translations_dir / language_code / relative_path
                 handle_empty_document(file_path, output_file)
+                self._record_translation(file_path, language_code, output_file, EMPTY)
                 return str(output_file)
 
             # Perform translation
@@ -221,6 +468,7 @@ class TranslationManager:
                 logger.error(
                     f"Translation failed for {file_path}: Empty translation result"
                 )
+                self._record_translation(file_path, language_code, status=FAILED)
                 return ""
 
             relative_path = file_path.relative_to(self.root_dir)
@@ -233,13 +481,16 @@ class TranslationManager:
                 logger.info(
                     f"Translated {file_path} to {language_code} and saved to {translated_path}"
                 )
+                self._record_translation(file_path, language_code, translated_path)
                 return str(translated_path)
             except Exception as e:
                 logger.error(f"Failed to write translation to {translated_path}: {e}")
+                self._record_translation(file_path, language_code, status=FAILED)
                 return ""
 
         except Exception as e:
             logger.error(f"Failed to translate {file_path}: {e}")
+            self._record_translation(file_path, language_code, status=FAILED)
             return ""
 
     async def translate_all_markdown_files(
@@ -269,7 +520,7 @@ class TranslationManager:
                 )
 
         # Discover markdown files requiring translation
-        markdown_files = filter_files(self.root_dir, self.excluded_dirs)
+        markdown_files = self.get_project_index().get_files(".md")
         tasks = []
         task_info = []  # Store (file_path, language_code) for error reporting
 
@@ -277,6 +528,7 @@ class TranslationManager:
             md_file_path = md_file_path.resolve()
 
             if md_file_path.suffix == ".md":
+                pending_languages = []
                 for language_code in self.language_codes:
                     relative_path = md_file_path.relative_to(self.root_dir)
                     translated_md_path = (
@@ -292,6 +544,19 @@ class TranslationManager:
                     logger.info(
                         f"Translating markdown file: {md_file_path} for language: {language_code}"
                     )
+                    pending_languages.append(language_code)
+
+                if self.multi_language and len(pending_languages) > 1:
+                    # One task translates the file into all pending languages
+                    tasks.append(
+                        lambda md_file_path=md_file_path, language_codes=pending_languages: self.translate_markdown_multilingual(
+                            md_file_path, language_codes
+                        )
+                    )
+                    task_info.append((str(md_file_path), pending_languages))
+                    continue
+
+                for language_code in pending_languages:
                     # Create a task for each markdown file translation
                     tasks.append(
                         lambda md_file_path=md_file_path, language_code=language_code: self.translate_markdown(
@@ -301,16 +566,29 @@ class TranslationManager:
                     task_info.append((str(md_file_path), language_code))
 
         if tasks:  # Check if there are tasks to process
-            # Process translations sequentially to avoid rate limiting
-            results = await self.process_api_requests_sequential(
+            # Process translations concurrently; the translator's rate limiter
+            # keeps request and token usage within the configured budgets
+            results = await self.process_api_requests_concurrent(
                 tasks, "🛠️  Translating markdown files"
             )
+
+            # Flatten multi-language tasks into one result per (file, language)
+            file_results = []
+            for (file_path, lang_codes), result in zip(task_info, results):
+                if isinstance(lang_codes, list):
+                    result = result or [""] * len(lang_codes)
+                    file_results.extend(
+                        ((file_path, code), r) for code, r in zip(lang_codes, result)
+                    )
+                else:
+                    file_results.append(((file_path, lang_codes), result))
+
             modified_count = sum(
-                1 for r in results if r
+                1 for _, r in file_results if r
             )  # Count successful translations
             errors = [
                 f"Failed to translate markdown file: {file_path} (lang: {lang_code})"
-                for (file_path, lang_code), result in zip(task_info, results)
+                for (file_path, lang_code), result in file_results
                 if not result
             ]
         else:
@@ -343,15 +621,14 @@ class TranslationManager:
             for language_code in self.language_codes:
                 # Find and delete translated notebook files
                 translation_dir = self.translations_dir / language_code
-                if translation_dir.exists():
-                    for notebook_file in translation_dir.rglob("*.ipynb"):
-                        notebook_file.unlink()
-                        logger.info(f"Deleted translated notebook: {notebook_file}")
+                for notebook_file in ProjectIndex(translation_dir).get_files(".ipynb"):
+                    notebook_file.unlink()
+                    logger.info(f"Deleted translated notebook: {notebook_file}")
 
         # Discover notebook files requiring translation using supported_notebook_extensions
-        notebook_files = []
-        for ext in self.supported_notebook_extensions:
-            notebook_files.extend(filter_files(self.root_dir, self.excluded_dirs, ext))
+        notebook_files = self.get_project_index().get_files(
+            *self.supported_notebook_extensions
+        )
 
         tasks = []
         task_info = []  # Store (file_path, language_code) for error reporting
@@ -383,8 +660,9 @@ class TranslationManager:
                 task_info.append((str(notebook_file_path), language_code))
 
         if tasks:  # Check if there are tasks to process
-            # Process translations sequentially to avoid rate limiting
-            results = await self.process_api_requests_sequential(
+            # Process translations concurrently; the translator's rate limiter
+            # keeps request and token usage within the configured budgets
+            results = await self.process_api_requests_concurrent(
                 tasks, "📓 Translating notebook files"
             )
             modified_count = sum(
@@ -428,20 +706,26 @@ class TranslationManager:
                 )
 
         # Discover image files requiring translation
-        image_files = filter_files(self.root_dir, self.excluded_dirs)
-        tasks = []
-        task_info = []  # Store (file_path, language_code) for error reporting
+        image_files = self.get_project_index().get_files(
+            *self.supported_image_extensions
+        )
+        image_files = [image_file_path.resolve() for image_file_path in image_files]
+        # Path ids are shared by every language of an image
+        image_ids = get_unique_ids(image_files, self.root_dir)
+        jobs = []  # (image_path, language_codes) for each image to translate
 
         for image_file_path in image_files:
-            image_file_path = image_file_path.resolve()
-
             if (
                 get_filename_and_extension(image_file_path)[1]
                 in self.supported_image_extensions
             ):
+                language_codes = []
                 for language_code in self.language_codes:
                     translated_filename = generate_translated_filename(
-                        image_file_path, language_code, self.root_dir
+                        image_file_path,
+                        language_code,
+                        self.root_dir,
+                        unique_id=image_ids.get(image_file_path),
                     )
                     translated_image_path = Path(self.image_dir) / translated_filename
 
@@ -454,26 +738,43 @@ class TranslationManager:
                     logger.info(
                         f"Translating image: {image_file_path} for language: {language_code}"
                     )
-                    tasks.append(
-                        self.translate_image(
-                            image_file_path, language_code, fast_mode=fast_mode
-                        )
-                    )
-                    task_info.append((str(image_file_path), language_code))
+                    language_codes.append(language_code)
 
-        if tasks:
-            # Process image translations in parallel for efficiency
-            results = await self.process_api_requests_parallel(
-                tasks, f"{'🏎️  (fast mode)' if fast_mode else '🖼️ '} Translating images"
+                if language_codes:
+                    jobs.append((image_file_path, language_codes))
+
+        if jobs and self.image_pipeline is not None:
+            # Hash the images in parallel up front for text detection and OCR caching
+            await asyncio.to_thread(
+                FileHashCache.for_project(self.root_dir).get_hashes,
+                [image_file_path for image_file_path, _ in jobs],
+                "sha256",
             )
-            modified_count = sum(
-                1 for r in results if r != str(image_file_path)
-            )  # Count successful translations
-            errors = [
-                f"Failed to translate image file: {file_path} (lang: {lang_code})"
-                for (file_path, lang_code), result in zip(task_info, results)
-                if result == file_path
-            ]
+
+        if jobs:
+            if self.image_pipeline is None:
+                logger.info(
+                    "Image translation skipped due to missing Computer Vision configuration"
+                )
+                results = [{} for _ in jobs]
+            else:
+                # Each image is recognized and translated once, then rendered per language
+                with tqdm(
+                    total=sum(len(language_codes) for _, language_codes in jobs),
+                    desc=f"{'🏎️  (fast mode)' if fast_mode else '🖼️ '} Translating images",
+                ) as progress_bar:
+                    results = await self.image_pipeline.run(
+                        jobs, self.image_dir, fast_mode, progress_bar
+                    )
+            for (file_path, language_codes), paths in zip(jobs, results):
+                for lang_code in language_codes:
+                    result = paths.get(lang_code)
+                    if result and result != str(file_path):
+                        modified_count += 1  # Count successful translations
+                    else:
+                        errors.append(
+                            f"Failed to translate image file: {file_path} (lang: {lang_code})"
+                        )
         else:
             logger.warning("No image files found for translation.")
 
@@ -482,7 +783,8 @@ class TranslationManager:
     async def check_outdated_files(self, update: bool = False) -> tuple[int, List[str]]:
         """Identify and update outdated translated files based on content hash comparison.
 
-        Retranslates files whose content has changed since last translation.
+        Retranslates files whose content has changed since last translation, as
+        recorded in the translation state or in the translation's metadata.
 
         Args:
             update: Whether to update existing translations regardless of hash values
@@ -494,11 +796,7 @@ class TranslationManager:
         errors = []
 
         # Find all markdown files in root directory
-        markdown_files = [
-            f
-            for f in filter_files(self.root_dir, self.excluded_dirs)
-            if f.suffix.lower() == ".md"
-        ]
+        markdown_files = self.get_project_index().get_files(".md")
 
         # Create progress bar
         with tqdm(total=len(markdown_files) * len(self.language_codes)) as pbar:
@@ -521,44 +819,10 @@ class TranslationManager:
                                 pbar.update(1)
                                 continue
 
-                            # Read target file content and extract metadata
-                            target_content = target_path.read_text(encoding="utf-8")
-
-                            # Create current metadata for comparison
-                            current_metadata = self.markdown_translator.create_metadata(
-                                md_file, lang_code
-                            )
-                            current_hash = current_metadata.get("file_hash")
-
-                            # Extract metadata from the target file using metadata_utils
-                            metadata_match = re.search(
-                                r"<!--\s*translation-metadata\s*(.*?)\s*-->",
-                                target_content,
-                                re.DOTALL,
-                            )
-                            if not metadata_match:
-                                logger.warning(f"No metadata found in {target_path}")
-                                pbar.update(1)
-                                continue
-
-                            try:
-                                stored_metadata = json.loads(metadata_match.group(1))
-                            except json.JSONDecodeError:
-                                logger.warning(f"Invalid metadata in {target_path}")
-                                pbar.update(1)
-                                continue
-
-                            # Get stored hash from metadata
-                            stored_hash = stored_metadata.get("file_hash")
-                            if not stored_hash:
-                                logger.warning(
-                                    f"No file hash in metadata of {target_path}"
-                                )
-                                pbar.update(1)
-                                continue
-
-                            # Compare hashes and retranslate if different
-                            if update or stored_hash != current_hash:
+                            # Compare the source with the recorded translation
+                            if update or self._is_translation_outdated(
+                                md_file, target_path
+                            ):
                                 # Read original content
                                 content = md_file.read_text(encoding="utf-8")
 
@@ -573,6 +837,9 @@ class TranslationManager:
                                 target_path.write_text(
                                     translated_content, encoding="utf-8"
                                 )
+                                self._record_translation(
+                                    md_file, lang_code, target_path
+                                )
                                 modified_count += 1
                                 logger.info(
                                     f"Retranslated {md_file} to {lang_code} due to content changes"
@@ -594,6 +861,22 @@ class TranslationManager:
 
         return modified_count, errors
 
+    async def prepare_disclaimers(self) -> int:
+        """Translate the disclaimers missing from the disclaimer store.
+
+        Returns:
+            Number of disclaimers translated
+        """
+        with tqdm(total=1, desc="📜 Preparing disclaimers") as progress_bar:
+            count = await self.markdown_translator.prepare_disclaimers(
+                self.language_codes
+            )
+            progress_bar.set_postfix_str(
+                "None" if count == 0 else f"Translated: {count}"
+            )
+            progress_bar.update(1)
+        return count
+
     async def translate_project_async(
         self,
         images: bool = False,
@@ -625,11 +908,23 @@ class TranslationManager:
         all_errors = []
 
         try:
+            # Walk the project once; translations are written to excluded directories
+            self._project_index = self.get_project_index()
+            # Hash the sources in parallel once for every stage's change detection
+            if markdown or notebook:
+                await asyncio.to_thread(
+                    FileHashCache.for_project(self.root_dir).get_hashes,
+                    self._project_index.get_files(".md", ".ipynb"),
+                    stats=self._project_index.stats,
+                )
+
             # Clean up files no longer needed in target directories
             logger.info("Removing orphaned files...")
             with tqdm(total=1, desc="🧹 Cleaning orphaned files") as cleanup_progress:
                 removed_count = self.directory_manager.cleanup_orphaned_translations(
-                    markdown=markdown, images=images
+                    markdown=markdown,
+                    images=images,
+                    project_index=self._project_index,
                 )
                 cleanup_progress.set_postfix_str(
                     "None" if removed_count == 0 else f"Removed: {removed_count}"
@@ -639,7 +934,9 @@ class TranslationManager:
             # Create and update directory structure to match source
             logger.info("Synchronizing directory structure...")
             with tqdm(total=1, desc="📁 Synchronizing directories") as sync_progress:
-                created, removed, _ = self.directory_manager.sync_directory_structure()
+                created, removed, _ = self.directory_manager.sync_directory_structure(
+                    project_index=self._project_index
+                )
                 sync_progress.set_postfix_str(
                     "None"
                     if (created == 0 and removed == 0)
@@ -647,6 +944,10 @@ class TranslationManager:
                 )
                 sync_progress.update(1)
 
+            # Translate missing disclaimers once so that no file spends a request on them
+            if markdown or notebook:
+                await self.prepare_disclaimers()
+
             # Find files needing translation due to source changes
             if markdown or notebook:
                 with tqdm(total=1, desc="🔍 Checking translations") as check_progress:
@@ -686,6 +987,8 @@ class TranslationManager:
         except Exception as e:
             logger.error(f"Error during translation: {e}")
             all_errors.append(str(e))
+        finally:
+            self._project_index = None
 
         logger.info(f"Translation completed. Modified {total_modified} files.")
         if all_errors:
@@ -696,22 +999,23 @@ class TranslationManager:
     def get_outdated_translations(self) -> List[tuple[Path, Path]]:
         """Identify translations that need updates based on file hash comparison.
 
-        Scans all translation files and compares their metadata with source files.
+        Scans all translation files and compares their recorded state, or their
+        metadata, with source files.
 
         Returns:
             List of (original_file, translation_file) tuples that need updates
         """
         outdated_files = []
         all_translation_files = []
+        records = {}
 
         for lang_code in self.language_codes:
             translation_dir = self.translations_dir / lang_code
-            if not translation_dir.exists():
-                continue
-            for md_file in translation_dir.rglob("*.md"):
-                all_translation_files.append((lang_code, md_file))
-            for nb_file in translation_dir.rglob("*.ipynb"):
-                all_translation_files.append((lang_code, nb_file))
+            for trans_file in ProjectIndex(translation_dir).get_files(".md", ".ipynb"):
+                all_translation_files.append((lang_code, trans_file))
+            if self.translation_state is not None:
+                # One query per language instead of reading each translation
+                records[lang_code] = self.translation_state.get_records(lang_code)
 
         if not all_translation_files:
             return []
@@ -726,8 +1030,9 @@ class TranslationManager:
                 if not original_file.exists():
                     continue
 
-                # Compare metadata
-                if self._is_translation_outdated(original_file, trans_file):
+                # Compare the recorded state, or the metadata
+                record = records.get(lang_code, {}).get(original_file)
+                if self._is_translation_outdated(original_file, trans_file, record):
                     outdated_files.append((original_file, trans_file))
             except ValueError:
                 logger.warning(f"Error calculating relative path for {trans_file}")
@@ -771,7 +1076,12 @@ class TranslationManager:
             total=len(files_to_translate), desc="🔄 Retranslating outdated files"
         ) as progress_bar:
             for original_file, language_code in files_to_translate:
-                await self.translate_markdown(original_file, language_code)
+                if self.incremental and original_file.suffix.lower() == ".md":
+                    await self.translate_markdown_incremental(
+                        original_file, language_code
+                    )
+                else:
+                    await self.translate_markdown(original_file, language_code)
                 progress_bar.update(1)
                 progress_bar.set_postfix_str(f"Current: {original_file.name}")
 
@@ -790,7 +1100,7 @@ class TranslationManager:
         # Collect all markdown files
         markdown_files = [
             file
-            for file in filter_files(self.root_dir, self.excluded_dirs)
+            for file in self.get_project_index().get_files(".md")
             if file.suffix == ".md"
         ]
         all_markdown_files = [
@@ -869,45 +1179,27 @@ class TranslationManager:
 
         logger.info(f"Total files checked: {total_files_checked}")
 
-    async def process_api_requests_parallel(self, tasks, task_desc) -> list:
-        """Execute multiple API requests concurrently with controlled parallelism.
+    async def process_api_requests_concurrent(self, tasks, task_desc) -> list:
+        """Execute API requests concurrently, bounded by the configured concurrency.
 
-        Uses a queue system to manage API requests efficiently while providing
-        progress feedback.
+        Keeps up to `max_concurrency` tasks in flight while preserving the order
+        of results so they can be matched with their inputs.
 
         Args:
             tasks: List of task functions to execute
             task_desc: Description for progress display
 
         Returns:
-            List of results from completed tasks
+            List of results from completed tasks, in the same order as `tasks`
         """
         if not tasks:  # No tasks to process
             logger.warning("No tasks available for processing.")
             return []
 
-        task_queue = asyncio.Queue()
-
-        # Initialize queue with all translation tasks
-        for task in tasks:
-            task_queue.put_nowait(task)
-
-        # Setup progress tracking UI
         with tqdm(total=len(tasks), desc=task_desc) as progress_bar:
-            # Launch parallel worker tasks for processing
-            workers = [
-                asyncio.create_task(worker(task_queue, progress_bar)) for _ in range(5)
-            ]
-
-            # Wait for all queued tasks to complete
-            await task_queue.join()
-
-            # Get results from completed tasks
-            results = [task.result() for task in workers]
-
-            # Ensure all workers have completed
-            for worker_task in workers:
-                worker_task.cancel()
+            results = await run_tasks_concurrently(
+                tasks, self.max_concurrency, progress_bar
+            )
 
         return results
 
@@ -953,16 +1245,23 @@ class TranslationManager:
         return results
 
     def _is_translation_outdated(
-        self, original_file: Path, translation_file: Path
+        self,
+        original_file: Path,
+        translation_file: Path,
+        record: TranslationRecord | None = None,
     ) -> bool:
         """Determine if a translation file needs updating based on content hash.
 
-        Compares the hash of the original file with the hash stored in the translation
-        file's metadata.
+        Uses the translation state when it records the translation: a source with
+        the recorded size and modification time is unchanged, otherwise its hash
+        is compared with the recorded one. Translations missing from the state are
+        checked against the hash stored in the translation file's metadata, and
+        recorded when current.
 
         Args:
             original_file: Path to the original file
             translation_file: Path to the translation file
+            record: State of the translation, looked up if not given
 
         Returns:
             True if translation needs updating, False if it's current
@@ -971,29 +1270,47 @@ class TranslationManager:
             return True
 
         try:
-            # Extract metadata from translation file
-            content = translation_file.read_text(encoding="utf-8")
-            metadata_match = re.search(
-                r"<!--\s*CO_OP_TRANSLATOR_METADATA:\s*(.*?)\s*-->",
-                content,
-                re.DOTALL,
-            )
-            if not metadata_match:
-                return True
+            language_code = translation_file.relative_to(self.translations_dir).parts[0]
+            if record is None and self.translation_state is not None:
+                record = self.translation_state.get(original_file, language_code)
+            if (
+                record is not None
+                and record.is_written
+                and record.translation_path == translation_file
+            ):
+                stat = original_file.stat()
+                if record.matches_stat(stat):
+                    return False
+                if (
+                    calculate_file_hash(original_file, self.root_dir)
+                    != record.source_hash
+                ):
+                    return True
+                self.translation_state.update_source_stat(
+                    original_file, language_code, stat
+                )
+                return False
 
-            try:
-                metadata = json.loads(metadata_match.group(1))
-            except json.JSONDecodeError:
+            # Read the metadata at the start of the translation file
+            metadata = read_metadata(translation_file)
+            if not metadata:
                 return True
 
             # Determine if content has changed since last translation
-            original_hash = calculate_file_hash(original_file)
+            original_hash = calculate_file_hash(original_file, self.root_dir)
             stored_hash = metadata.get("original_hash")
 
             if not stored_hash:
                 return True
 
-            return stored_hash != original_hash
+            if stored_hash != original_hash:
+                return True
+
+            if self.translation_state is not None:
+                self.translation_state.record(
+                    original_file, language_code, translation_file, stored_hash
+                )
+            return False
 
         except Exception:
             return True
@@ -0,0 +1,356 @@
+"""
+Persistent state of a project's translations.
+
+The state of each (source file, language) pair is recorded in a SQLite
+database under the project's cache directory: the source hash, size and
+modification time, the translation path, the model, the prompt version, the
+status and the latest evaluation score. The database can be rebuilt from the
+metadata embedded in translated files.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from co_op_translator.config.constants import CACHE_DIR_NAME
+from co_op_translator.utils.common.metadata_utils import read_metadata
+from co_op_translator.utils.common.project_index import ProjectIndex
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+TRANSLATION_STATE_FILENAME = "translation_state.sqlite"
+
+TRANSLATED = "translated"
+EMPTY = "empty"  # Empty source copied as it is
+FAILED = "failed"
+
+
+@dataclass
+class TranslationRecord:
+    """Recorded state of the translation of a source file into one language."""
+
+    source_file: Path
+    language_code: str
+    translation_path: Path
+    source_hash: str
+    source_size: int | None
+    source_mtime_ns: int | None
+    model: str
+    prompt_version: str
+    status: str
+    evaluation_score: float | None
+
+    @property
+    def is_written(self) -> bool:
+        """Whether the translation file was written from the recorded source."""
+        return self.status in (TRANSLATED, EMPTY)
+
+    def matches_stat(self, stat) -> bool:
+        """Whether the source still has the recorded size and modification time."""
+        return (
+            self.source_size == stat.st_size
+            and self.source_mtime_ns == stat.st_mtime_ns
+        )
+
+
+class TranslationState:
+    """SQLite-backed record of each source file's translation per language."""
+
+    _COLUMNS = (
+        "source_file, language_code, translation_path, source_hash, source_size, "
+        "source_mtime_ns, model, prompt_version, status, evaluation_score"
+    )
+
+    def __init__(self, path: Path | str, root_dir: Path | str):
+        """Open (or create) the translation state database.
+
+        Args:
+            path: Location of the SQLite file, or ":memory:" for a temporary store
+            root_dir: Root directory that recorded paths are relative to
+        """
+        self.path = path
+        self.root_dir = Path(root_dir)
+        self._lock = threading.Lock()
+
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translations (
+                source_file TEXT NOT NULL,
+                language_code TEXT NOT NULL,
+                translation_path TEXT NOT NULL,
+                source_hash TEXT NOT NULL,
+                source_size INTEGER,
+                source_mtime_ns INTEGER,
+                model TEXT NOT NULL DEFAULT '',
+                prompt_version TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL,
+                evaluation_score REAL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (source_file, language_code)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS translations_path "
+            "ON translations (translation_path)"
+        )
+        self._conn.commit()
+
+    @classmethod
+    def for_project(cls, root_dir: Path | None) -> "TranslationState | None":
+        """Return the shared translation state for a project root.
+
+        Args:
+            root_dir: Root directory of the project
+
+        Returns:
+            TranslationState instance, or None if no root directory is given or
+            the database cannot be opened
+        """
+        if root_dir is None:
+            return None
+        path = (Path(root_dir) / CACHE_DIR_NAME / TRANSLATION_STATE_FILENAME).resolve()
+
+        def create():
+            try:
+                return cls(path, root_dir)
+            except sqlite3.Error as e:
+                logger.warning(f"Translation state disabled, cannot open {path}: {e}")
+                return None
+
+        return get_shared_instance(cls, path, create)
+
+    def _key(self, path: Path | str) -> str:
+        """Return a path relative to the root directory in POSIX form."""
+        path = Path(path)
+        try:
+            return path.relative_to(self.root_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _to_record(self, row) -> TranslationRecord:
+        return TranslationRecord(
+            self.root_dir / row[0],
+            row[1],
+            self.root_dir / row[2],
+            *row[3:],
+        )
+
+    def record(
+        self,
+        source_file: Path,
+        language_code: str,
+        translation_path: Path,
+        source_hash: str,
+        model: str = "",
+        prompt_version: str = "",
+        status: str = TRANSLATED,
+    ):
+        """Record a translation written from the current content of a source file.
+
+        The recorded evaluation score is cleared, as it belonged to the previous
+        translation.
+
+        Args:
+            source_file: Path to the source file
+            language_code: Target language code
+            translation_path: Path to the written translation
+            source_hash: Hash of the source content that was translated
+            model: Model used for translation
+            prompt_version: Version of the translation prompt
+            status: TRANSLATED, or EMPTY for an empty source copied as it is
+        """
+        stat = Path(source_file).stat()
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO translations ({self._COLUMNS}, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?)",
+                (
+                    self._key(source_file),
+                    language_code,
+                    self._key(translation_path),
+                    source_hash,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    model,
+                    prompt_version,
+                    status,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def record_failure(
+        self, source_file: Path, language_code: str, translation_path: Path
+    ):
+        """Mark the translation of a source file as failed.
+
+        The state of an earlier translation is kept, since its file is left as it is.
+
+        Args:
+            source_file: Path to the source file
+            language_code: Target language code
+            translation_path: Path the translation would have been written to
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO translations (source_file, language_code, "
+                "translation_path, source_hash, status, updated_at) "
+                "VALUES (?, ?, ?, '', ?, ?) "
+                "ON CONFLICT (source_file, language_code) "
+                "DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at",
+                (
+                    self._key(source_file),
+                    language_code,
+                    self._key(translation_path),
+                    FAILED,
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+
+    def update_source_stat(self, source_file: Path, language_code: str, stat):
+        """Record the size and modification time of a source found unchanged."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE translations SET source_size = ?, source_mtime_ns = ? "
+                "WHERE source_file = ? AND language_code = ?",
+                (
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    self._key(source_file),
+                    language_code,
+                ),
+            )
+            self._conn.commit()
+
+    def record_evaluation(self, source_file: Path, language_code: str, score: float):
+        """Record the confidence score of a translation's latest evaluation.
+
+        Args:
+            source_file: Path to the source file
+            language_code: Target language code
+            score: Confidence score between 0 and 1
+        """
+        with self._lock:
+            self._conn.execute(
+                "UPDATE translations SET evaluation_score = ?, updated_at = ? "
+                "WHERE source_file = ? AND language_code = ?",
+                (score, time.time(), self._key(source_file), language_code),
+            )
+            self._conn.commit()
+
+    def get(self, source_file: Path, language_code: str) -> TranslationRecord | None:
+        """Return the recorded translation of a source file, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM translations "
+                "WHERE source_file = ? AND language_code = ?",
+                (self._key(source_file), language_code),
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def get_by_translation(self, translation_path: Path) -> TranslationRecord | None:
+        """Return the record of the translation written to a path, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM translations WHERE translation_path = ?",
+                (self._key(translation_path),),
+            ).fetchone()
+        return self._to_record(row) if row else None
+
+    def get_records(self, language_code: str) -> dict[Path, TranslationRecord]:
+        """Return every recorded translation into a language in one query.
+
+        Args:
+            language_code: Target language code
+
+        Returns:
+            Dictionary of records by source file path
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM translations WHERE language_code = ?",
+                (language_code,),
+            ).fetchall()
+        records = (self._to_record(row) for row in rows)
+        return {record.source_file: record for record in records}
+
+    def remove(self, source_file: Path, language_code: str):
+        """Forget the translation of a source file into a language."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM translations WHERE source_file = ? AND language_code = ?",
+                (self._key(source_file), language_code),
+            )
+            self._conn.commit()
+
+    def rebuild(self, translations_dir: Path, language_codes: list[str]) -> int:
+        """Replace the state of the given languages with the embedded metadata.
+
+        Source sizes and modification times are not part of the metadata, so the
+        first check of each rebuilt translation compares content hashes.
+
+        Args:
+            translations_dir: Directory holding a subdirectory per language
+            language_codes: Languages to rebuild
+
+        Returns:
+            Number of translations recorded
+        """
+        rows = []
+        for language_code in language_codes:
+            language_dir = Path(translations_dir) / language_code
+            for translation_file in ProjectIndex(language_dir).get_files(
+                ".md", ".ipynb"
+            ):
+                try:
+                    metadata = read_metadata(translation_file)
+                except OSError as e:
+                    logger.warning(f"Cannot read {translation_file}: {e}")
+                    continue
+                source_file = metadata.get("source_file")
+                source_hash = metadata.get("original_hash")
+                if not source_file or not source_hash:
+                    continue
+                evaluation = metadata.get("evaluation") or {}
+                rows.append(
+                    (
+                        Path(source_file).as_posix(),
+                        metadata.get("language_code", language_code),
+                        self._key(translation_file),
+                        source_hash,
+                        TRANSLATED,
+                        evaluation.get("confidence_score"),
+                        time.time(),
+                    )
+                )
+
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM translations WHERE language_code = ?",
+                [(language_code,) for language_code in language_codes],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (source_file, language_code, "
+                "translation_path, source_hash, status, evaluation_score, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+        logger.info(f"Rebuilt translation state with {len(rows)} translations")
+        return len(rows)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,333 @@
+"""
+Staged pipeline for translating many images.
+
+Each image job (one image and its target languages) goes through three stages
+connected by bounded queues:
+
+1. OCR: the image analysis request runs in a worker thread, with its own
+   concurrency limit (optionally adaptive); it runs once per image
+2. Translation: the line texts are translated into all target languages with
+   batched, awaited LLM requests
+3. Rendering: the CPU-heavy OpenCV/Pillow drawing runs in a process pool sized
+   to the number of cores; the languages of an image are rendered by the same
+   worker from one language-independent render plan, unless there are fewer
+   images than workers, in which case they are split across workers
+
+Network-bound stages therefore keep requests in flight while all cores render,
+and the bounded queues keep a fast stage from piling up work for a slow one.
+
+Rendering memory scales with image area rather than job count, so with a pixel
+budget each render also reserves its image's megapixels: small images render
+in parallel on all workers while a large one waits for room, or runs alone.
+"""
+
+import asyncio
+import contextlib
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from pathlib import Path
+
+from co_op_translator.config.constants import DEFAULT_MAX_CONCURRENCY
+from co_op_translator.core.vision.image_renderer import render_annotated_images
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    PixelBudgetController,
+    get_retry_after,
+    is_throttling_error,
+)
+from co_op_translator.utils.vision.image_utils import get_image_megapixels
+
+logger = logging.getLogger(__name__)
+
+# Items allowed to wait between two stages, per worker of the faster stage
+QUEUE_SIZE_PER_WORKER = 2
+
+
+def split_languages(translations: dict, parts: int) -> list[dict]:
+    """Split the translations of an image into at most `parts` groups of languages.
+
+    Args:
+        translations: Mapping of language code to translated text list
+        parts: Maximum number of groups
+
+    Returns:
+        Non-empty groups of translations, of nearly equal size
+    """
+    items = list(translations.items())
+    parts = max(1, min(parts, len(items)))
+    return [dict(items[i::parts]) for i in range(parts)]
+
+
+class ImagePipeline:
+    """Run image translation jobs through OCR, translation and rendering stages."""
+
+    def __init__(
+        self,
+        image_translator,
+        ocr_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        translation_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        render_workers: int | None = None,
+        queue_size: int | None = None,
+        ocr_controller: AdaptiveConcurrencyController | None = None,
+        render_executor: Executor | None = None,
+        pixel_budget: PixelBudgetController | None = None,
+    ):
+        """Initialize the pipeline.
+
+        Args:
+            image_translator: ImageTranslator providing OCR, text translation and fallbacks
+            ocr_concurrency: Number of OCR requests in flight (upper bound when
+                `ocr_controller` is given)
+            translation_concurrency: Number of text translation requests in flight
+            render_workers: Number of rendering processes, defaults to the number of cores
+            queue_size: Capacity of the queues between stages
+            ocr_controller: Adaptive controller limiting OCR requests, if any
+            render_executor: Executor used for rendering instead of a new process pool
+            pixel_budget: Controller admitting renders by image megapixels, if any
+        """
+        self.image_translator = image_translator
+        self.ocr_controller = ocr_controller
+        self.ocr_concurrency = (
+            ocr_controller.max_limit if ocr_controller else max(1, ocr_concurrency)
+        )
+        self.translation_concurrency = max(1, translation_concurrency)
+        self.render_workers = max(1, render_workers or os.cpu_count() or 1)
+        self.queue_size = queue_size or QUEUE_SIZE_PER_WORKER * max(
+            self.ocr_concurrency, self.translation_concurrency, self.render_workers
+        )
+        self.render_executor = render_executor
+        self.pixel_budget = pixel_budget
+
+    async def run(
+        self,
+        jobs: list[tuple[Path, list[str]]],
+        destination_path=None,
+        fast_mode: bool = False,
+        progress_bar=None,
+    ) -> list[dict[str, str]]:
+        """Translate images and return the output paths of each job.
+
+        Args:
+            jobs: (image_path, language_codes) for each image to translate
+            destination_path: Directory to save the output images (optional)
+            fast_mode: Whether to use faster rendering with slightly lower quality
+            progress_bar: Progress bar updated once per finished language (optional)
+
+        Returns:
+            Mapping of language code to result image path for each job, in the
+            same order as `jobs`. Images without text or failing translation are
+            saved as copies of the original, as in `ImageTranslator.translate_image`.
+        """
+        if not jobs:
+            return []
+
+        results = [{} for _ in jobs]
+        ocr_queue = asyncio.Queue(self.queue_size)
+        translation_queue = asyncio.Queue(self.queue_size)
+        render_queue = asyncio.Queue(self.queue_size)
+
+        executor = self.render_executor
+        owns_executor = executor is None
+        if owns_executor:
+            # Spawned workers do not inherit the threads and sockets of this process
+            executor = ProcessPoolExecutor(
+                max_workers=min(
+                    self.render_workers, sum(len(codes) for _, codes in jobs) or 1
+                ),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        # With fewer images than workers, idle workers take part of the languages
+        render_splits = max(1, self.render_workers // len(jobs))
+
+        def finish(index, language_code, path):
+            results[index][language_code] = path
+            if progress_bar:
+                progress_bar.update(1)
+
+        async def fail(index, image_path, language_codes, error):
+            for language_code in language_codes:
+                try:
+                    path = await asyncio.to_thread(
+                        self.image_translator._save_failed_image,
+                        image_path,
+                        language_code,
+                        error,
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to save original image {image_path}: {e}")
+                    path = str(image_path)
+                finish(index, language_code, path)
+
+        async def recognize(item):
+            index, image_path, language_codes = item
+            try:
+                # Images ruled out by the local text detector skip OCR
+                has_text = await asyncio.to_thread(
+                    self.image_translator.has_text, image_path
+                )
+                line_bounding_boxes = (
+                    await self._extract_line_bounding_boxes(image_path)
+                    if has_text
+                    else []
+                )
+                if not line_bounding_boxes:
+                    for language_code in language_codes:
+                        path = await asyncio.to_thread(
+                            self.image_translator._save_untranslated_image,
+                            image_path,
+                            language_code,
+                            destination_path,
+                        )
+                        finish(index, language_code, path)
+                    return
+            except Exception as e:
+                await fail(index, image_path, language_codes, e)
+                return
+            await translation_queue.put(
+                (index, image_path, language_codes, line_bounding_boxes)
+            )
+
+        async def translate(item):
+            index, image_path, language_codes, line_bounding_boxes = item
+            text_translator = self.image_translator.text_translator
+            try:
+                text_data = [line["text"] for line in line_bounding_boxes]
+                translations = (
+                    await text_translator.translate_image_text_multilingual_async(
+                        text_data, language_codes
+                    )
+                )
+            except Exception as e:
+                await fail(index, image_path, language_codes, e)
+                return
+            await render_queue.put(
+                (index, image_path, line_bounding_boxes, translations)
+            )
+
+        async def render_group(image_path, line_bounding_boxes, translations):
+            async with self._reserve_pixels(image_path):
+                return await loop.run_in_executor(
+                    executor,
+                    render_annotated_images,
+                    self.image_translator.root_dir,
+                    image_path,
+                    line_bounding_boxes,
+                    translations,
+                    destination_path,
+                    fast_mode,
+                )
+
+        async def render(item):
+            index, image_path, line_bounding_boxes, translations = item
+            groups = split_languages(translations, render_splits)
+            group_results = await asyncio.gather(
+                *(
+                    render_group(image_path, line_bounding_boxes, group)
+                    for group in groups
+                ),
+                return_exceptions=True,
+            )
+            for group, result in zip(groups, group_results):
+                if isinstance(result, Exception):
+                    await fail(index, image_path, list(group), result)
+                    continue
+                paths, errors = result
+                for language_code, path in paths.items():
+                    finish(index, language_code, path)
+                for language_code, error in errors.items():
+                    await fail(index, image_path, [language_code], error)
+
+        async def produce():
+            for index, (image_path, language_codes) in enumerate(jobs):
+                await ocr_queue.put((index, Path(image_path), list(language_codes)))
+            for _ in range(self.ocr_concurrency):
+                await ocr_queue.put(None)
+
+        try:
+            await asyncio.gather(
+                produce(),
+                self._run_stage(
+                    ocr_queue,
+                    recognize,
+                    self.ocr_concurrency,
+                    translation_queue,
+                    self.translation_concurrency,
+                ),
+                self._run_stage(
+                    translation_queue,
+                    translate,
+                    self.translation_concurrency,
+                    render_queue,
+                    self.render_workers,
+                ),
+                self._run_stage(render_queue, render, self.render_workers),
+            )
+        finally:
+            if owns_executor:
+                executor.shutdown(cancel_futures=True)
+
+        if self.pixel_budget:
+            logger.info(self.pixel_budget.report())
+        return results
+
+    @contextlib.asynccontextmanager
+    async def _reserve_pixels(self, image_path: Path):
+        """Hold the image's megapixels in the pixel budget, if any, while rendering."""
+        if self.pixel_budget is None:
+            yield
+            return
+        megapixels = await asyncio.to_thread(get_image_megapixels, image_path)
+        async with self.pixel_budget.reserve(megapixels):
+            yield
+
+    async def _extract_line_bounding_boxes(self, image_path: Path):
+        """Run OCR in a worker thread, within the OCR concurrency controller if any."""
+        if self.ocr_controller is None:
+            return await asyncio.to_thread(
+                self.image_translator.extract_line_bounding_boxes, image_path
+            )
+
+        async with self.ocr_controller.slot():
+            start_time = time.monotonic()
+            try:
+                result = await asyncio.to_thread(
+                    self.image_translator.extract_line_bounding_boxes, image_path
+                )
+            except Exception as e:
+                if is_throttling_error(e):
+                    self.ocr_controller.record_throttle(get_retry_after(e))
+                raise
+            self.ocr_controller.record_success(time.monotonic() - start_time)
+            return result
+
+    @staticmethod
+    async def _run_stage(
+        queue: asyncio.Queue,
+        handle,
+        workers: int,
+        next_queue: asyncio.Queue | None = None,
+        next_workers: int = 0,
+    ):
+        """Process queue items with a fixed number of workers until each gets a sentinel.
+
+        Once every worker has stopped, one sentinel per worker of the next stage
+        is put on `next_queue`.
+        """
+
+        async def work():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                try:
+                    await handle(item)
+                except Exception as e:
+                    logger.error(f"Error processing image job: {e}")
+
+        await asyncio.gather(*(work() for _ in range(workers)))
+        for _ in range(next_workers):
+            await next_queue.put(None)
@@ -0,0 +1,622 @@
+"""
+Rendering of translated text onto images.
+
+The renderer only needs the font configuration and the project root, so unlike
+the translators it holds no API clients and can run in worker processes of the
+image pipeline.
+
+Rendering is split in two parts. The render plan holds everything that does
+not depend on the target language: the decoded image with every text region
+erased (filled with its background color), the colors and geometry of each
+line and their grouping into paragraphs. It is computed once per image and
+reused, so that each language only draws its text layer.
+
+Images above `ImageRenderer.TILED_THRESHOLD_MEGAPIXELS` are rendered in tiles:
+full-width strips of at most `TILE_MEGAPIXELS`. The plan then keeps the decoded
+image in its own mode rather than an RGBA copy, only strips crossed by a text
+line are converted to RGBA and drawn on, and strips are written to the output
+as they are finished, so the working memory stays bounded by the tile size.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from math import hypot
+from pathlib import Path
+
+import arabic_reshaper
+import numpy as np
+from bidi.algorithm import get_display
+from PIL import Image, ImageDraw
+from tqdm import tqdm
+
+from co_op_translator.config.constants import RGB_IMAGE_EXTENSIONS
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision.text_fitter import TextFitter
+from co_op_translator.utils.common.file_utils import generate_translated_filename
+from co_op_translator.utils.vision.image_utils import (
+    PngStreamWriter,
+    adjust_bg_colors,
+    draw_text_on_image,
+    get_dominant_colors,
+    get_image_mode,
+    get_text_colors,
+    group_bounding_boxes,
+    pad_text_image_to_target_aspect,
+    warp_image_to_bounding_box_region,
+)
+
+logger = logging.getLogger(__name__)
+
+NEAT_FONT_SIZE = 40  # Neat mode draws text at this size and warps it onto the box
+
+
+@dataclass
+class LinePlan:
+    """Language-independent rendering data of one text line."""
+
+    index: int  # Position of the line's translation in the translated text list
+    group_size: int  # Number of lines in the line's paragraph
+    bounding_box: list  # Flat [x0, y0, ..., x3, y3] polygon
+    bg_color: tuple  # Fill color erasing the original text
+    text_color: tuple  # Color contrasting with the fill
+    box_width: float  # Length of the top edge
+    box_height: float  # Length of the right edge
+    angle: float  # Rotation of the top edge in degrees, counter-clockwise
+    target_aspect: float  # Width/height ratio of the warped text (neat mode)
+
+
+@dataclass
+class RenderPlan:
+    """Language-independent rendering data of one image."""
+
+    canvas: Image.Image  # Image with every text line erased, RGBA unless tiled
+    lines: list  # LinePlan for each valid line, in translation order
+    tile_height: int = 0  # Rows per tile when rendered in tiles, 0 otherwise
+
+
+class ImageRenderer:
+    """Draw translated text lines over the original text regions of an image."""
+
+    RENDER_PLAN_CACHE_SIZE = 4  # Render plans (decoded images) kept in memory
+    RENDER_PLAN_CACHE_MEGAPIXELS = 100  # Pixels of cached plans beyond the newest
+    TILED_THRESHOLD_MEGAPIXELS = 40  # Larger images are rendered in tiles
+    TILE_MEGAPIXELS = 4  # Working memory ceiling of tiled rendering
+
+    def __init__(
+        self,
+        root_dir=".",
+        tile_megapixels: float = None,
+        tiled_threshold_megapixels: float = None,
+    ):
+        """Initialize the renderer.
+
+        Args:
+            root_dir: Root directory of the project for path calculations
+            tile_megapixels: Size of the tiles of tiled rendering (default: TILE_MEGAPIXELS)
+            tiled_threshold_megapixels: Image size above which rendering is tiled
+                (default: TILED_THRESHOLD_MEGAPIXELS)
+        """
+        self.font_config = FontConfig()
+        self.root_dir = Path(root_dir)
+        self.tile_megapixels = tile_megapixels or self.TILE_MEGAPIXELS
+        self.tiled_threshold_megapixels = (
+            tiled_threshold_megapixels or self.TILED_THRESHOLD_MEGAPIXELS
+        )
+        self._render_plans = OrderedDict()
+
+    def get_render_plan(self, image_path, line_bounding_boxes) -> RenderPlan:
+        """Return the render plan of an image, reusing it for further languages.
+
+        Plans are cached by image path, modification time, size and detected
+        lines, keeping the `RENDER_PLAN_CACHE_SIZE` most recently used as long as
+        they hold no more than `RENDER_PLAN_CACHE_MEGAPIXELS` besides the newest.
+
+        Args:
+            image_path: Path to the image file
+            line_bounding_boxes: List of detected text regions with coordinates
+
+        Returns:
+            RenderPlan of the image
+        """
+        stat = Path(image_path).stat()
+        key = (
+            str(Path(image_path).resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            hashlib.sha256(
+                json.dumps(line_bounding_boxes, sort_keys=True).encode("utf-8")
+            ).hexdigest(),
+        )
+        if key in self._render_plans:
+            self._render_plans.move_to_end(key)
+            return self._render_plans[key]
+
+        plan = self.build_render_plan(image_path, line_bounding_boxes)
+        self._render_plans[key] = plan
+        while len(self._render_plans) > 1 and (
+            len(self._render_plans) > self.RENDER_PLAN_CACHE_SIZE
+            or sum(
+                cached.canvas.width * cached.canvas.height
+                for cached in self._render_plans.values()
+            )
+            - plan.canvas.width * plan.canvas.height
+            > self.RENDER_PLAN_CACHE_MEGAPIXELS * 1_000_000
+        ):
+            self._render_plans.popitem(last=False)
+        return plan
+
+    def clear_render_plans(self):
+        """Drop all cached render plans and the decoded images they hold."""
+        self._render_plans.clear()
+
+    def build_render_plan(self, image_path, line_bounding_boxes) -> RenderPlan:
+        """Decode an image, erase its text lines and compute their geometry and colors.
+
+        Args:
+            image_path: Path to the image file
+            line_bounding_boxes: List of detected text regions with coordinates
+
+        Returns:
+            RenderPlan of the image
+        """
+        start_time = time.time()
+        mode = get_image_mode(image_path)
+        canvas = Image.open(image_path)
+        tile_height = 0
+        if canvas.width * canvas.height > self.tiled_threshold_megapixels * 1_000_000:
+            tile_height = max(1, int(self.tile_megapixels * 1_000_000 // canvas.width))
+            # Keep the decoded image in its own mode, without a full-size RGBA copy
+            canvas.load()
+            if canvas.mode != mode:
+                canvas = canvas.convert(mode)
+        else:
+            canvas = canvas.convert(mode).convert("RGBA")
+
+        geometries = []
+        index = 0
+        # Group bounding boxes into paragraphs; translations follow the same order
+        for group in group_bounding_boxes(line_bounding_boxes):
+            for line_info in group:
+                geometry = self._get_line_geometry(image_path, line_info)
+                if geometry is not None:
+                    geometries.append((index, len(group), geometry))
+                index += 1
+
+        # Colors of all lines at once, from the image before any line is erased
+        boxes = np.array(
+            [geometry["bounding_box"] for _, _, geometry in geometries],
+            dtype=np.float64,
+        ).reshape(-1, 8)
+        bg_colors = adjust_bg_colors(
+            self._get_dominant_colors(canvas, boxes, tile_height or canvas.height)
+        )
+        text_colors = get_text_colors(bg_colors)
+
+        draw = ImageDraw.Draw(canvas)
+        lines = []
+        for (index, group_size, geometry), bg_color, text_color in zip(
+            geometries, bg_colors.tolist(), text_colors.tolist()
+        ):
+            line = LinePlan(
+                index=index,
+                group_size=group_size,
+                bg_color=tuple(bg_color),
+                text_color=tuple(text_color),
+                **geometry,
+            )
+            draw.polygon(
+                list(zip(line.bounding_box[::2], line.bounding_box[1::2])),
+                fill=line.bg_color,
+            )
+            lines.append(line)
+
+        logger.info(
+            f"Built render plan with {len(lines)} lines in {time.time() - start_time:.4f} seconds for {image_path}"
+        )
+        return RenderPlan(canvas=canvas, lines=lines, tile_height=tile_height)
+
+    @staticmethod
+    def _get_dominant_colors(canvas, boxes, tile_height):
+        """Get the dominant colors of boxes, converting one strip of the canvas at a time.
+
+        Boxes are assigned to the strip containing their top edge, and the strip
+        is extended down to the bottom of its lowest box.
+        """
+        if tile_height >= canvas.height:
+            return get_dominant_colors(np.asarray(canvas), boxes)
+
+        colors = np.zeros((len(boxes), 3), dtype=np.uint8)
+        tops = np.clip(np.floor(boxes[:, 1::2].min(axis=1)), 0, None)
+        bottoms = np.ceil(boxes[:, 1::2].max(axis=1))
+        for top in range(0, canvas.height, tile_height):
+            in_strip = (tops >= top) & (tops < top + tile_height)
+            if top + tile_height >= canvas.height:
+                in_strip |= tops >= canvas.height
+            if not in_strip.any():
+                continue
+            bottom = int(min(canvas.height, max(top + 1, bottoms[in_strip].max())))
+            strip = np.asarray(canvas.crop((0, top, canvas.width, bottom)))
+            strip_boxes = boxes[in_strip].copy()
+            strip_boxes[:, 1::2] -= top
+            colors[in_strip] = get_dominant_colors(strip, strip_boxes)
+        return colors
+
+    def _get_line_geometry(self, image_path, line_info):
+        """Compute the geometry of a line, or None if its box is invalid."""
+        bounding_box = line_info.get("bounding_box", [])
+        if len(bounding_box) != 8:
+            logger.error(
+                f"Invalid text detection data in image '{Path(image_path).name}': "
+                f"Expected 8 coordinates but got {len(bounding_box)}. "
+                f"The text detection may be corrupted."
+            )
+            return None
+
+        try:
+            p0, p1, p2, p3 = zip(bounding_box[::2], bounding_box[1::2])
+            box_width = hypot(p1[0] - p0[0], p1[1] - p0[1])
+            box_height = hypot(p2[0] - p1[0], p2[1] - p1[1])
+            angle = -math.degrees(math.atan2(p1[1] - p0[1], p1[0] - p0[0]))
+        except (TypeError, ValueError):
+            logger.error(
+                f"Invalid bounding box coordinates in image '{Path(image_path).name}': "
+                f"Text detection geometry is malformed. The image may have distorted text regions."
+            )
+            return None
+
+        pts = np.array(bounding_box, dtype=np.float32).reshape(4, 2)
+        max_width = max(
+            np.linalg.norm(pts[0] - pts[1]), np.linalg.norm(pts[2] - pts[3])
+        )
+        max_height = max(
+            np.linalg.norm(pts[0] - pts[3]), np.linalg.norm(pts[1] - pts[2])
+        )
+        return {
+            "bounding_box": list(bounding_box),
+            "box_width": box_width,
+            "box_height": box_height,
+            "angle": angle,
+            "target_aspect": max_width / max_height if max_height != 0 else 1,
+        }
+
+    def plot_annotated_image(
+        self,
+        image_path,
+        line_bounding_boxes,
+        translated_text_list,
+        target_language_code,
+        destination_path=None,
+        verbose=False,
+        fast_mode=False,
+    ):
+        """Render translated text onto original image at appropriate positions.
+
+        Uses either a fast or high-quality ("neat") rendering approach based on the
+        fast_mode parameter. Handles text orientation, RTL languages, and maintains
+        visual context.
+
+        Args:
+            image_path: Path to the image file
+            line_bounding_boxes: List of detected text regions with coordinates
+            translated_text_list: List of translated texts corresponding to each region
+            target_language_code: Language code determining font and text direction
+            destination_path: Directory to save the output image (optional)
+            verbose: Whether to display processing progress
+            fast_mode: Whether to use faster rendering (3x faster but less precise)
+
+        Returns:
+            Path to the annotated image with translated text
+        """
+        style = "fast" if fast_mode else "neat"
+        logger.info("=" * 50)
+        logger.info(f"Starting annotation ({style} mode) for image: {image_path} ")
+        rtl = self.font_config.is_rtl(target_language_code)
+
+        # Apply RTL language-specific text processing for Arabic, Hebrew, etc.
+        processed_text_list = []
+        try:
+            # Import these libraries only when needed
+            if target_language_code in ["ar", "fa", "ur", "he"]:
+                for text in translated_text_list:
+                    # Reshape Arabic text
+                    reshaped_text = arabic_reshaper.reshape(text)
+                    # Handle bidirectional text
+                    bidi_text = get_display(reshaped_text)
+                    processed_text_list.append(bidi_text)
+
+                logger.info(
+                    f"Applied Arabic reshaping and bidirectional processing for {target_language_code}"
+                )
+            else:
+                processed_text_list = translated_text_list
+        except ImportError:
+            logger.warning(
+                "Arabic reshaper or python-bidi not installed. Using original text."
+            )
+            processed_text_list = translated_text_list
+
+        logger.debug(f"Translated text: {processed_text_list}")
+
+        # Generate output path
+        actual_image_path = Path(image_path).resolve()
+        new_filename = generate_translated_filename(
+            actual_image_path, target_language_code, self.root_dir
+        )
+        base_dir = "./translated_images_fast/" if fast_mode else "./translated_images/"
+        dest = Path(destination_path) if destination_path else Path(base_dir)
+        dest.mkdir(parents=True, exist_ok=True)
+        output_path = dest / new_filename
+
+        plan = self.get_render_plan(image_path, line_bounding_boxes)
+        # Only the text layer depends on the language
+        lines = [line for line in plan.lines if line.index < len(processed_text_list)]
+        font_path = self.font_config.get_font_path(target_language_code)
+        draw_text = self._draw_text_fast if fast_mode else self._draw_text_neat
+        # Convert to RGB for file formats that don't support transparency
+        output_mode = (
+            "RGB" if output_path.suffix.lower() in RGB_IMAGE_EXTENSIONS else "RGBA"
+        )
+
+        start_time = time.time()
+        if plan.tile_height:
+            self._render_tiles(
+                plan,
+                lines,
+                processed_text_list,
+                draw_text,
+                font_path,
+                rtl,
+                output_path,
+                output_mode,
+                verbose,
+            )
+        else:
+            image = plan.canvas.copy()
+            if verbose:
+                lines = tqdm(lines, desc=f"Processing lines ({style})")
+            draw_text(image, lines, processed_text_list, font_path, rtl)
+            image.convert(output_mode).save(output_path)
+        elapsed_time = time.time() - start_time
+        logger.info(
+            f"Total time taken to plot annotated image ({style.capitalize()} Mode): {elapsed_time:.4f} seconds for {image_path}"
+        )
+
+        logger.info(f"Annotated image saved to {output_path}")
+        return str(output_path)
+
+    @staticmethod
+    def _get_alignment(line: LinePlan, rtl: bool) -> str:
+        """Center single lines; align paragraph lines with the text direction."""
+        if line.group_size == 1:
+            return "center"
+        return "right" if rtl else "left"
+
+    @staticmethod
+    def _get_line_span(line: LinePlan) -> tuple:
+        """Rows that drawing a line's text may touch, as (top, bottom) bounds."""
+        ys = line.bounding_box[1::2]
+        center_y = (min(ys) + max(ys)) / 2
+        # The fast mode's rotated text layer can reach half its diagonal from the center
+        reach = max((max(ys) - min(ys)) / 2, hypot(line.box_width, line.box_height) / 2)
+        return math.floor(center_y - reach) - 2, math.ceil(center_y + reach) + 2
+
+    def _render_tiles(
+        self,
+        plan,
+        lines,
+        text_list,
+        draw_text,
+        font_path,
+        rtl,
+        output_path,
+        output_mode,
+        verbose=False,
+    ):
+        """Draw and write an image one full-width strip at a time.
+
+        Only strips crossed by a line are converted to RGBA and drawn on. PNG
+        strips are streamed to the file; JPEG has no incremental encoder in
+        Pillow, so strips are assembled into an RGB image saved at the end.
+        """
+        canvas = plan.canvas
+        spans = [self._get_line_span(line) for line in lines]
+        tops = range(0, canvas.height, plan.tile_height)
+        if verbose:
+            tops = tqdm(tops, desc="Processing tiles")
+
+        if output_mode == "RGBA":
+            writer = PngStreamWriter(output_path, canvas.width, canvas.height)
+            output = None
+        else:
+            writer = None
+            output = Image.new(output_mode, canvas.size)
+
+        with writer or contextlib.nullcontext():
+            for top in tops:
+                bottom = min(top + plan.tile_height, canvas.height)
+                tile = canvas.crop((0, top, canvas.width, bottom))
+                tile_lines = [
+                    line
+                    for line, (line_top, line_bottom) in zip(lines, spans)
+                    if line_top < bottom and line_bottom > top
+                ]
+                if tile_lines:
+                    tile = tile.convert("RGBA")
+                    draw_text(
+                        tile, tile_lines, text_list, font_path, rtl, origin=(0, top)
+                    )
+                if writer:
+                    writer.write(tile)
+                else:
+                    output.paste(tile.convert(output_mode), (0, top))
+        if output is not None:
+            output.save(output_path)
+
+    def _draw_text_fast(self, image, lines, text_list, font_path, rtl, origin=(0, 0)):
+        """Draw each line's text at the size fitting its box, rotated and pasted over the canvas.
+
+        `origin` is the position of `image` in the full image, for drawing on a tile.
+        """
+        fitter = TextFitter.for_font(font_path)
+
+        for line in lines:
+            translated_text = text_list[line.index]
+            alignment = self._get_alignment(line, rtl)
+            fitted = fitter.fit(
+                translated_text, line.box_width * 0.90, line.box_height * 0.95
+            )
+
+            # Draw the text on a transparent layer the size of the (unrotated) box
+            layer_width = max(1, int(round(line.box_width)))
+            layer_height = max(1, int(round(line.box_height)))
+            text_img = Image.new(
+                "RGBA", (layer_width, layer_height), (255, 255, 255, 0)
+            )
+            offset_y = (layer_height - fitted.height) // 2
+            if alignment == "center":
+                offset_x = (layer_width - fitted.width) // 2
+            elif alignment == "right":
+                offset_x = layer_width - fitted.width - 10
+            else:
+                offset_x = 10
+
+            ImageDraw.Draw(text_img).text(
+                (offset_x - fitted.left, offset_y - fitted.top),
+                translated_text,
+                font=fitted.font,
+                fill=line.text_color,
+                anchor="la",
+            )
+
+            rotated_text_img = text_img.rotate(line.angle, expand=True)
+            xs = line.bounding_box[::2]
+            ys = line.bounding_box[1::2]
+            center_x = (min(xs) + max(xs)) / 2
+            center_y = (min(ys) + max(ys)) / 2
+            paste_x = int(center_x - rotated_text_img.width / 2) - origin[0]
+            paste_y = int(center_y - rotated_text_img.height / 2) - origin[1]
+
+            # Paste rotated text using its own alpha channel as mask.
+            image.paste(rotated_text_img, (paste_x, paste_y), rotated_text_img)
+
+    def _draw_text_neat(self, image, lines, text_list, font_path, rtl, origin=(0, 0)):
+        """Draw each line's text, warp it onto its box region and blend it into the canvas.
+
+        `origin` is the position of `image` in the full image, for drawing on a tile.
+        """
+        font = TextFitter.for_font(font_path).get_font(NEAT_FONT_SIZE)
+
+        for line in lines:
+            text_image = draw_text_on_image(
+                text_list[line.index], font, line.text_color
+            )
+            padded_text_image = pad_text_image_to_target_aspect(
+                np.array(text_image),
+                line.target_aspect,
+                self._get_alignment(line, rtl),
+            )
+            bounding_box = [
+                coordinate - origin[i % 2]
+                for i, coordinate in enumerate(line.bounding_box)
+            ]
+            warped_text_image, offset = warp_image_to_bounding_box_region(
+                padded_text_image, bounding_box, image.width, image.height
+            )
+            if warped_text_image is not None:
+                image.alpha_composite(Image.fromarray(warped_text_image), dest=offset)
+
+    def render_languages(
+        self,
+        image_path,
+        line_bounding_boxes,
+        translations: dict,
+        destination_path=None,
+        fast_mode=False,
+    ) -> tuple[dict, dict]:
+        """Render an image for several languages from one render plan.
+
+        A language that fails to render does not stop the others.
+
+        Args:
+            image_path: Path to the image file
+            line_bounding_boxes: List of detected text regions with coordinates
+            translations: Mapping of language code to translated text list
+            destination_path: Directory to save the output images (optional)
+            fast_mode: Whether to use faster rendering
+
+        Returns:
+            Tuple of (mapping of language code to the annotated image path,
+            mapping of language code to the error message of failed languages)
+        """
+        paths = {}
+        errors = {}
+        for language_code, translated_text_list in translations.items():
+            try:
+                paths[language_code] = self.plot_annotated_image(
+                    image_path,
+                    line_bounding_boxes,
+                    translated_text_list,
+                    language_code,
+                    destination_path,
+                    fast_mode=fast_mode,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to render {language_code} for {Path(image_path).name}: {e}"
+                )
+                # Messages rather than exceptions, which may not pickle
+                errors[language_code] = str(e)
+        return paths, errors
+
+
+# Renderers of the current worker process, by project root
+_process_renderers = {}
+
+
+def get_process_renderer(root_dir) -> ImageRenderer:
+    """Return the renderer of the current process for a project root."""
+    key = str(root_dir)
+    if key not in _process_renderers:
+        _process_renderers[key] = ImageRenderer(root_dir)
+    return _process_renderers[key]
+
+
+def render_annotated_images(
+    root_dir,
+    image_path,
+    line_bounding_boxes,
+    translations,
+    destination_path=None,
+    fast_mode=False,
+):
+    """Render an image for several languages, sharing one render plan.
+
+    Module-level so that it can be submitted to a process pool. All languages
+    are rendered here, so the plan is dropped afterwards: an idle worker holds
+    no decoded image, which keeps memory in line with the pipeline's pixel budget.
+
+    Args:
+        root_dir: Root directory of the project for path calculations
+        image_path: Path to the image file
+        line_bounding_boxes: List of detected text regions with coordinates
+        translations: Mapping of language code to translated text list
+        destination_path: Directory to save the output images (optional)
+        fast_mode: Whether to use faster rendering
+
+    Returns:
+        Tuple of (mapping of language code to the annotated image path,
+        mapping of language code to the error message of failed languages)
+    """
+    renderer = get_process_renderer(root_dir)
+    try:
+        return renderer.render_languages(
+            image_path, line_bounding_boxes, translations, destination_path, fast_mode
+        )
+    finally:
+        renderer.clear_render_plans()
@@ -0,0 +1,149 @@
+"""
+On-disk cache of OCR results.
+
+Every target language of an image needs the same text lines, and an unchanged
+image gives the same lines on the next run. OCR output is therefore stored in
+the project's cache directory, in the JSON format of `save_bounding_boxes`,
+keyed by the hash of the image content and of the OCR settings.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from co_op_translator.config.constants import CACHE_DIR_NAME
+from co_op_translator.utils.common.hash_cache import FileHashCache
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+from co_op_translator.utils.vision.image_utils import (
+    load_bounding_boxes,
+    save_bounding_boxes,
+)
+
+logger = logging.getLogger(__name__)
+
+OCR_CACHE_DIRNAME = "ocr"
+
+
+def get_image_content_hash(image_path, hash_cache: FileHashCache = None) -> str:
+    """Return the SHA-256 hex digest of an image file's bytes.
+
+    Args:
+        image_path: Path to the image file
+        hash_cache: Cache memoizing the hash (default: the in-memory cache)
+
+    Returns:
+        Hex digest of the image content
+    """
+    hash_cache = hash_cache or FileHashCache.for_project(None)
+    return hash_cache.get_hash(image_path, "sha256")
+
+
+class OcrCache:
+    """Directory of OCR results, one JSON file per (image content, OCR settings).
+
+    Caches are shared per directory. Concurrent lookups of the same key wait
+    for the first one, so an image is only recognized once per process even
+    when all of its languages are translated at the same time.
+    """
+
+    def __init__(self, cache_dir: Path, hash_cache: FileHashCache = None):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cached OCR results
+            hash_cache: Cache memoizing image content hashes (default: in memory)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.hash_cache = hash_cache
+        self.hits = 0
+        self.misses = 0
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    @classmethod
+    def for_project(cls, root_dir: Path | None) -> "OcrCache | None":
+        """Return the shared OCR cache for a project root.
+
+        Args:
+            root_dir: Root directory of the project
+
+        Returns:
+            OcrCache instance, or None if no root directory is given
+        """
+        if root_dir is None:
+            return None
+        cache_dir = (Path(root_dir) / CACHE_DIR_NAME / OCR_CACHE_DIRNAME).resolve()
+        return get_shared_instance(
+            cls, cache_dir, lambda: cls(cache_dir, FileHashCache.for_project(root_dir))
+        )
+
+    def make_key(self, image_path, settings: dict) -> str:
+        """Build the cache key from the image content and the OCR settings."""
+        settings_hash = hashlib.sha256(
+            json.dumps(settings, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+        content_hash = get_image_content_hash(image_path, self.hash_cache)
+        return f"{content_hash}-{settings_hash}"
+
+    def _get_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _get_lock(self, key: str) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def get(self, key: str) -> list | None:
+        """Return the cached OCR result for a key, or None if missing or unreadable."""
+        path = self._get_path(key)
+        if not path.exists():
+            return None
+        try:
+            bounding_boxes = load_bounding_boxes(path)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable OCR cache entry {path}: {e}")
+            return None
+        return bounding_boxes if isinstance(bounding_boxes, list) else None
+
+    def put(self, key: str, image_path, bounding_boxes: list):
+        """Write an OCR result to the cache atomically."""
+        path = self._get_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            try:
+                save_bounding_boxes(image_path, bounding_boxes, output_path=tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            logger.warning(f"Failed to save OCR cache entry {path}: {e}")
+
+    def get_or_extract(self, image_path, settings: dict, extract) -> list:
+        """Return the cached OCR result of an image, running `extract` on a miss.
+
+        Args:
+            image_path: Path to the image file
+            settings: OCR settings the result depends on (provider, features, ...)
+            extract: Function taking the image path and returning the line
+                bounding boxes; its exceptions are not cached
+
+        Returns:
+            List of line dictionaries as returned by `extract`
+        """
+        key = self.make_key(image_path, settings)
+        with self._get_lock(key):
+            bounding_boxes = self.get(key)
+            if bounding_boxes is not None:
+                self.hits += 1
+                logger.info(f"Reusing cached OCR result for {image_path}")
+                return bounding_boxes
+            self.misses += 1
+            bounding_boxes = extract(image_path)
+            self.put(key, image_path, bounding_boxes)
+            return bounding_boxes
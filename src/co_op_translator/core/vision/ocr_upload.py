@@ -0,0 +1,163 @@
+"""
+Downscaled image uploads for OCR.
+
+The height of the smallest text line is estimated locally and the image is
+downscaled until that line is `OCR_MIN_TEXT_HEIGHT` pixels high, then
+re-encoded. Line polygons returned for the smaller image are scaled back to
+the coordinates of the original image.
+
+Images larger than the detector's working size are never made smaller than
+it, so legible text too small for the detector is not scaled away either.
+"""
+
+import io
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from co_op_translator.core.vision import text_detector
+
+logger = logging.getLogger(__name__)
+
+OCR_MIN_TEXT_HEIGHT = 16  # Pixels kept by the smallest text line's glyphs
+MAX_UPLOAD_SCALE = 0.8  # Smaller reductions are not worth re-encoding
+MIN_UPLOAD_SIDE = 50  # Smallest image side accepted by the analysis service
+JPEG_UPLOAD_QUALITY = 90
+MIN_SCALED_UPLOAD_BYTES = 256 * 1024  # Smaller files are uploaded as they are
+OCR_UPLOAD_VERSION = 1  # Bump when the way uploads are scaled changes
+
+
+@dataclass
+class OcrUpload:
+    """Image bytes sent to OCR, with the scale from the original image."""
+
+    data: bytes
+    scale_x: float = 1.0
+    scale_y: float = 1.0
+
+    @property
+    def is_scaled(self) -> bool:
+        return self.scale_x != 1.0 or self.scale_y != 1.0
+
+    def restore_line_bounding_boxes(self, line_bounding_boxes: list) -> list:
+        """Scale line polygons recognized in the upload back to the original image.
+
+        Args:
+            line_bounding_boxes: Lines recognized in the uploaded image
+
+        Returns:
+            The lines with bounding boxes in original image coordinates
+        """
+        if not self.is_scaled:
+            return line_bounding_boxes
+        restored = []
+        for line in line_bounding_boxes:
+            bounding_box = line["bounding_box"]
+            restored.append(
+                {
+                    **line,
+                    "bounding_box": [
+                        round(value / (self.scale_y if i % 2 else self.scale_x))
+                        for i, value in enumerate(bounding_box)
+                    ],
+                }
+            )
+        return restored
+
+
+def get_upload_settings() -> dict:
+    """
+    Return the upload parameters that recognized lines depend on.
+
+    Returns:
+        Dictionary of the upload version and downscale parameters, used in OCR cache keys
+    """
+    return {
+        "version": OCR_UPLOAD_VERSION,
+        "min_text_height": OCR_MIN_TEXT_HEIGHT,
+        "max_scale": MAX_UPLOAD_SCALE,
+        "min_scaled_bytes": MIN_SCALED_UPLOAD_BYTES,
+        "jpeg_quality": JPEG_UPLOAD_QUALITY,
+        "detector_side": text_detector.MAX_SIDE,
+    }
+
+
+def get_upload_scale(width: int, height: int, text_height: float | None) -> float:
+    """
+    Return the scale at which an image can be sent to OCR.
+
+    Args:
+        width: Image width in pixels
+        height: Image height in pixels
+        text_height: Height of the smallest text line (None if unknown)
+
+    Returns:
+        Scale factor, 1.0 if the image should be sent as it is
+    """
+    if not text_height:
+        return 1.0
+    # Text too small for the detector is only legible in images the detector
+    # downscaled, so those are kept at least at the detector's resolution
+    detector_scale = text_detector.MAX_SIDE / max(width, height)
+    scale = max(
+        OCR_MIN_TEXT_HEIGHT / text_height,
+        MIN_UPLOAD_SIDE / min(width, height),
+        detector_scale if detector_scale < 1 else 0,
+    )
+    return scale if scale <= MAX_UPLOAD_SCALE else 1.0
+
+
+def prepare_ocr_upload(image_path) -> OcrUpload:
+    """
+    Read an image for OCR, downscaled to the smallest size keeping its text legible.
+
+    Small files, images whose text cannot be measured or is already small, and
+    images whose re-encoding would not be smaller are uploaded unchanged.
+
+    Args:
+        image_path: Path to the image file
+
+    Returns:
+        OcrUpload with the bytes to send and the applied scale
+    """
+    image_path = Path(image_path)
+    original = image_path.read_bytes()
+    if len(original) < MIN_SCALED_UPLOAD_BYTES:
+        return OcrUpload(original)
+    try:
+        with Image.open(io.BytesIO(original)) as image:
+            image.load()
+            width, height = image.size
+            text_height = text_detector.estimate_text_height(
+                np.asarray(image.convert("L"))
+            )
+            scale = get_upload_scale(width, height, text_height)
+            if scale == 1.0:
+                return OcrUpload(original)
+
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            if image.mode == "RGBA" and image.getchannel("A").getextrema()[0] == 255:
+                image = image.convert("RGB")  # Opaque: less to resize and encode
+            resized = image.resize(size, Image.BOX)
+            buffer = io.BytesIO()
+            if image.format == "JPEG":
+                resized.save(buffer, "JPEG", quality=JPEG_UPLOAD_QUALITY)
+            else:
+                if resized.mode not in ("1", "L", "LA", "RGB", "RGBA", "P"):
+                    resized = resized.convert("RGBA")
+                resized.save(buffer, "PNG")
+    except Exception as e:
+        logger.warning(f"Uploading {image_path.name} unchanged for OCR: {e}")
+        return OcrUpload(original)
+
+    data = buffer.getvalue()
+    if len(data) >= len(original):
+        return OcrUpload(original)
+    logger.info(
+        f"Uploading {image_path.name} for OCR at {size[0]}x{size[1]} "
+        f"({len(data) // 1024} KiB instead of {len(original) // 1024} KiB)"
+    )
+    return OcrUpload(data, size[0] / width, size[1] / height)
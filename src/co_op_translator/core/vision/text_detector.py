@@ -0,0 +1,377 @@
+"""
+Local detection of images without text.
+
+Photos and screenshots without meaningful text would otherwise each cost an
+OCR request, only to be copied unchanged for every language. Before OCR, an
+image is scored with OpenCV heuristics and images scoring below a threshold
+are treated as having no text.
+
+The score counts character-like shapes that are lined up with others:
+
+1. The grayscale image is downscaled and binarized against its local mean,
+   for dark and for light text, so that glyphs become connected components.
+2. Components with the size, aspect ratio, fill ratio and stroke width of
+   glyphs are kept.
+3. Glyphs of similar height, on the same baseline and close to each other are
+   chained, and glyphs in chains of at least `MIN_CHAIN_LENGTH` are counted.
+   Neighbors are found by sorting glyphs by baseline and by top, so chaining
+   takes memory in proportion to the glyphs of a line, not to all glyphs.
+   An image with more than `MAX_GLYPH_CANDIDATES` candidates is dense with
+   text: all of them are counted without chaining.
+
+Missing text costs more than a wasted OCR request, so the heuristics lean
+towards text: textured images may still go to OCR, while an image scoring
+below the low default threshold has no two glyph-like shapes side by side.
+
+Scores are cached on disk by image content hash, so the threshold can be tuned
+without scoring images again. The same glyph chains give the height of the
+smallest text line, which sizes OCR uploads.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from co_op_translator.config.constants import (
+    CACHE_DIR_NAME,
+    DEFAULT_TEXT_SCORE_THRESHOLD,
+)
+from co_op_translator.core.vision.ocr_cache import get_image_content_hash
+from co_op_translator.utils.common.hash_cache import FileHashCache
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+TEXT_DETECTION_CACHE_FILENAME = "text_detection.json"
+SCORE_VERSION = 2  # Cached scores of other versions are discarded
+MAX_SIDE = 2048  # Images are scored at this size at most
+MIN_GLYPH_HEIGHT = 5
+MIN_CONTRAST = 32  # Gray levels between glyphs and their background
+ADAPTIVE_BLOCK_SIZE = 31  # Neighborhood of the local mean glyphs are compared to
+MIN_CHAIN_LENGTH = 2  # Short labels such as "OK" are text too
+# More candidates than this are only found on text-dense images: they are all
+# counted as text without being chained
+MAX_GLYPH_CANDIDATES = 3000
+
+
+def _neighbor_pairs(keys: np.ndarray, reach: np.ndarray):
+    """Return the index pairs (i, j) with keys[i] <= keys[j] <= keys[i] + reach[i].
+
+    Pairs are found by sorting the keys and bisecting each window, so memory
+    grows with the number of pairs rather than with the square of the keys.
+    """
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.arange(1, len(keys) + 1)
+    ends = np.searchsorted(sorted_keys, sorted_keys + reach[order], side="right")
+    counts = np.maximum(ends - starts, 0)
+    first = np.repeat(np.arange(len(keys)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    second = np.repeat(starts, counts) + offsets
+    return order[first], order[second]
+
+
+def _link_glyphs(stats: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return the index pairs of glyph boxes lying next to each other on a line."""
+    x, y, w, h = (stats[:, i].astype(np.float64) for i in range(4))
+    bottom = y + h
+    # Glyphs of a line share their baseline, or their top for descenders, within
+    # 0.2 of the taller height, which is at most 1.5 times the shorter one
+    reach = 0.3 * h
+    pairs = [_neighbor_pairs(bottom, reach), _neighbor_pairs(y, reach)]
+    first = np.concatenate([pair[0] for pair in pairs])
+    second = np.concatenate([pair[1] for pair in pairs])
+
+    max_h = np.maximum(h[first], h[second])
+    similar_height = np.minimum(h[first], h[second]) * 1.5 >= max_h
+    tolerance = 0.2 * max_h
+    same_line = (np.abs(bottom[first] - bottom[second]) <= tolerance) | (
+        np.abs(y[first] - y[second]) <= tolerance
+    )
+    gap = np.maximum(
+        x[second] - (x[first] + w[first]), x[first] - (x[second] + w[second])
+    )
+    linked = similar_height & same_line & (gap <= max_h)
+    return first[linked], second[linked]
+
+
+def _chain_labels(count: int, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Return, for each node, the smallest node index of its connected component."""
+    labels = np.arange(count)
+    while True:
+        new_labels = labels.copy()
+        np.minimum.at(new_labels, first, labels[second])
+        np.minimum.at(new_labels, second, labels[first])
+        new_labels = new_labels[new_labels]  # Jump to the label's own label
+        if np.array_equal(new_labels, labels):
+            return labels
+        labels = new_labels
+
+
+def _find_glyphs(binary: np.ndarray) -> np.ndarray:
+    """Return the (x, y, w, h) boxes of the glyph-like components of a binary image."""
+    height = binary.shape[0]
+    count, labels, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    w = stats[:, cv2.CC_STAT_WIDTH]
+    h = stats[:, cv2.CC_STAT_HEIGHT]
+    area = stats[:, cv2.CC_STAT_AREA]
+    fill = area / np.maximum(w * h, 1)
+    glyph = (
+        (h >= MIN_GLYPH_HEIGHT)
+        & (h <= height / 4)
+        & (w <= h * 2)
+        & (w * 8 >= h)
+        & (fill >= 0.1)
+    )
+    glyph[0] = False  # Background
+    if glyph.sum() < MIN_CHAIN_LENGTH:
+        return np.empty((0, 4), dtype=np.int32)
+
+    # Glyph strokes are thin compared to the glyph: compare the thickest stroke
+    # (twice the largest distance to the outline) with the glyph height
+    distance = cv2.distanceTransform(binary, cv2.DIST_L2, 3)
+    max_stroke = np.zeros(count, dtype=np.float32)
+    np.maximum.at(max_stroke, labels.ravel(), distance.ravel() * 2)
+    glyph &= max_stroke <= h * 0.4
+    return stats[glyph, :4]
+
+
+def find_text_glyphs(gray: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Find the glyph-like shapes of an image that are lined up into text.
+
+    Args:
+        gray: Grayscale image as a 2D uint8 array
+
+    Returns:
+        Tuple of the (x, y, w, h) glyph boxes in image coordinates and, for each
+        glyph, the label of its line, for glyphs in chains of at least
+        `MIN_CHAIN_LENGTH`
+    """
+    no_glyphs = np.empty((0, 4)), np.empty(0, dtype=np.int64)
+    height, width = gray.shape
+    scale = MAX_SIDE / max(height, width)
+    if scale < 1:
+        gray = cv2.resize(
+            gray,
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+    if int(gray.max()) - int(gray.min()) < MIN_CONTRAST:
+        return no_glyphs  # Flat image: no contrast for any text
+
+    # Glyphs are darker or lighter than their surroundings: binarize both ways
+    # against the local mean and keep the glyph-like components of both
+    glyphs = np.concatenate(
+        [
+            _find_glyphs(
+                cv2.adaptiveThreshold(
+                    gray,
+                    255,
+                    cv2.ADAPTIVE_THRESH_MEAN_C,
+                    polarity,
+                    ADAPTIVE_BLOCK_SIZE,
+                    MIN_CONTRAST // 2,
+                )
+            )
+            for polarity in (cv2.THRESH_BINARY_INV, cv2.THRESH_BINARY)
+        ]
+    )
+    if len(glyphs) < MIN_CHAIN_LENGTH:
+        return no_glyphs
+    if len(glyphs) > MAX_GLYPH_CANDIDATES:
+        # A page dense with text: every candidate counts, as a single line
+        return glyphs / min(scale, 1), np.zeros(len(glyphs), dtype=np.int64)
+
+    labels = _chain_labels(len(glyphs), *_link_glyphs(glyphs))
+    in_text = np.bincount(labels, minlength=len(labels))[labels] >= MIN_CHAIN_LENGTH
+    return glyphs[in_text] / min(scale, 1), labels[in_text]
+
+
+def score_text_likelihood(gray: np.ndarray) -> int:
+    """
+    Count the glyph-like shapes of an image that are lined up into text.
+
+    Args:
+        gray: Grayscale image as a 2D uint8 array
+
+    Returns:
+        Number of glyph candidates in chains of at least `MIN_CHAIN_LENGTH`
+    """
+    glyphs, _ = find_text_glyphs(gray)
+    return len(glyphs)
+
+
+def estimate_text_height(gray: np.ndarray) -> float | None:
+    """
+    Estimate the height of the smallest text line of an image.
+
+    Each line is measured by the median height of its glyphs, so that
+    punctuation and ascenders do not skew it.
+
+    Args:
+        gray: Grayscale image as a 2D uint8 array
+
+    Returns:
+        Height in pixels of the image, or None if no text line is found
+    """
+    glyphs, labels = find_text_glyphs(gray)
+    if not len(glyphs):
+        return None
+    return float(
+        min(np.median(glyphs[labels == label, 3]) for label in np.unique(labels))
+    )
+
+
+class TextPresenceDetector:
+    """Decide locally whether an image contains text worth sending to OCR.
+
+    Detectors are shared per cache file. Scores are kept in one JSON file in
+    the project's cache directory, keyed by image content hash, and discarded
+    when the scoring changes.
+    """
+
+    def __init__(
+        self,
+        cache_path: Path | None,
+        threshold: float = None,
+        hash_cache: FileHashCache = None,
+    ):
+        """Initialize the detector.
+
+        Args:
+            cache_path: JSON file holding the cached scores (None to disable caching)
+            threshold: Minimum score for an image to be considered to contain
+                text (default: DEFAULT_TEXT_SCORE_THRESHOLD, 0 disables detection)
+            hash_cache: Cache memoizing image content hashes (default: in memory)
+        """
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.hash_cache = hash_cache
+        self.threshold = (
+            DEFAULT_TEXT_SCORE_THRESHOLD if threshold is None else threshold
+        )
+        self._scores = None
+        self._dirty = False  # New scores not yet written to the cache file
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_project(
+        cls, root_dir: Path | None, threshold: float = None
+    ) -> "TextPresenceDetector":
+        """Return the shared detector for a project root.
+
+        Args:
+            root_dir: Root directory of the project (None to disable caching)
+            threshold: Minimum score for an image to be considered to contain text
+
+        Returns:
+            TextPresenceDetector instance
+        """
+        cache_path = (
+            (Path(root_dir) / CACHE_DIR_NAME / TEXT_DETECTION_CACHE_FILENAME).resolve()
+            if root_dir is not None
+            else None
+        )
+        return get_shared_instance(
+            cls,
+            (cache_path, threshold),
+            lambda: cls(cache_path, threshold, FileHashCache.for_project(root_dir)),
+        )
+
+    def _load_scores(self) -> dict:
+        if self._scores is None:
+            self._scores = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        cache = json.load(f)
+                    if (
+                        isinstance(cache, dict)
+                        and cache.get("version") == SCORE_VERSION
+                        and isinstance(cache.get("scores"), dict)
+                    ):
+                        self._scores = cache["scores"]
+                except (OSError, json.JSONDecodeError) as e:
+                    logger.warning(
+                        f"Ignoring unreadable text detection cache {self.cache_path}: {e}"
+                    )
+        return self._scores
+
+    def _save_scores(self):
+        if not self.cache_path:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": SCORE_VERSION, "scores": self._scores}, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(
+                f"Failed to save text detection cache {self.cache_path}: {e}"
+            )
+
+    def close(self):
+        """Write the scores computed since the cache was loaded to the cache file."""
+        with self._lock:
+            if self._dirty:
+                self._save_scores()
+                self._dirty = False
+
+    def score(self, image_path) -> int:
+        """Return the text score of an image, from the cache when possible.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            Number of lined-up glyph-like shapes found in the image
+        """
+        key = get_image_content_hash(image_path, self.hash_cache)
+        with self._lock:
+            cached = self._load_scores().get(key)
+        if cached is not None:
+            return cached
+
+        data = np.fromfile(image_path, dtype=np.uint8)
+        gray = cv2.imdecode(data, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            raise ValueError(f"Cannot decode image '{Path(image_path).name}'")
+        score = score_text_likelihood(gray)
+
+        with self._lock:
+            self._load_scores()[key] = score
+            self._dirty = True
+        return score
+
+    def has_text(self, image_path) -> bool:
+        """Check whether an image should be sent to OCR.
+
+        Images that cannot be scored are assumed to contain text.
+
+        Args:
+            image_path: Path to the image file
+
+        Returns:
+            False if the image scores below the threshold, True otherwise
+        """
+        if not self.threshold:
+            return True
+        try:
+            score = self.score(image_path)
+        except Exception as e:
+            logger.warning(f"Text detection failed for {image_path}: {e}")
+            return True
+        if score < self.threshold:
+            logger.info(
+                f"No text detected locally in {image_path} "
+                f"(score {score} < {self.threshold}): skipping OCR"
+            )
+            return False
+        return True
@@ -0,0 +1,176 @@
+"""
+Font loading and text fitting for image rendering.
+
+Fonts are kept in an LRU cache per (path, size) and glyph metrics are cached
+per font. The size fitting a box is found with a closed-form estimate refined
+by a short binary search.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PIL import ImageFont
+
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+FONT_CACHE_SIZE = 256  # FreeTypeFont objects kept, across paths and sizes
+REFERENCE_FONT_SIZE = 100  # Size at which glyph metrics are cached for estimates
+MAX_FONT_SIZE = 1000
+
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def load_font(font_path: str, size: int):
+    """
+    Load a TrueType font, reusing fonts already loaded for the same path and size.
+
+    Args:
+        font_path (str): Path to the font file.
+        size (int): Font size in pixels.
+
+    Returns:
+        ImageFont.FreeTypeFont: The font, or Pillow's default font if the file cannot be loaded.
+    """
+    try:
+        return ImageFont.truetype(font_path, size)
+    except IOError:
+        logger.error(
+            f"Font file not found at '{font_path}': "
+            f"Using default font. Install the required font or check font configuration."
+        )
+        return ImageFont.load_default()
+
+
+@dataclass
+class FittedText:
+    """A font size chosen for a text, with the text's ink box at that font."""
+
+    font: ImageFont.FreeTypeFont
+    size: int
+    width: int
+    height: int
+    left: int = 0  # Offset of the ink box from the drawing origin
+    top: int = 0
+
+
+class TextFitter:
+    """Measure text and find the largest font size fitting a box for one font file.
+
+    Fitters are shared per font path, so glyph metrics are measured once per
+    process for every character used.
+    """
+
+    def __init__(self, font_path: str):
+        """Initialize the fitter.
+
+        Args:
+            font_path: Path to the font file
+        """
+        self.font_path = str(font_path)
+        self._glyph_metrics = {}  # char -> (advance, top, bottom) at the reference size
+
+    @classmethod
+    def for_font(cls, font_path: str) -> "TextFitter":
+        """Return the shared fitter for a font file.
+
+        Args:
+            font_path: Path to the font file
+
+        Returns:
+            TextFitter instance
+        """
+        key = str(font_path)
+        return get_shared_instance(cls, key, lambda: cls(key))
+
+    def get_font(self, size: int):
+        """Return the cached font of this fitter's file at a size."""
+        return load_font(self.font_path, max(1, int(size)))
+
+    def measure(self, text: str, size: int) -> tuple[int, int]:
+        """Return the exact ink (width, height) of a single-line text at a font size."""
+        left, top, right, bottom = self.get_font(size).getbbox(text)
+        return right - left, bottom - top
+
+    def _fitted(self, text: str, size: int, bbox=None) -> FittedText:
+        font = self.get_font(size)
+        left, top, right, bottom = bbox or font.getbbox(text)
+        return FittedText(font, size, right - left, bottom - top, left, top)
+
+    def estimate(self, text: str, size: int) -> tuple[float, float]:
+        """Estimate the (width, height) of a text at a font size from cached glyph metrics.
+
+        Advances and vertical extents are measured once per character at
+        `REFERENCE_FONT_SIZE` and scaled linearly.
+        """
+        if not text:
+            return 0.0, 0.0
+        font = self.get_font(REFERENCE_FONT_SIZE)
+        width = 0.0
+        top = bottom = None
+        for char in text:
+            metrics = self._glyph_metrics.get(char)
+            if metrics is None:
+                _, char_top, _, char_bottom = font.getbbox(char)
+                metrics = (font.getlength(char), char_top, char_bottom)
+                self._glyph_metrics[char] = metrics
+            width += metrics[0]
+            if not char.isspace():
+                top = metrics[1] if top is None else min(top, metrics[1])
+                bottom = metrics[2] if bottom is None else max(bottom, metrics[2])
+        height = (bottom - top) if top is not None else 0
+        scale = size / REFERENCE_FONT_SIZE
+        return width * scale, height * scale
+
+    def fit(
+        self, text: str, max_width: float, max_height: float, max_size=MAX_FONT_SIZE
+    ) -> FittedText:
+        """Find the largest font size at which a text fits within a box.
+
+        The size is estimated in closed form from cached glyph metrics, then the
+        estimate is corrected with a binary search on exact measurements.
+
+        Args:
+            text: Single-line text to fit
+            max_width: Available width in pixels
+            max_height: Available height in pixels
+            max_size: Upper bound for the font size
+
+        Returns:
+            FittedText with the chosen font and the text's ink size
+        """
+        width, height = self.estimate(text, REFERENCE_FONT_SIZE)
+        if width <= 0 or height <= 0:
+            return self._fitted(text, max(1, min(int(max_height), max_size)))
+
+        scale = min(max_width / width, max_height / height)
+        guess = max(1, min(int(REFERENCE_FONT_SIZE * scale), max_size))
+
+        bboxes = {}  # Measuring is the expensive part, so do it once per size
+
+        def fits(size):
+            bboxes[size] = left, top, right, bottom = self.get_font(size).getbbox(text)
+            return right - left <= max_width and bottom - top <= max_height
+
+        # The estimate is usually off by a size or two, so bracket the answer
+        # with steps growing from 1 around it, then bisect: lo fits, hi does not
+        step = 1
+        if fits(guess):
+            lo, hi = guess, min(guess + step, max_size + 1)
+            while hi <= max_size and fits(hi):
+                step *= 2
+                lo, hi = hi, min(hi + step, max_size + 1)
+        else:
+            lo, hi = max(1, guess - step), guess
+            while lo > 1 and not fits(lo):
+                step *= 2
+                lo, hi = max(1, lo - step), lo
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if fits(mid):
+                lo = mid
+            else:
+                hi = mid
+
+        return self._fitted(text, lo, bboxes.get(lo))
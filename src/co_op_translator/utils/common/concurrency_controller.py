@@ -0,0 +1,324 @@
+"""
+This module contains an adaptive (AIMD) concurrency controller for API requests.
+The number of requests in flight grows additively while latency stays flat and
+shrinks multiplicatively when the provider throttles.
+
+It also contains a pixel budget controller admitting image jobs by image area.
+"""
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_STATUS_CODES = {429, 503}
+
+
+def _iter_exception_chain(error: BaseException):
+    """Yield an exception together with its causes and contexts."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def _get_status_code(error: BaseException):
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return status_code if isinstance(status_code, int) else None
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """
+    Check whether an exception (or any exception in its chain) signals provider throttling.
+
+    Args:
+        error (BaseException): The exception raised by the API call.
+
+    Returns:
+        bool: True for HTTP 429/503 responses or responses carrying a Retry-After header.
+    """
+    for exc in _iter_exception_chain(error):
+        if _get_status_code(exc) in THROTTLING_STATUS_CODES:
+            return True
+        if get_retry_after(exc) is not None:
+            return True
+    return False
+
+
+def get_retry_after(error: BaseException) -> float | None:
+    """
+    Extract the Retry-After delay in seconds from an exception chain, if present.
+
+    Args:
+        error (BaseException): The exception raised by the API call.
+
+    Returns:
+        float | None: Seconds to wait before retrying, or None when not provided.
+    """
+    for exc in _iter_exception_chain(error):
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        if not headers:
+            continue
+        try:
+            retry_after_ms = headers.get("retry-after-ms")
+            if retry_after_ms is not None:
+                return float(retry_after_ms) / 1000
+            retry_after = headers.get("retry-after")
+            if retry_after is not None:
+                return float(retry_after)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class AdaptiveConcurrencyController:
+    """Additive-increase/multiplicative-decrease limit on requests in flight.
+
+    The limit rises by `increase_step` after each full round of successful
+    requests as long as the p95 latency stays within `latency_tolerance` of the
+    best p95 observed, and is multiplied by `decrease_factor` when a request is
+    throttled. A Retry-After delay pauses all new requests until it expires.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 16,
+        increase_step: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_window: int = 20,
+        latency_tolerance: float = 1.5,
+        decrease_cooldown: float = 1.0,
+        clock=time.monotonic,
+    ):
+        """Initialize the controller.
+
+        Args:
+            initial_limit: Number of requests allowed in flight at start
+            min_limit: Lower bound for the limit
+            max_limit: Upper bound for the limit
+            increase_step: Amount added to the limit after a healthy round
+            decrease_factor: Multiplier applied to the limit when throttled
+            latency_window: Number of recent latencies used for the p95
+            latency_tolerance: Allowed p95 growth over the best observed p95
+            decrease_cooldown: Seconds during which further throttles do not shrink the limit again
+            clock: Monotonic clock function, replaceable for testing
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown = decrease_cooldown
+        self.clock = clock
+
+        self.in_flight = 0
+        self.latencies = deque(maxlen=latency_window)
+        self.baseline_p95 = None
+        self.successes_since_adjustment = 0
+        self.paused_until = 0.0
+        self.last_decrease = None
+        self._waiters = deque()
+
+    @property
+    def current_limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self.limit)
+
+    def p95_latency(self) -> float | None:
+        """Return the 95th percentile of recent request latencies."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return ordered[index]
+
+    async def acquire(self):
+        """Wait for a free slot under the current limit and any active pause."""
+        while True:
+            pause = self.paused_until - self.clock()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            if self.in_flight < self.current_limit:
+                self.in_flight += 1
+                return
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def release(self):
+        """Release a slot acquired with `acquire`."""
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake_waiters()
+
+    @contextlib.asynccontextmanager
+    async def slot(self):
+        """Async context manager holding a slot for the duration of a request."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _wake_waiters(self):
+        available = self.current_limit - self.in_flight
+        while available > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                available -= 1
+
+    def record_success(self, latency: float):
+        """Record a successful request and grow the limit after a healthy round.
+
+        Args:
+            latency: Request duration in seconds
+        """
+        self.latencies.append(latency)
+        self.successes_since_adjustment += 1
+        if self.successes_since_adjustment < self.current_limit:
+            return
+        self.successes_since_adjustment = 0
+
+        p95 = self.p95_latency()
+        if self.baseline_p95 is None or p95 < self.baseline_p95:
+            self.baseline_p95 = p95
+
+        if (
+            p95 <= self.baseline_p95 * self.latency_tolerance
+            and self.limit < self.max_limit
+        ):
+            self._set_limit(self.limit + self.increase_step, f"p95 latency {p95:.2f}s")
+
+    def record_throttle(self, retry_after: float | None = None):
+        """Record a throttled request and back off.
+
+        Args:
+            retry_after: Delay requested by the provider in seconds, if any
+        """
+        now = self.clock()
+        if retry_after:
+            self.paused_until = max(self.paused_until, now + retry_after)
+
+        if (
+            self.last_decrease is not None
+            and now - self.last_decrease < self.decrease_cooldown
+        ):
+            return
+        self.last_decrease = now
+        self.successes_since_adjustment = 0
+        reason = "throttled by provider"
+        if retry_after:
+            reason += f", retrying after {retry_after:.1f}s"
+        self._set_limit(self.limit * self.decrease_factor, reason)
+
+    def _set_limit(self, new_limit: float, reason: str):
+        old_limit = self.current_limit
+        self.limit = min(max(new_limit, self.min_limit), self.max_limit)
+        if self.current_limit != old_limit:
+            logger.info(
+                f"Concurrency limit {old_limit} -> {self.current_limit} "
+                f"({reason}, {self.in_flight} in flight)"
+            )
+        self._wake_waiters()
+
+
+class PixelBudgetController:
+    """Admission control for image jobs by decoded image area.
+
+    Memory used by decoding and rendering an image scales with its pixel count,
+    so jobs reserve their image's megapixels from a shared budget instead of a
+    job slot. Jobs are admitted in arrival order while their images fit in the
+    remaining budget: small images run in parallel, and an image larger than
+    the whole budget runs alone once every other job has finished.
+    """
+
+    def __init__(self, budget_megapixels: float):
+        """Initialize the controller.
+
+        Args:
+            budget_megapixels: Megapixels allowed across the jobs in flight
+        """
+        self.budget = float(budget_megapixels)
+        self.in_use = 0.0
+        self.jobs = 0
+        self.peak_in_use = 0.0
+        self.peak_jobs = 0
+        self._waiters = deque()
+
+    def _fits(self, megapixels: float) -> bool:
+        return self.jobs == 0 or self.in_use + megapixels <= self.budget
+
+    async def acquire(self, megapixels: float):
+        """Wait until a job of the given image area can be admitted.
+
+        Args:
+            megapixels: Decoded size of the job's image
+        """
+        # Queue behind earlier waiters so that large images are not starved
+        if self._waiters or not self._fits(megapixels):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append((waiter, megapixels))
+            try:
+                await waiter
+            except BaseException:
+                if (waiter, megapixels) in self._waiters:
+                    self._waiters.remove((waiter, megapixels))
+                    self._wake_waiters()
+                elif waiter.done() and not waiter.cancelled():
+                    # Admitted just as we were cancelled: hand the reservation back
+                    self.release(megapixels)
+                raise
+        else:
+            self._admit(megapixels)
+
+    def release(self, megapixels: float):
+        """Return the megapixels reserved with `acquire`."""
+        self.jobs = max(0, self.jobs - 1)
+        self.in_use = max(0.0, self.in_use - megapixels) if self.jobs else 0.0
+        self._wake_waiters()
+
+    @contextlib.asynccontextmanager
+    async def reserve(self, megapixels: float):
+        """Async context manager holding a reservation for the duration of a job."""
+        await self.acquire(megapixels)
+        try:
+            yield
+        finally:
+            self.release(megapixels)
+
+    def _admit(self, megapixels: float):
+        self.jobs += 1
+        self.in_use += megapixels
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        self.peak_jobs = max(self.peak_jobs, self.jobs)
+
+    def _wake_waiters(self):
+        while self._waiters and self._fits(self._waiters[0][1]):
+            waiter, megapixels = self._waiters.popleft()
+            if not waiter.done():
+                self._admit(megapixels)
+                waiter.set_result(None)
+
+    def report(self) -> str:
+        """Describe the peak usage of the budget."""
+        return (
+            f"Peak image memory budget usage: {self.peak_in_use:.1f} of "
+            f"{self.budget:.1f} megapixels, {self.peak_jobs} image(s) at once"
+        )
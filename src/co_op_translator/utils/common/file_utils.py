@@ -9,6 +9,8 @@ import shutil
 import os
 import logging
 
+from co_op_translator.utils.common.project_index import ProjectIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,8 +130,40 @@ def get_unique_id(file_path: str | Path, root_dir: Path) -> str:
     return unique_identifier
 
 
+def get_unique_ids(file_paths, root_dir: Path) -> dict[Path, str]:
+    """
+    Generate the unique identifiers of many file paths, as `get_unique_id` does.
+
+    Each path is resolved once, without logging per path. Paths outside the root
+    directory are left out.
+
+    Args:
+        file_paths: The file paths to hash.
+        root_dir (Path): The root directory the file paths are relative to.
+
+    Returns:
+        dict[Path, str]: SHA-256 hashes of the normalized relative paths, by the
+        given paths.
+    """
+    unique_ids = {}
+    for file_path in file_paths:
+        try:
+            relative_path = Path(file_path).resolve().relative_to(root_dir)
+        except ValueError:
+            continue
+        normalized_path = str(relative_path).replace(os.sep, "/")
+        unique_ids[Path(file_path)] = hashlib.sha256(
+            normalized_path.encode("utf-8")
+        ).hexdigest()
+    logger.debug(f"Generated unique ids for {len(unique_ids)} paths")
+    return unique_ids
+
+
 def generate_translated_filename(
-    original_filepath: str | Path, language_code: str, root_dir: Path
+    original_filepath: str | Path,
+    language_code: str,
+    root_dir: Path,
+    unique_id: str | None = None,
 ) -> str:
     """
     Generate a filename for a translated file, including a unique hash and language code.
@@ -141,6 +175,7 @@ def generate_translated_filename(
     Args:
         original_filepath (str): The original file path.
         language_code (str): The language code for the translation (e.g., 'en', 'fr').
+        unique_id (str, optional): The file's unique identifier, if already known.
 
     Returns:
         str: The translated file's new filename.
@@ -152,7 +187,7 @@ def generate_translated_filename(
     original_filename, file_ext = get_filename_and_extension(original_filepath)
 
     # Extract filename and extension
-    unique_hash = get_unique_id(str(original_filepath), root_dir)
+    unique_hash = unique_id or get_unique_id(str(original_filepath), root_dir)
 
     # Generate the new filename with the unique hash and language code
     new_filename = f"{original_filename}.{unique_hash}.{language_code}{file_ext}"
@@ -185,6 +220,9 @@ def filter_files(directory: str | Path, excluded_dirs, extension: str = None) ->
     Filter and return only the files in the given directory, excluding specified directories.
     Optionally filter by file extension.
 
+    Excluded directories are pruned while walking, so nothing below them is scanned.
+    Stages that need several file types should share one `ProjectIndex` instead.
+
     Args:
         directory (str | Path): The directory path to search for files.
         excluded_dirs (set): A set of directory names to exclude from the search.
@@ -194,20 +232,8 @@ def filter_files(directory: str | Path, excluded_dirs, extension: str = None) ->
     Returns:
         list: A list of Path objects representing only the files (excluding specified directories).
     """
-    directory = Path(directory)
-    files = []
-
-    # Recursively traverse the directory
-    for path in directory.rglob("*"):
-        # Check if the path is a file, matches extension if specified, and doesn't contain excluded dirs
-        if (
-            path.is_file()
-            and (extension is None or path.suffix.lower() == extension.lower())
-            and not any(excluded_dir in path.parts for excluded_dir in excluded_dirs)
-        ):
-            files.append(path)
-
-    return files
+    index = ProjectIndex(directory, excluded_dirs)
+    return index.get_files(extension) if extension else index.get_files()
 
 
 def reset_translation_directories(
@@ -0,0 +1,315 @@
+"""
+This module contains memoized content hashes of project files.
+Hashes are keyed by path, size, modification time and inode, and persisted
+per project in a SQLite database under its cache directory. Files are hashed
+in bulk by a thread pool with large buffered reads, with MD5, SHA-256 or the
+faster non-cryptographic FAST_HASH_ALGORITHM when a hash only detects changes.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from co_op_translator.config.constants import CACHE_DIR_NAME
+from co_op_translator.utils.common.shared_instances import get_shared_instance
+
+logger = logging.getLogger(__name__)
+
+HASH_CACHE_FILENAME = "file_hashes.sqlite"
+READ_BUFFER_SIZE = 1024 * 1024
+HASH_BATCH_BYTES = 8 * 1024 * 1024  # Files hashed by a thread pool task
+HASH_BATCH_FILES = 256
+# Files modified this recently may change again within the same mtime tick,
+# so their hashes are not memoized
+RACY_WINDOW_NS = 2 * 10**9
+DEFAULT_HASH_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+XXHASH_AVAILABLE = importlib.util.find_spec("xxhash") is not None
+# Change detection only: xxHash when installed, CRC-32 from the standard library
+FAST_HASH_ALGORITHM = "xxh3_64" if XXHASH_AVAILABLE else "crc32"
+
+
+class _Crc32:
+    """hashlib-style wrapper around zlib.crc32."""
+
+    def __init__(self):
+        self.value = 0
+
+    def update(self, data):
+        self.value = zlib.crc32(data, self.value)
+
+    def hexdigest(self) -> str:
+        return f"{self.value:08x}"
+
+
+_read_buffers = threading.local()
+
+
+def _absolute(file_path: str | Path) -> str:
+    """Return the absolute path keying a file's hashes."""
+    if isinstance(file_path, Path) and file_path.is_absolute():
+        return str(file_path)  # Spares normalizing paths from the project index
+    return os.path.abspath(file_path)
+
+
+def _new_hasher(algorithm: str):
+    if algorithm == "crc32":
+        return _Crc32()
+    if algorithm.startswith("xxh"):
+        import xxhash
+
+        return getattr(xxhash, algorithm)()
+    return hashlib.new(algorithm)
+
+
+def hash_file(file_path: str | Path, algorithm: str = "md5") -> str:
+    """
+    Hash the content of a file, reading it in large blocks.
+
+    Args:
+        file_path (str | Path): Path to the file.
+        algorithm (str): Name of a hashlib algorithm, "crc32", or an xxhash
+            algorithm such as "xxh3_64" when xxhash is installed.
+
+    Returns:
+        str: Hex digest of the file content.
+    """
+    hasher = _new_hasher(algorithm)
+    # Each thread reuses its read buffer
+    view = getattr(_read_buffers, "view", None)
+    if view is None:
+        view = _read_buffers.view = memoryview(bytearray(READ_BUFFER_SIZE))
+    with open(file_path, "rb", buffering=0) as f:
+        while size := f.readinto(view):
+            hasher.update(view[:size])
+    return hasher.hexdigest()
+
+
+class FileHashCache:
+    """Content hashes keyed by (path, size, mtime_ns, inode), optionally persisted.
+
+    Caches are shared per project; the cache without a project is kept in memory
+    only.
+    """
+
+    def __init__(self, path: Path | str | None = None):
+        """Initialize the cache.
+
+        Args:
+            path: Location of the SQLite file (None to keep hashes in memory only)
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = None  # (path, algorithm) -> (size, mtime_ns, inode, digest)
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is not None:
+            if path != ":memory:":
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS file_hashes (
+                    path TEXT NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    digest TEXT NOT NULL,
+                    PRIMARY KEY (path, algorithm)
+                )
+                """
+            )
+            self._conn.commit()
+
+    @classmethod
+    def for_project(cls, root_dir: Path | None) -> "FileHashCache":
+        """Return the shared hash cache for a project root.
+
+        Args:
+            root_dir: Root directory of the project (None for the in-memory cache)
+
+        Returns:
+            FileHashCache instance, kept in memory only if the database cannot
+            be opened
+        """
+        path = (
+            (Path(root_dir) / CACHE_DIR_NAME / HASH_CACHE_FILENAME).resolve()
+            if root_dir is not None
+            else None
+        )
+
+        def create():
+            try:
+                return cls(path)
+            except sqlite3.Error as e:
+                logger.warning(f"File hashes not persisted, cannot open {path}: {e}")
+                return cls()
+
+        return get_shared_instance(cls, path, create)
+
+    def _load_entries(self) -> dict:
+        if self._entries is None:
+            self._entries = {}
+            if self._conn is not None:
+                rows = self._conn.execute(
+                    "SELECT path, algorithm, size, mtime_ns, inode, digest "
+                    "FROM file_hashes"
+                )
+                for path, algorithm, *entry in rows:
+                    self._entries[(path, algorithm)] = tuple(entry)
+        return self._entries
+
+    def _lookup(self, path: str, algorithm: str, stat) -> str | None:
+        """Return the memoized digest of a file with the given stat, or None."""
+        entry = self._load_entries().get((path, algorithm))
+        if entry is not None and entry[:3] == (
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ino,
+        ):
+            self.hits += 1
+            return entry[3]
+        self.misses += 1
+        return None
+
+    def _store(self, hashed: list[tuple[str, str, object, str]]):
+        """Memoize (path, algorithm, stat, digest) results in one transaction."""
+        now = time.time_ns()
+        rows = [
+            (path, algorithm, stat.st_size, stat.st_mtime_ns, stat.st_ino, digest)
+            for path, algorithm, stat, digest in hashed
+            if now - stat.st_mtime_ns >= RACY_WINDOW_NS
+        ]
+        with self._lock:
+            entries = self._load_entries()
+            for path, algorithm, *entry in rows:
+                entries[(path, algorithm)] = tuple(entry)
+            if self._conn is not None and rows:
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO file_hashes "
+                        "(path, algorithm, size, mtime_ns, inode, digest) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.debug(f"Failed to persist {len(rows)} file hashes: {e}")
+
+    def get_hash(self, file_path: str | Path, algorithm: str = "md5", stat=None) -> str:
+        """Return the content hash of a file, hashing it only if it changed.
+
+        Args:
+            file_path: Path to the file
+            algorithm: Name of a hash algorithm accepted by `hash_file`
+            stat: Stat result of the file, if already known
+
+        Returns:
+            Hex digest of the file content
+        """
+        path = _absolute(file_path)
+        stat = stat or os.stat(path)
+        with self._lock:
+            digest = self._lookup(path, algorithm, stat)
+        if digest is None:
+            digest = hash_file(path, algorithm)
+            self._store([(path, algorithm, stat, digest)])
+        return digest
+
+    def get_hashes(
+        self,
+        file_paths,
+        algorithm: str = "md5",
+        stats: dict | None = None,
+        max_workers: int = DEFAULT_HASH_WORKERS,
+    ) -> dict[Path, str]:
+        """Return the content hashes of many files, hashing changed ones in parallel.
+
+        Args:
+            file_paths: Paths of the files to hash
+            algorithm: Name of a hash algorithm accepted by `hash_file`
+            stats: Known stat results by path, such as `ProjectIndex.stats`
+            max_workers: Number of threads reading and hashing files
+
+        Returns:
+            Dictionary of hex digests by the given paths; files that cannot be
+            read are left out
+        """
+        stats = stats or {}
+        files = []  # (given path, absolute path, stat)
+        for file_path in file_paths:
+            if not isinstance(file_path, Path):
+                file_path = Path(file_path)
+            path = _absolute(file_path)
+            try:
+                files.append((file_path, path, stats.get(file_path) or os.stat(path)))
+            except OSError as e:
+                logger.debug(f"Cannot hash {file_path}: {e}")
+
+        digests = {}
+        pending = []  # Files not hashed since they last changed
+        with self._lock:
+            for file_path, path, stat in files:
+                digest = self._lookup(path, algorithm, stat)
+                if digest is None:
+                    pending.append((file_path, path, stat))
+                else:
+                    digests[file_path] = digest
+
+        def hash_batch(batch):
+            batch_digests = []
+            for file_path, path, _ in batch:
+                try:
+                    batch_digests.append(hash_file(path, algorithm))
+                except OSError as e:
+                    logger.debug(f"Cannot hash {file_path}: {e}")
+                    batch_digests.append(None)
+            return batch_digests
+
+        # Small files are grouped so that task overhead does not dominate
+        batches, batch, batch_bytes = [], [], 0
+        for item in pending:
+            batch.append(item)
+            batch_bytes += item[2].st_size
+            if batch_bytes >= HASH_BATCH_BYTES or len(batch) >= HASH_BATCH_FILES:
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+        if batch:
+            batches.append(batch)
+
+        if batches:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                hashed = [
+                    digest
+                    for batch_digests in executor.map(hash_batch, batches)
+                    for digest in batch_digests
+                ]
+            self._store(
+                [
+                    (path, algorithm, stat, digest)
+                    for (_, path, stat), digest in zip(pending, hashed)
+                    if digest is not None
+                ]
+            )
+            for (file_path, _, _), digest in zip(pending, hashed):
+                if digest is not None:
+                    digests[file_path] = digest
+        return digests
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
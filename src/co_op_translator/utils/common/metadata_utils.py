@@ -2,27 +2,43 @@
 This module contains utility functions for handling file metadata and hashing operations.
 """
 
-import hashlib
 import json
+import os
+import re
 from datetime import datetime
 from pathlib import Path
 
+from co_op_translator.utils.common.hash_cache import FileHashCache
 
-def calculate_file_hash(file_path: Path) -> str:
+# The metadata comment is written first, so it fits in the first few KiB of a
+# translated markdown file unless it records many section hashes
+METADATA_HEADER_BYTES = 8 * 1024
+# Translated notebooks keep their metadata in the notebook-level metadata,
+# which json.dumps writes after the cells
+NOTEBOOK_METADATA_KEY = "co_op_translator"
+NOTEBOOK_TAIL_BYTES = 16 * 1024
+
+_METADATA_START = re.compile(rb"<!--\r?\nCO_OP_TRANSLATOR_METADATA:")
+_METADATA_END = re.compile(rb"-->")
+_UNMARKED_METADATA_START = re.compile(rb"<!--\s*(?=\{)")
+_NOTEBOOK_METADATA_KEY = re.compile(rb'"co_op_translator":\s*(?=\{)')
+
+
+def calculate_file_hash(file_path: Path, root_dir: Path | None = None) -> str:
     """
     Calculate MD5 hash of a file.
 
+    Hashes are memoized by file stat, so a file is only read again once it changed.
+
     Args:
         file_path (Path): Path to the file to calculate hash for.
+        root_dir (Path, optional): Root directory of the project whose hash cache
+            persists the hash between runs
 
     Returns:
         str: MD5 hash of the file content.
     """
-    hasher = hashlib.md5()
-    with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+    return FileHashCache.for_project(root_dir).get_hash(file_path)
 
 
 def create_metadata(
@@ -51,7 +67,7 @@ def create_metadata(
     normalized_path = str(rel_path).replace("\\", "/")
 
     return {
-        "original_hash": calculate_file_hash(original_file),
+        "original_hash": calculate_file_hash(original_file, root_dir),
         "translation_date": formatted_time,
         "source_file": normalized_path,
         "language_code": language_code,
@@ -157,3 +173,83 @@ def format_metadata_comment(metadata: dict) -> str:
     metadata_json = json.dumps(metadata, indent=2, ensure_ascii=False)
     formatted_comment = f"<!--\nCO_OP_TRANSLATOR_METADATA:\n{metadata_json}\n-->\n"
     return formatted_comment
+
+
+def read_metadata(file_path: str | Path, allow_unmarked: bool = False) -> dict:
+    """
+    Read the metadata of a translated file without reading the whole file.
+
+    Markdown files are read up to `METADATA_HEADER_BYTES`, and in full only when
+    the metadata comment starts there but is not closed. Notebooks are read from
+    the end for their notebook-level metadata, and in full if it is not there.
+
+    Args:
+        file_path (str | Path): Path to a translated markdown file or notebook
+        allow_unmarked (bool): Also accept a JSON comment without the
+            CO_OP_TRANSLATOR_METADATA marker, as written by older versions
+
+    Returns:
+        dict: Metadata dictionary, or empty dict if no metadata found
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() == ".ipynb":
+        return read_notebook_metadata(file_path)
+
+    with open(file_path, "rb") as f:
+        header = f.read(METADATA_HEADER_BYTES)
+        start = _METADATA_START.search(header)
+        if start is None and allow_unmarked:
+            start = _UNMARKED_METADATA_START.search(header)
+        if start is None:
+            return {}
+        end = _METADATA_END.search(header, start.end())
+        if end is None:
+            header += f.read()
+            end = _METADATA_END.search(header, start.end())
+            if end is None:
+                return {}
+
+    try:
+        metadata = json.loads(header[start.end() : end.start()].decode("utf-8"))
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def read_notebook_metadata(notebook_path: str | Path) -> dict:
+    """
+    Read the Co-op Translator metadata stored in a notebook's notebook-level metadata.
+
+    Args:
+        notebook_path (str | Path): Path to a translated notebook
+
+    Returns:
+        dict: Metadata dictionary, or empty dict if no metadata found
+    """
+    with open(notebook_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - NOTEBOOK_TAIL_BYTES))
+        tail = f.read()
+        if size > NOTEBOOK_TAIL_BYTES:
+            tail = tail[tail.find(b"\n") + 1 :]  # Start at a whole line
+
+        matches = list(_NOTEBOOK_METADATA_KEY.finditer(tail))
+        if matches:
+            text = tail[matches[-1].end() :].decode("utf-8", errors="ignore")
+            try:
+                metadata, _ = json.JSONDecoder().raw_decode(text)
+                if isinstance(metadata, dict):
+                    return metadata
+            except json.JSONDecodeError:
+                pass
+
+        # Not found near the end: parse the whole notebook
+        f.seek(0)
+        try:
+            notebook = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {}
+    if not isinstance(notebook, dict):
+        return {}
+    metadata = notebook.get("metadata", {}).get(NOTEBOOK_METADATA_KEY)
+    return metadata if isinstance(metadata, dict) else {}
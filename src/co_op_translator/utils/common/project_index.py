@@ -0,0 +1,103 @@
+"""
+This module contains a single-pass, in-memory index of a project's files.
+The project is walked once with `os.scandir`, pruning excluded directories
+before descending into them, and every stage queries the resulting files,
+directories and file stats.
+"""
+
+import logging
+import os
+from collections import defaultdict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ProjectIndex:
+    """Files and directories under a root directory, collected in one walk.
+
+    Paths are built from the root directory as given, like `Path.rglob`
+    results. Symbolic links to directories are not followed.
+    """
+
+    def __init__(self, root_dir: str | Path, excluded_dirs=()):
+        """Walk a directory tree and index it.
+
+        Args:
+            root_dir: Directory to index
+            excluded_dirs: Names of directories skipped with everything below them
+        """
+        self.root_dir = Path(root_dir)
+        self.excluded_dirs = frozenset(excluded_dirs)
+        self.dirs: list[Path] = []  # Every indexed directory below the root
+        self.files: list[Path] = []
+        self.stats: dict[Path, os.stat_result] = {}
+        self._files_by_extension = defaultdict(list)
+        self._walk()
+
+    def _walk(self):
+        if not self.root_dir.is_dir():
+            return
+        pending = [str(self.root_dir)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in self.excluded_dirs:
+                                    self.dirs.append(Path(entry.path))
+                                    pending.append(entry.path)
+                            elif entry.is_file():
+                                self._add_file(Path(entry.path), entry.stat())
+                        except OSError as e:
+                            logger.debug(f"Skipping {entry.path}: {e}")
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {directory}: {e}")
+
+    def _add_file(self, path: Path, stat: os.stat_result):
+        self.files.append(path)
+        self.stats[path] = stat
+        self._files_by_extension[path.suffix.lower()].append(path)
+
+    def get_files(self, *extensions: str) -> list[Path]:
+        """Return the indexed files, optionally only those with given extensions.
+
+        Args:
+            *extensions: File extensions such as '.md', compared case-insensitively
+
+        Returns:
+            List of file paths
+        """
+        if not extensions:
+            return list(self.files)
+        files = []
+        for extension in dict.fromkeys(ext.lower() for ext in extensions):
+            files.extend(self._files_by_extension.get(extension, ()))
+        return files
+
+    def get_dirs_containing(self, *extensions: str, recursive=False) -> set[Path]:
+        """Return the directories holding files with given extensions.
+
+        Args:
+            *extensions: File extensions such as '.png', compared case-insensitively
+            recursive: Whether to also include every ancestor of those directories
+                below the root
+
+        Returns:
+            Set of directory paths
+        """
+        dirs = set()
+        for path in self.get_files(*extensions):
+            parent = path.parent
+            while parent != self.root_dir and parent not in dirs:
+                dirs.add(parent)
+                if not recursive:
+                    break
+                parent = parent.parent
+        return dirs
+
+    def stat(self, path: str | Path) -> os.stat_result | None:
+        """Return the stat result recorded for an indexed file, or None."""
+        return self.stats.get(Path(path))
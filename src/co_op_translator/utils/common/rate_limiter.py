@@ -0,0 +1,138 @@
+"""
+This module contains utilities for keeping API usage within provider quotas.
+Token buckets enforce requests-per-minute and tokens-per-minute budgets so that
+many translation requests can be in flight without triggering throttling.
+"""
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Continuously refilling token bucket.
+
+    The bucket starts full and refills at a constant rate up to its capacity,
+    which allows short bursts while enforcing the long-term average rate.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float, clock=time.monotonic):
+        """Initialize the bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_per_second: Number of tokens added per second
+            clock: Monotonic clock function, replaceable for testing
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.clock = clock
+        self.tokens = self.capacity
+        self.updated_at = clock()
+
+    def _refill(self):
+        now = self.clock()
+        elapsed = max(now - self.updated_at, 0.0)
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """Return the number of seconds until `amount` tokens are available.
+
+        Requests larger than the capacity are clamped to the capacity so that
+        a single oversized request can still proceed once the bucket is full.
+        """
+        self._refill()
+        amount = min(float(amount), self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_per_second
+
+    def consume(self, amount: float):
+        """Remove `amount` tokens from the bucket."""
+        self._refill()
+        self.tokens -= min(float(amount), self.capacity)
+
+
+class RateLimiter:
+    """Enforce requests-per-minute and tokens-per-minute budgets.
+
+    Callers await `acquire` with the estimated token cost of a request before
+    sending it. Either budget may be omitted to leave that dimension unlimited.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        clock=time.monotonic,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            requests_per_minute: Maximum number of requests per minute (None for unlimited)
+            tokens_per_minute: Maximum number of tokens per minute (None for unlimited)
+            clock: Monotonic clock function, replaceable for testing
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.request_bucket = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60, clock)
+            if requests_per_minute
+            else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60, clock)
+            if tokens_per_minute
+            else None
+        )
+        self._lock = None
+        self._lock_loop = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any budget is being enforced."""
+        return self.request_bucket is not None or self.token_bucket is not None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Locks are bound to the event loop they are first used in, and the CLI
+        # may run several event loops in sequence.
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self, tokens: int = 0):
+        """Wait until a request costing `tokens` fits in both budgets.
+
+        Waiters are served in arrival order so that large requests are not
+        starved by a stream of small ones.
+
+        Args:
+            tokens: Estimated number of tokens (prompt and completion) for the request
+        """
+        if not self.enabled:
+            return
+
+        async with self._get_lock():
+            while True:
+                wait = 0.0
+                if self.request_bucket:
+                    wait = max(wait, self.request_bucket.wait_time(1))
+                if self.token_bucket:
+                    wait = max(wait, self.token_bucket.wait_time(tokens))
+
+                if wait <= 0:
+                    if self.request_bucket:
+                        self.request_bucket.consume(1)
+                    if self.token_bucket:
+                        self.token_bucket.consume(tokens)
+                    return
+
+                logger.debug(
+                    f"Rate limit reached, waiting {wait:.2f}s for {tokens} tokens"
+                )
+                await asyncio.sleep(wait)
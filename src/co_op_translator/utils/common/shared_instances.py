@@ -0,0 +1,58 @@
+"""
+This module contains the registry of objects shared across a run, such as the
+caches and stores of a project. Each object is created once per class and key,
+and `close_shared_instances` closes and forgets them all at the end of a run.
+"""
+
+import logging
+import threading
+from typing import Callable, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_instances = {}  # (class, key) -> instance
+# Reentrant: creating an instance may get the shared instances it depends on
+_lock = threading.RLock()
+
+
+def get_shared_instance(cls: type[T], key: Hashable, create: Callable[[], T]) -> T:
+    """
+    Return the instance of a class shared for a key, creating it on first use.
+
+    Args:
+        cls (type): Class of the shared instance.
+        key (Hashable): Key the instance is shared for, such as a file path.
+        create (Callable): Creates the instance. A None result is returned but
+            not kept, so that the next call tries again.
+
+    Returns:
+        The shared instance, or None if `create` returned None.
+    """
+    with _lock:
+        instance = _instances.get((cls, key))
+        if instance is None:
+            instance = create()
+            if instance is not None:
+                _instances[(cls, key)] = instance
+        return instance
+
+
+def close_shared_instances():
+    """
+    Close every shared instance that has a `close` method and forget them all.
+
+    Instances created afterwards are new ones, so this also isolates tests.
+    """
+    with _lock:
+        instances = list(_instances.values())
+        _instances.clear()
+    for instance in instances:
+        close = getattr(instance, "close", None)
+        if close is None:
+            continue
+        try:
+            close()
+        except Exception as e:
+            logger.warning(f"Failed to close {type(instance).__name__}: {e}")
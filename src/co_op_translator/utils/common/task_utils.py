@@ -78,3 +78,36 @@ async def queue_tasks(
         # Allow workers to finish
         for w in workers:
             await w
+
+
+async def run_tasks_concurrently(
+    tasks: list, max_concurrent_tasks: int = 4, progress_bar=None
+) -> list:
+    """
+    Run tasks with at most `max_concurrent_tasks` in flight and return their results in input order.
+
+    Args:
+        tasks (list): Coroutine functions (called without arguments) or coroutine objects.
+        max_concurrent_tasks (int): Maximum number of tasks running at the same time.
+        progress_bar (tqdm.tqdm, optional): The progress bar to update after each task.
+
+    Returns:
+        list: Task results in the same order as `tasks`. Failed tasks yield None.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrent_tasks))
+
+    async def run(task):
+        async with semaphore:
+            try:
+                result = task() if callable(task) else task
+                if asyncio.iscoroutine(result) or asyncio.isfuture(result):
+                    result = await result
+                return result
+            except Exception as e:
+                logger.error(f"Error processing task: {e}")
+                return None
+            finally:
+                if progress_bar:
+                    progress_bar.update(1)
+
+    return await asyncio.gather(*(run(task) for task in tasks))
@@ -6,6 +6,8 @@ and processing specific Markdown structures such as comments and URLs.
 
 import os
 import re
+import json
+import hashlib
 import tiktoken
 from pathlib import Path
 from urllib.parse import urlparse
@@ -22,6 +24,9 @@ from co_op_translator.utils.common.file_utils import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when the translation prompts change so that cached translations are not reused
+TRANSLATION_PROMPT_VERSION = "1"
+
 
 def generate_prompt_template(
     language_code: str, language_name: str, document_chunk: str, is_rtl: bool
@@ -68,6 +73,91 @@ def generate_prompt_template(
     return prompt
 
 
+def generate_multilingual_prompt_template(
+    languages: list[tuple[str, str, bool]], document_chunk: str
+) -> str:
+    """
+    Generate a prompt that translates a document chunk into several languages in one request.
+
+    The model is asked to return a JSON object keyed by language code so that the
+    response can be split back into per-language translations.
+
+    Args:
+        languages (list[tuple[str, str, bool]]): (language_code, language_name, is_rtl) for each target language.
+        document_chunk (str): The chunk of the document to be translated.
+
+    Returns:
+        str: The generated translation prompt.
+    """
+    targets = "\n".join(
+        f"- {code}: {name} ({'right-to-left' if is_rtl else 'left-to-right'})"
+        for code, name, is_rtl in languages
+    )
+    example = json.dumps({code: "..." for code, _, _ in languages})
+
+    return f"""
+        Translate the following markdown file into each of these languages:
+        {targets}
+        IMPORTANT RULES:
+        1. Respond with a single JSON object of the form {example}, one key per language code above
+        2. Each value must contain ONLY the complete translation into that language, with no extra tags or commentary
+        3. Make sure the translation does not sound too literal
+        4. Translate comments as well
+        5. This file is written in Markdown format - do not treat it as XML or HTML
+        6. Do not translate:
+           - [!NOTE], [!WARNING], [!TIP], [!IMPORTANT], [!CAUTION]
+           - Variable names, function names, class names
+           - Placeholders like @@INLINE_CODE_x@@ or @@CODE_BLOCK_x@@
+           - URLs or paths
+        7. Keep all original markdown formatting intact, including line breaks
+
+{document_chunk}"""
+
+
+def parse_multilingual_response(response: str, language_codes: list[str]) -> dict:
+    """
+    Split a multi-language JSON response into per-language translations.
+
+    Args:
+        response (str): Raw response from the LLM.
+        language_codes (list[str]): Language codes that were requested.
+
+    Returns:
+        dict: Mapping of language code to translated text for the languages present
+        in the response. Unparseable responses yield an empty dict.
+    """
+    try:
+        data = json.loads(extract_json_from_markdown_codeblock(response or "").strip())
+    except (json.JSONDecodeError, ValueError):
+        logger.warning("Multi-language response is not valid JSON")
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    return {
+        code: data[code] for code in language_codes if isinstance(data.get(code), str)
+    }
+
+
+def validate_translated_chunk(source_chunk: str, translated_chunk: str) -> bool:
+    """
+    Check that a translated chunk is usable: non-empty and keeping all code placeholders.
+
+    Args:
+        source_chunk (str): The chunk that was sent for translation.
+        translated_chunk (str): The translation returned for it.
+
+    Returns:
+        bool: True if the translation can be used as-is.
+    """
+    if not translated_chunk or not translated_chunk.strip():
+        return False
+
+    placeholders = set(re.findall(r"@@CODE_BLOCK_\d+@@", source_chunk))
+    return all(placeholder in translated_chunk for placeholder in placeholders)
+
+
 def get_tokenizer(encoding_name: str):
     """
     Get the tokenizer based on the encoding name.
@@ -231,16 +321,40 @@ def process_markdown(
     Returns:
         list: A list of processed markdown chunks.
     """
+    return [
+        chunk
+        for chunk, _ in process_markdown_with_token_counts(
+            content, max_tokens, encoding
+        )
+    ]
+
+
+def process_markdown_with_token_counts(
+    content: str, max_tokens=2600, encoding="o200k_base"
+) -> list[tuple[str, int]]:
+    """
+    Split the markdown content into chunks and return each chunk with its token count.
+
+    Args:
+        content (str): The markdown content to process.
+        max_tokens (int): The maximum number of tokens allowed per chunk.
+        encoding (str): The encoding to use for the tokenizer.
+
+    Returns:
+        list[tuple[str, int]]: A list of (chunk, token_count) tuples.
+    """
     tokenizer = get_tokenizer(encoding)
     chunks = split_markdown_content(content, max_tokens, tokenizer)
 
+    results = []
     for i, chunk in enumerate(chunks):
         chunk_tokens = count_tokens(chunk, tokenizer)
         logger.info(f"Chunk {i+1}: Length = {chunk_tokens} tokens")
         if chunk_tokens == max_tokens:
             logger.warning("Warning: This chunk has reached the maximum token limit.")
+        results.append((chunk, chunk_tokens))
 
-    return chunks
+    return results
 
 
 def process_markdown_with_many_links(content: str, max_links) -> list:
@@ -631,6 +745,77 @@ def restore_code_blocks(translated_document: str, placeholder_map: dict) -> str:
     return translated_document
 
 
+SECTION_HEADING_PATTERN = re.compile(r"^(#{1,6})[ \t]")
+CODE_FENCE_PATTERN = re.compile(r"^[ \t]*(```|~~~)")
+
+
+def split_markdown_sections(document: str) -> list[str]:
+    """
+    Split a markdown document into sections that each start at an ATX heading.
+
+    Text before the first heading forms its own section. Heading-like lines inside
+    fenced code blocks do not start a section. Sections are returned without
+    surrounding blank lines and empty sections are dropped.
+
+    Args:
+        document (str): The markdown document to split.
+
+    Returns:
+        list[str]: The sections of the document in order.
+    """
+    sections = []
+    current = []
+    fence = None
+
+    for line in document.replace("\r\n", "\n").split("\n"):
+        fence_match = CODE_FENCE_PATTERN.match(line)
+        if fence_match:
+            if fence is None:
+                fence = fence_match.group(1)
+            elif fence_match.group(1) == fence:
+                fence = None
+        elif fence is None and SECTION_HEADING_PATTERN.match(line) and current:
+            sections.append("\n".join(current))
+            current = []
+        current.append(line)
+    sections.append("\n".join(current))
+
+    return [section.strip("\n") for section in sections if section.strip()]
+
+
+def get_section_heading_level(section: str) -> int:
+    """
+    Return the heading level of a section, or 0 if it does not start with a heading.
+
+    Args:
+        section (str): A section returned by `split_markdown_sections`.
+
+    Returns:
+        int: The number of leading '#' characters of the section heading.
+    """
+    match = SECTION_HEADING_PATTERN.match(section)
+    return len(match.group(1)) if match else 0
+
+
+def compute_section_hashes(document: str) -> list[str]:
+    """
+    Compute short content hashes of the sections of a markdown document.
+
+    Trailing whitespace is ignored so that insignificant edits keep a section unchanged.
+
+    Args:
+        document (str): The markdown document.
+
+    Returns:
+        list[str]: One hash per section, in document order.
+    """
+    hashes = []
+    for section in split_markdown_sections(document):
+        normalized = "\n".join(line.rstrip() for line in section.split("\n"))
+        hashes.append(hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16])
+    return hashes
+
+
 def extract_json_from_markdown_codeblock(response: str) -> str:
     """
     Extract JSON content from markdown code blocks.
@@ -4,6 +4,7 @@ Functions include generating translation prompts and processing responses from O
 """
 
 import re
+import json
 import logging
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,62 @@ def gen_image_translation_prompt(text_data, language_code, language_name):
     return prompt
 
 
+def gen_multilingual_image_translation_prompt(text_data, languages):
+    """
+    Generate a prompt that translates the lines of an image into several languages at once.
+
+    The model is asked for a JSON object mapping each language code to the list
+    of translated lines, so that the response can be split per language.
+
+    Args:
+        text_data (list): List of text lines to be translated.
+        languages (list[tuple[str, str]]): (language_code, language_name) for each target language.
+
+    Returns:
+        str: Generated translation prompt.
+    """
+    targets = "\n".join(f"- {code}: {name}" for code, name in languages)
+    example = json.dumps({code: ["..."] * len(text_data) for code, _ in languages})
+    prompt = f"""
+    You are a translator that receives a batch of lines in an image. Translate each line into each of these languages:
+    {targets}
+    Respect the context of the text across lines.
+    Respond with a single JSON object of the form {example}: one key per language code above, each holding
+    exactly {len(text_data)} translated lines in the original order. Return only the JSON object.
+    """
+    prompt += json.dumps(list(text_data), ensure_ascii=False)
+    return prompt
+
+
+def parse_multilingual_image_translation(response, language_codes, line_count):
+    """
+    Split a multi-language image translation response into per-language line lists.
+
+    Args:
+        response (str): Raw response from the LLM.
+        language_codes (list[str]): Language codes that were requested.
+        line_count (int): Number of lines that were sent for translation.
+
+    Returns:
+        dict: Mapping of language code to translated lines for the languages whose
+        translation has the expected number of lines. Unparseable responses yield an empty dict.
+    """
+    try:
+        data = json.loads(remove_code_backticks((response or "").strip()))
+    except json.JSONDecodeError:
+        logger.warning("Multi-language image translation response is not valid JSON")
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    return {
+        code: [str(line) for line in data[code]]
+        for code in language_codes
+        if isinstance(data.get(code), list) and len(data[code]) == line_count
+    }
+
+
 def remove_code_backticks(message):
     """
     Remove code block backticks from a message.
@@ -4,8 +4,11 @@ Functions include saving and loading bounding boxes, drawing text on images, and
 """
 
 import os
+import math
 import logging
 import json
+import struct
+import zlib
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont, ImageStat
@@ -20,19 +23,22 @@ from co_op_translator.config.constants import (
 logger = logging.getLogger(__name__)
 
 
-def save_bounding_boxes(image_path, bounding_boxes):
+def save_bounding_boxes(image_path, bounding_boxes, output_path=None):
     """
     Save bounding boxes and confidence scores to a JSON file.
 
     Args:
         image_path (str): Path to the image file.
         bounding_boxes (list): List of bounding boxes and text data.
+        output_path (str, optional): JSON file to write. Defaults to
+            ./bounding_boxes/<image name>.json.
     """
-    base_name = os.path.basename(image_path)
-    name, _ = os.path.splitext(base_name)
-    output_dir = "./bounding_boxes"
-    os.makedirs(output_dir, exist_ok=True)
-    output_path = os.path.join(output_dir, f"{name}.json")
+    if output_path is None:
+        base_name = os.path.basename(image_path)
+        name, _ = os.path.splitext(base_name)
+        output_dir = "./bounding_boxes"
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, f"{name}.json")
 
     with open(output_path, "w", encoding="utf-8") as json_file:
         json.dump(bounding_boxes, json_file, ensure_ascii=False, indent=4)
@@ -165,6 +171,85 @@ def get_dominant_color(image, bounding_box, palette_size=16):
     return tuple(dominant_color), cropped_image
 
 
+def get_dominant_colors(image_array, bounding_boxes, samples=32, bits=4):
+    """
+    Get the dominant colour of the bounding box area of many boxes at once.
+
+    Each box's bounding rectangle is sampled on a `samples` x `samples` grid,
+    the samples are quantized to `bits` bits per channel and counted with a
+    single `np.bincount` over all boxes. The dominant colour of a box is the
+    mean of its samples falling in its most frequent bin.
+
+    Args:
+        image_array (np.ndarray): The image as an (H, W, 3+) uint8 array.
+        bounding_boxes (np.ndarray): An (N, 8) array of box coordinates.
+        samples (int): Number of samples per side of each box's grid.
+        bits (int): Bits per channel kept when counting colours.
+
+    Returns:
+        np.ndarray: The (N, 3) uint8 dominant colours (R, G, B).
+    """
+    boxes = np.asarray(bounding_boxes, dtype=np.float64).reshape(-1, 8)
+    if len(boxes) == 0:
+        return np.empty((0, 3), dtype=np.uint8)
+    height, width = image_array.shape[:2]
+
+    # Bounding rectangles, clipped to the image, and a sampling grid inside each
+    left = np.clip(np.floor(boxes[:, ::2].min(axis=1)), 0, width - 1)
+    right = np.clip(np.ceil(boxes[:, ::2].max(axis=1)) - 1, left, width - 1)
+    top = np.clip(np.floor(boxes[:, 1::2].min(axis=1)), 0, height - 1)
+    bottom = np.clip(np.ceil(boxes[:, 1::2].max(axis=1)) - 1, top, height - 1)
+    steps = np.linspace(0, 1, samples)
+    xs = np.rint(left[:, None] + (right - left)[:, None] * steps).astype(np.intp)
+    ys = np.rint(top[:, None] + (bottom - top)[:, None] * steps).astype(np.intp)
+    pixels = image_array[ys[:, :, None], xs[:, None, :], :3].reshape(len(boxes), -1, 3)
+
+    # One histogram per box, as a single bincount over box-offset bin indices
+    levels = 1 << bits
+    quantized = (pixels >> (8 - bits)).astype(np.intp)
+    bins = (quantized[..., 0] * levels + quantized[..., 1]) * levels + quantized[..., 2]
+    bins += np.arange(len(boxes))[:, None] * levels**3
+    counts = np.bincount(bins.ravel(), minlength=len(boxes) * levels**3)
+    dominant = counts.reshape(len(boxes), -1).argmax(axis=1)
+
+    in_dominant = bins == (dominant + np.arange(len(boxes)) * levels**3)[:, None]
+    totals = np.einsum("ns,nsc->nc", in_dominant, pixels, dtype=np.float64)
+    colors = totals / in_dominant.sum(axis=1, keepdims=True)
+    return np.rint(colors).astype(np.uint8)
+
+
+def adjust_bg_colors(bg_colors, factor=0.05):
+    """
+    Vectorized `adjust_bg_color` for an (N, 3) array of colours.
+
+    Args:
+        bg_colors (np.ndarray): Background colours (R, G, B).
+        factor (float): Fraction by which each colour is moved away from mid-gray.
+
+    Returns:
+        np.ndarray: The (N, 3) uint8 adjusted colours.
+    """
+    colors = np.asarray(bg_colors, dtype=np.float64)
+    bright = colors.mean(axis=1, keepdims=True) >= 128
+    adjusted = np.where(bright, colors * (1 - factor), colors + (255 - colors) * factor)
+    return np.clip(np.floor(adjusted), 0, 255).astype(np.uint8)
+
+
+def get_text_colors(bg_colors):
+    """
+    Vectorized `get_text_color` for an (N, 3) array of background colours.
+
+    Args:
+        bg_colors (np.ndarray): Background colours (R, G, B).
+
+    Returns:
+        np.ndarray: The (N, 3) uint8 text colours, black or white.
+    """
+    colors = np.asarray(bg_colors, dtype=np.float64)
+    luminance = colors @ np.array([0.299, 0.587, 0.114]) / 255
+    return np.where(luminance[:, None] > 0.5, 0, 255).astype(np.uint8).repeat(3, 1)
+
+
 def get_average_color(image, bounding_box):
     """
     Get the average color of a bounding box area in the image.
@@ -201,13 +286,13 @@ def get_text_color(bg_color):
     return (0, 0, 0) if luminance > 0.5 else (255, 255, 255)
 
 
-def warp_image_to_bounding_box(text_img_array, bounding_box, image_width, image_height):
+def _resize_text_to_bounding_box(text_img_array, pts):
     """
-    Apply a perspective warp to a text image so it fits a (possibly rotated)
-    bounding box. The text image is first resized to the rectangle defined by
-    the bounding box geometry, then warped.
+    Resize a text image to the rectangle defined by the bounding box geometry.
+
+    Returns the resized image and its corner points, ready for a perspective
+    transform onto `pts`.
     """
-    pts = np.array(bounding_box, dtype=np.float32).reshape(4, 2)
     # Compute destination width and height.
     widthA = np.linalg.norm(pts[0] - pts[1])
     widthB = np.linalg.norm(pts[2] - pts[3])
@@ -218,6 +303,17 @@ def warp_image_to_bounding_box(text_img_array, bounding_box, image_width, image_
     src_pts = np.float32([[0, 0], [maxWidth, 0], [maxWidth, maxHeight], [0, maxHeight]])
     # Resize the padded text image to the computed rectangle.
     resized_text = cv2.resize(text_img_array, (maxWidth, maxHeight))
+    return resized_text, src_pts
+
+
+def warp_image_to_bounding_box(text_img_array, bounding_box, image_width, image_height):
+    """
+    Apply a perspective warp to a text image so it fits a (possibly rotated)
+    bounding box. The text image is first resized to the rectangle defined by
+    the bounding box geometry, then warped.
+    """
+    pts = np.array(bounding_box, dtype=np.float32).reshape(4, 2)
+    resized_text, src_pts = _resize_text_to_bounding_box(text_img_array, pts)
     matrix = cv2.getPerspectiveTransform(src_pts, pts)
     warped = cv2.warpPerspective(
         resized_text, matrix, (image_width, image_height), flags=cv2.INTER_LINEAR
@@ -225,6 +321,60 @@ def warp_image_to_bounding_box(text_img_array, bounding_box, image_width, image_
     return warped
 
 
+def get_bounding_box_region(bounding_box, image_width, image_height, margin=1):
+    """
+    Get the pixel region covered by a bounding box, clipped to the image.
+
+    Args:
+        bounding_box (list): The bounding box coordinates.
+        image_width (int): Width of the image.
+        image_height (int): Height of the image.
+        margin (int): Extra pixels around the box, for interpolated edges.
+
+    Returns:
+        tuple: (left, top, right, bottom), with right and bottom exclusive.
+    """
+    xs = bounding_box[::2]
+    ys = bounding_box[1::2]
+    left = max(int(math.floor(min(xs))) - margin, 0)
+    top = max(int(math.floor(min(ys))) - margin, 0)
+    right = min(int(math.ceil(max(xs))) + margin + 1, image_width)
+    bottom = min(int(math.ceil(max(ys))) + margin + 1, image_height)
+    return left, top, right, bottom
+
+
+def warp_image_to_bounding_box_region(
+    text_img_array, bounding_box, image_width, image_height
+):
+    """
+    Warp a text image onto a bounding box like `warp_image_to_bounding_box`,
+    but only into the region of the image covered by the box.
+
+    Args:
+        text_img_array (numpy.ndarray): The text image.
+        bounding_box (list): The bounding box coordinates.
+        image_width (int): Width of the image.
+        image_height (int): Height of the image.
+
+    Returns:
+        tuple: The warped region (None if the box lies outside the image) and its
+        (left, top) offset in the image.
+    """
+    left, top, right, bottom = get_bounding_box_region(
+        bounding_box, image_width, image_height
+    )
+    if right <= left or bottom <= top:
+        return None, (left, top)
+
+    pts = np.array(bounding_box, dtype=np.float32).reshape(4, 2)
+    resized_text, src_pts = _resize_text_to_bounding_box(text_img_array, pts)
+    matrix = cv2.getPerspectiveTransform(src_pts, pts - np.float32([left, top]))
+    warped = cv2.warpPerspective(
+        resized_text, matrix, (right - left, bottom - top), flags=cv2.INTER_LINEAR
+    )
+    return warped, (left, top)
+
+
 def draw_text_on_image(text, font, text_color):
     """
     Draw text onto an image with a transparent background.
@@ -265,6 +415,90 @@ def create_filled_polygon_mask(bounding_box, image_size, fill_color):
     return mask_image
 
 
+class PngStreamWriter:
+    """
+    Write a PNG file strip by strip, so that the full image is never held in memory.
+
+    Rows are encoded with the PNG "Sub" filter and compressed into IDAT chunks as
+    they arrive. Use as a context manager and call `write` with consecutive strips
+    from top to bottom.
+    """
+
+    COLOR_TYPES = {"RGB": 2, "RGBA": 6}
+
+    def __init__(self, output_path, width, height, mode="RGBA", compress_level=6):
+        """
+        Args:
+            output_path (str or Path): PNG file to write.
+            width (int): Image width.
+            height (int): Image height.
+            mode (str): 'RGB' or 'RGBA'.
+            compress_level (int): zlib compression level.
+        """
+        if mode not in self.COLOR_TYPES:
+            raise ValueError(f"Unsupported PNG stream mode: {mode}")
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+        self._file = open(output_path, "wb")
+        self._file.write(b"\x89PNG\r\n\x1a\n")
+        self._write_chunk(
+            b"IHDR",
+            struct.pack(">IIBBBBB", width, height, 8, self.COLOR_TYPES[mode], 0, 0, 0),
+        )
+
+    def _write_chunk(self, chunk_type, data):
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+    def write(self, strip):
+        """
+        Append a strip of rows.
+
+        Args:
+            strip (PIL.Image.Image): Rows of the image, as wide as the image.
+        """
+        rows = np.asarray(strip.convert(self.mode)).reshape(strip.height, -1)
+        channels = len(self.mode)
+        filtered = np.empty((rows.shape[0], rows.shape[1] + 1), dtype=np.uint8)
+        filtered[:, 0] = 1  # Sub filter: each byte minus the byte one pixel left
+        filtered[:, 1 : channels + 1] = rows[:, :channels]
+        np.subtract(
+            rows[:, channels:], rows[:, :-channels], out=filtered[:, channels + 1 :]
+        )
+        data = self._compressor.compress(filtered.tobytes())
+        if data:
+            self._write_chunk(b"IDAT", data)
+        self.rows_written += strip.height
+
+    def close(self):
+        """Flush the compressed data and finish the file."""
+        if self._file.closed:
+            return
+        try:
+            self._write_chunk(b"IDAT", self._compressor.flush())
+            self._write_chunk(b"IEND", b"")
+        finally:
+            self._file.close()
+        if self.rows_written != self.height:
+            raise ValueError(
+                f"PNG stream has {self.rows_written} rows but {self.height} were declared"
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+
 # Function to Plot Bounding Boxes on Image. Set display=True to display the image in a notebook.
 # Saves images to ./analyzed_images
 def plot_bounding_boxes(
@@ -392,3 +626,17 @@ def get_image_mode(image_path):
         return "RGB"
     else:
         raise ValueError(f"Unsupported image format: {extension}")
+
+
+def get_image_megapixels(image_path):
+    """
+    Get the decoded size of an image in megapixels, reading only its header.
+
+    Args:
+        image_path (str or Path): The path to the image file.
+
+    Returns:
+        float: Width times height of the image, in millions of pixels.
+    """
+    with Image.open(image_path) as image:
+        return image.width * image.height / 1_000_000
@@ -0,0 +1,61 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from co_op_translator.config.llm_config.provider import LLMProvider
+from co_op_translator.core.llm.chat_client import (
+    ChatClient,
+    close_shared_http_client,
+    get_shared_http_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_shared_http_client_is_reused_until_closed():
+    """Test that one pooled HTTP client serves every request of the event loop."""
+    client = get_shared_http_client()
+
+    assert get_shared_http_client() is client
+
+    await close_shared_http_client()
+    assert client.is_closed
+    new_client = get_shared_http_client()
+    assert new_client is not client
+    await close_shared_http_client()
+
+
+def test_for_provider_shares_instances():
+    """Test that translators and evaluators of the same model share a chat client."""
+    client = ChatClient.for_provider(LLMProvider.OPENAI, "gpt-4o")
+
+    assert ChatClient.for_provider(LLMProvider.OPENAI, "gpt-4o") is client
+    assert ChatClient.for_provider(LLMProvider.OPENAI, "gpt-4o-mini") is not client
+    assert (
+        ChatClient.for_provider(LLMProvider.OPENAI, "gpt-4o", max_retries=2)
+        is not client
+    )
+
+
+@pytest.mark.asyncio
+async def test_complete_sends_direct_chat_request():
+    """Test that prompts are sent as a chat message over one SDK client."""
+    sdk_client = MagicMock()
+    sdk_client.chat.completions.create = AsyncMock(
+        return_value=SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="번역"))]
+        )
+    )
+    chat_client = ChatClient(LLMProvider.AZURE_OPENAI, "gpt-4o-deployment")
+
+    with patch.object(
+        chat_client, "_create_client", return_value=sdk_client
+    ) as mock_create:
+        assert await chat_client.complete("{{not a template}}", top_p=0.8) == "번역"
+        assert await chat_client.complete("second") == "번역"
+
+    mock_create.assert_called_once_with(get_shared_http_client())
+    kwargs = sdk_client.chat.completions.create.await_args_list[0].kwargs
+    assert kwargs["model"] == "gpt-4o-deployment"
+    assert kwargs["messages"] == [{"role": "user", "content": "{{not a template}}"}]
+    assert kwargs["top_p"] == 0.8
+    await close_shared_http_client()
@@ -0,0 +1,85 @@
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from co_op_translator.core.llm.disclaimer_store import (
+    DisclaimerStore,
+    get_disclaimer_text_hash,
+)
+from co_op_translator.core.llm.markdown_translator import MarkdownTranslator
+
+
+class ConcreteMarkdownTranslator(MarkdownTranslator):
+    """A concrete implementation of MarkdownTranslator for testing."""
+
+    async def _run_prompt(self, prompt, index, total):
+        return "translated disclaimer"
+
+
+def test_store_round_trip(tmp_path):
+    """Test that saved entries are reloaded and keyed by language, text hash and model."""
+    path = tmp_path / "disclaimers.json"
+    store = DisclaimerStore(path)
+    store.set("ko", "gpt-4o", "면책 조항")
+    store.save()
+
+    reloaded = DisclaimerStore(path)
+    assert reloaded.get("ko", "gpt-4o") == "면책 조항"
+    assert reloaded.get("ko", "gpt-4o-mini") is None
+    assert reloaded.missing(["ko", "ja"], "gpt-4o") == ["ja"]
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert list(data) == [f"ko:{get_disclaimer_text_hash()}:gpt-4o"]
+
+
+def test_store_ignores_corrupted_file(tmp_path):
+    """Test that an unreadable store starts empty instead of failing."""
+    path = tmp_path / "disclaimers.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    assert DisclaimerStore(path).entries == {}
+
+
+def test_for_project_shares_instances(tmp_path):
+    """Test that translators of the same project share one store."""
+    store = DisclaimerStore.for_project(tmp_path)
+
+    assert DisclaimerStore.for_project(tmp_path) is store
+    assert store.path == (tmp_path / ".co_op_translator" / "disclaimers.json").resolve()
+
+
+@pytest.mark.asyncio
+async def test_generate_disclaimer_uses_store(tmp_path):
+    """Test that a disclaimer is requested once and then served from the store."""
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+
+    with patch.object(
+        translator, "_run_prompt", new_callable=AsyncMock, return_value="Aviso"
+    ) as mock_run_prompt:
+        assert await translator.generate_disclaimer("es") == "Aviso"
+        assert await translator.generate_disclaimer("es") == "Aviso"
+
+    assert mock_run_prompt.await_count == 1
+    assert (
+        DisclaimerStore(translator.disclaimer_store.path).get(
+            "es", translator.get_model_name()
+        )
+        == "Aviso"
+    )
+
+
+@pytest.mark.asyncio
+async def test_prepare_disclaimers_only_translates_missing(tmp_path):
+    """Test that bulk preparation skips stored languages unless refreshing."""
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    translator.disclaimer_store.set("ko", translator.get_model_name(), "stored")
+
+    with patch.object(
+        translator, "_run_prompt", new_callable=AsyncMock, return_value="new"
+    ) as mock_run_prompt:
+        assert await translator.prepare_disclaimers(["ko", "ja", "fr"]) == 2
+        assert mock_run_prompt.await_count == 2
+        assert await translator.generate_disclaimer("ko") == "stored"
+
+        assert await translator.prepare_disclaimers(["ko"], refresh=True) == 1
+        assert await translator.generate_disclaimer("ko") == "new"
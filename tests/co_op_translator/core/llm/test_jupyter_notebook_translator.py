@@ -79,6 +79,18 @@ class TestJupyterNotebookTranslator:
         translator = JupyterNotebookTranslator.create(tmp_path)
         assert translator.root_dir == tmp_path
 
+    @patch("co_op_translator.core.llm.jupyter_notebook_translator.MarkdownTranslator")
+    def test_create_translator_reuses_markdown_translator(
+        self, mock_markdown_translator_class, tmp_path
+    ):
+        """Test that a given markdown translator is shared instead of creating another."""
+        markdown_translator = MagicMock()
+        translator = JupyterNotebookTranslator.create(
+            tmp_path, markdown_translator=markdown_translator
+        )
+        assert translator.markdown_translator is markdown_translator
+        mock_markdown_translator_class.create.assert_not_called()
+
     @patch("co_op_translator.core.llm.jupyter_notebook_translator.MarkdownTranslator")
     @pytest.mark.asyncio
     async def test_translate_notebook_basic(
@@ -111,6 +123,11 @@ class TestJupyterNotebookTranslator:
         assert code_cell["cell_type"] == "code"
         assert "print('Hello, World!')" in "".join(code_cell["source"])
 
+        # Verify the source is recorded in the notebook-level metadata
+        metadata = translated_notebook["metadata"]["co_op_translator"]
+        assert metadata["language_code"] == "es"
+        assert metadata["original_hash"]
+
     @patch("co_op_translator.core.llm.jupyter_notebook_translator.MarkdownTranslator")
     @pytest.mark.asyncio
     async def test_translate_notebook_empty_cells(
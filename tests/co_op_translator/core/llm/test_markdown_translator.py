@@ -105,3 +105,201 @@ async def test_translate_markdown_full_integration(real_markdown_translator, tmp
     assert (
         "[Default Translation]" in result
     ), "Expected the default translation text in the output."
+
+
+@pytest.mark.asyncio
+async def test_throttled_prompt_is_retried(tmp_path):
+    """Test that a 429 response shrinks the concurrency limit and the prompt is retried."""
+    from types import SimpleNamespace
+    from co_op_translator.utils.common.concurrency_controller import (
+        AdaptiveConcurrencyController,
+    )
+
+    class ThrottledError(Exception):
+        status_code = 429
+        response = SimpleNamespace(status_code=429, headers={"retry-after-ms": "10"})
+
+    controller = AdaptiveConcurrencyController(initial_limit=4, max_limit=4)
+    translator = ConcreteMarkdownTranslator(
+        root_dir=tmp_path, concurrency_controller=controller
+    )
+
+    with patch.object(
+        translator,
+        "_run_prompt",
+        new_callable=AsyncMock,
+        side_effect=[ThrottledError(), "translated"],
+    ) as mock_run_prompt:
+        result = await translator._run_rate_limited_prompt("prompt", 1, 1, 100)
+
+    assert result == "translated"
+    assert mock_run_prompt.await_count == 2
+    assert controller.current_limit == 2
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_timeout_applies_to_request_only(tmp_path):
+    """Test that waiting for a concurrency slot does not count toward the timeout."""
+    import asyncio
+    from pathlib import Path
+    from co_op_translator.utils.common.concurrency_controller import (
+        AdaptiveConcurrencyController,
+    )
+
+    controller = AdaptiveConcurrencyController(initial_limit=1, max_limit=1)
+    translator = ConcreteMarkdownTranslator(
+        root_dir=tmp_path, concurrency_controller=controller
+    )
+    translator.TRANSLATION_TIMEOUT_SECONDS = 0.05
+
+    async def hold_slot():
+        await controller.acquire()
+        await asyncio.sleep(0.1)
+        controller.release()
+
+    holder = asyncio.create_task(hold_slot())
+    await asyncio.sleep(0)
+    result = await translator._try_chunk_prompt("prompt", 1, 1, 100, Path("a.md"))
+    await holder
+    assert result == ("[Default Translation] prompt", True)
+
+    async def slow_prompt(prompt, index, total):
+        await asyncio.sleep(1)
+
+    with patch.object(translator, "_run_prompt", side_effect=slow_prompt):
+        text, success = await translator._try_chunk_prompt(
+            "prompt", 1, 1, 100, Path("a.md")
+        )
+    assert not success
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_chunks_translated_concurrently_in_order(tmp_path):
+    """Test that chunks run concurrently under the per-document cap and keep their order."""
+    import asyncio
+
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    translator.MAX_CONCURRENT_CHUNKS = 3
+    in_flight = 0
+    peak = 0
+
+    async def fake_prompt(prompt, index, total):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later chunks finish first
+        await asyncio.sleep(0.01 * (total - index))
+        in_flight -= 1
+        if index == 2:
+            raise RuntimeError("boom")
+        return f"chunk {index}"
+
+    with patch.object(translator, "_run_prompt", side_effect=fake_prompt):
+        results = await translator._translate_chunks(
+            [(f"chunk {i}", 10) for i in range(6)], "ko", tmp_path / "doc.md"
+        )
+
+    assert peak == 3
+    assert results[0] == "chunk 1"
+    assert results[1].startswith("Error translating chunk 2 of 'doc.md'")
+    assert results[2:] == ["chunk 3", "chunk 4", "chunk 5", "chunk 6"]
+
+
+@pytest.mark.asyncio
+async def test_translate_markdown_multilingual_falls_back_per_language(tmp_path):
+    """Test that languages missing from the JSON response are retried individually."""
+    import json
+
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    test_file = tmp_path / "example.md"
+    test_file.write_text(TEST_MD_CONTENT)
+    prompts = []
+
+    async def fake_prompt(prompt, index, total):
+        prompts.append(prompt)
+        if "into each of these languages" in prompt:
+            placeholder = re.search(r"@@CODE_BLOCK_\d+@@", prompt).group(0)
+            # Korean is valid, Japanese drops the placeholder and French is missing
+            return json.dumps(
+                {"ko": f"# 예제\n\n{placeholder}", "ja": "# 例"}, ensure_ascii=False
+            )
+        if "Disclaimer" in prompt:
+            return "Disclaimer"
+        placeholder = re.search(r"@@CODE_BLOCK_\d+@@", prompt).group(0)
+        return f"# Single\n\n{placeholder}"
+
+    with patch.object(translator, "_run_prompt", side_effect=fake_prompt):
+        results = await translator.translate_markdown_multilingual(
+            TEST_MD_CONTENT, ["ko", "ja", "fr"], test_file, add_metadata=False
+        )
+
+    assert set(results) == {"ko", "ja", "fr"}
+    assert results["ko"].startswith("# 예제")
+    assert results["ja"].startswith("# Single")
+    assert results["fr"].startswith("# Single")
+    assert all('print("Hello, world!")' in text for text in results.values())
+
+    single_prompts = [
+        p for p in prompts if "Translate the following markdown file to" in p
+    ]
+    assert len(single_prompts) == 2  # Only ja and fr fall back
+
+
+@pytest.mark.asyncio
+async def test_translate_markdown_incremental_only_sends_changed_sections(tmp_path):
+    """Test that unchanged sections reuse the existing translation."""
+    from co_op_translator.utils.llm.markdown_utils import compute_section_hashes
+
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    translator.disclaimer_store.set("ko", translator.get_model_name(), "면책 조항")
+    test_file = tmp_path / "guide.md"
+
+    old_document = "# Intro\nHello\n\n# Setup\nInstall it\n\n# Usage\nRun it\n"
+    new_document = (
+        "# Intro\nHello\n\n# Setup\nInstall it twice\n\n# Usage\nRun it\n\n# FAQ\nAsk\n"
+    )
+    test_file.write_text(new_document)
+    existing = (
+        translator.format_metadata_comment(
+            {"source_sections": compute_section_hashes(old_document)}
+        )
+        + "# 소개\n안녕\n\n# 설정\n설치\n\n# 사용법\n실행\n\n면책 조항"
+    )
+
+    async def fake_translate(document, language_code, md_file_path, **kwargs):
+        return f"[ko] {document}"
+
+    with patch.object(
+        translator, "translate_markdown", side_effect=fake_translate
+    ) as mock_translate:
+        result = await translator.translate_markdown_incremental(
+            new_document, existing, "ko", test_file
+        )
+
+    sent = [call.args[0] for call in mock_translate.call_args_list]
+    assert sent == ["# Setup\nInstall it twice", "# FAQ\nAsk"]
+    assert result.endswith(
+        "# 소개\n안녕\n\n[ko] # Setup\nInstall it twice\n\n# 사용법\n실행\n\n"
+        "[ko] # FAQ\nAsk\n\n면책 조항"
+    )
+    assert '"source_sections"' in result
+
+
+@pytest.mark.asyncio
+async def test_translate_markdown_incremental_falls_back_without_alignment(tmp_path):
+    """Test that a translation without section metadata is fully retranslated."""
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    test_file = tmp_path / "guide.md"
+    test_file.write_text("# Intro\nHello\n")
+
+    with patch.object(
+        translator, "translate_markdown", new_callable=AsyncMock, return_value="full"
+    ) as mock_translate:
+        result = await translator.translate_markdown_incremental(
+            "# Intro\nHello\n", "# 소개\n안녕", "ko", test_file
+        )
+
+    assert result == "full"
+    mock_translate.assert_awaited_once()
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from co_op_translator.core.llm.text_translator import TextTranslator
 
 
@@ -21,6 +21,9 @@ class MockTextTranslator(TextTranslator):
     def get_model_name(self):
         return "gpt-4"
 
+    def get_chat_client(self):
+        return MagicMock()
+
     def translate_batch(self, texts, target_language):
         """Mock implementation of translate_batch."""
         return [f"Translated: {text}" for text in texts]
@@ -58,3 +61,76 @@ def test_translate_batch(text_translator):
     result = text_translator.translate_batch(texts, target_language)
 
     assert result == ["Translated: Line 1", "Translated: Line 2"]
+
+
+@pytest.mark.asyncio
+async def test_translate_image_text_async(text_translator):
+    """
+    Test that the async variant awaits the chat client and parses the YAML lines.
+    """
+    chat_client = MagicMock()
+    chat_client.complete = AsyncMock(return_value="```yaml\n- Hola\n- Mundo\n```")
+    text_translator.font_config = MagicMock()
+    text_translator.font_config.get_language_name.return_value = "Spanish"
+    text_translator.get_chat_client = MagicMock(return_value=chat_client)
+
+    result = await text_translator.translate_image_text_async(["Hello", "World"], "es")
+
+    assert result == ["Hola", "Mundo"]
+    assert chat_client.complete.await_args.kwargs["system_prompt"]
+
+
+@pytest.mark.asyncio
+async def test_translate_image_text_multilingual_async(text_translator):
+    """
+    Test that several languages are requested in one structured call, with
+    individual retranslation for languages missing from the response.
+    """
+    chat_client = MagicMock()
+    chat_client.complete = AsyncMock(
+        side_effect=[
+            '```json\n{"es": ["Hola", "Mundo"], "fr": ["Bonjour"]}\n```',
+            "- Bonjour\n- Monde",
+        ]
+    )
+    text_translator.font_config = MagicMock()
+    text_translator.font_config.get_language_name.side_effect = lambda code: code
+    text_translator.get_chat_client = MagicMock(return_value=chat_client)
+
+    result = await text_translator.translate_image_text_multilingual_async(
+        ["Hello", "World"], ["es", "fr"]
+    )
+
+    assert result == {"es": ["Hola", "Mundo"], "fr": ["Bonjour", "Monde"]}
+    assert chat_client.complete.await_count == 2
+    assert '["Hello", "World"]' in chat_client.complete.await_args_list[0].args[0]
+
+
+@pytest.mark.asyncio
+async def test_failed_language_batch_falls_back_per_language(text_translator):
+    """
+    Test that a failed batch only sends its own languages to individual requests,
+    and that batched requests stay within the completion token limit.
+    """
+    text_translator.IMAGE_LANGUAGES_PER_REQUEST = 2
+
+    async def complete(prompt, max_tokens, **kwargs):
+        assert max_tokens <= text_translator.MAX_COMPLETION_TOKENS
+        if "- es: es" in prompt:
+            raise RuntimeError("400 Bad Request")
+        if "- de: de" in prompt:
+            return '{"de": ["Hallo"], "it": ["Ciao"]}'
+        return f"- {prompt.split('into ')[1][:2]}"
+
+    chat_client = MagicMock()
+    chat_client.complete = AsyncMock(side_effect=complete)
+    text_translator.font_config = MagicMock()
+    text_translator.font_config.get_language_name.side_effect = lambda code: code
+    text_translator.get_chat_client = MagicMock(return_value=chat_client)
+
+    result = await text_translator.translate_image_text_multilingual_async(
+        ["Hello"], ["es", "fr", "de", "it"]
+    )
+
+    assert result == {"es": ["es"], "fr": ["fr"], "de": ["Hallo"], "it": ["Ciao"]}
+    assert chat_client.complete.await_count == 4
@@ -0,0 +1,99 @@
+import pytest
+from unittest.mock import patch
+
+from co_op_translator.core.llm.markdown_translator import MarkdownTranslator
+from co_op_translator.core.llm.translation_memory import (
+    TranslationMemory,
+    normalize_segment,
+    split_paragraphs,
+)
+
+
+class ConcreteMarkdownTranslator(MarkdownTranslator):
+    """A concrete implementation of MarkdownTranslator for testing."""
+
+    async def _run_prompt(self, prompt, index, total):
+        return ""
+
+
+def test_normalize_and_split_paragraphs():
+    """Test that whitespace-only differences normalize to the same segment."""
+    assert normalize_segment("\nHello  \r\nWorld\n\n") == "Hello\nWorld"
+    assert split_paragraphs("First\nline\n\n  \nSecond\n\n\nThird\n") == [
+        "First\nline",
+        "Second",
+        "Third",
+    ]
+
+
+def test_get_put_and_stats(tmp_path):
+    """Test lookups keyed by segment, language, model and prompt version."""
+    memory = TranslationMemory(tmp_path / "tm.sqlite")
+    memory.put("Hello world", "ko", "gpt-4o", "1", "안녕 세상")
+
+    assert memory.get("Hello world  \n", "ko", "gpt-4o", "1") == "안녕 세상"
+    assert memory.get("Hello world", "ja", "gpt-4o", "1") is None
+    assert memory.get("Hello world", "ko", "gpt-4o-mini", "1") is None
+    assert memory.get("Hello world", "ko", "gpt-4o", "2") is None
+
+    stats = memory.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["entries"] == 1
+
+    # Entries persist across connections
+    memory.close()
+    assert TranslationMemory(tmp_path / "tm.sqlite").get(
+        "Hello world", "ko", "gpt-4o", "1"
+    )
+
+
+def test_lru_eviction_keeps_recently_used(tmp_path):
+    """Test that the least recently used segments are evicted first."""
+    memory = TranslationMemory(tmp_path / "tm.sqlite", max_bytes=30)
+
+    with patch("co_op_translator.core.llm.translation_memory.time.time") as clock:
+        clock.return_value = 1
+        memory.put("a", "ko", "m", "1", "x" * 10)
+        clock.return_value = 2
+        memory.put("b", "ko", "m", "1", "y" * 10)
+        clock.return_value = 3
+        memory.get("a", "ko", "m", "1")  # "a" is now more recent than "b"
+        clock.return_value = 4
+        memory.put("c", "ko", "m", "1", "z" * 15)
+
+    assert memory.get("b", "ko", "m", "1") is None
+    assert memory.get("a", "ko", "m", "1") == "x" * 10
+    assert memory.get("c", "ko", "m", "1") == "z" * 15
+    assert memory.stats()["evictions"] == 1
+    assert memory.total_bytes == 25
+
+
+@pytest.mark.asyncio
+async def test_translator_only_sends_changed_paragraphs(tmp_path):
+    """Test that an edited document only retranslates the paragraphs that changed."""
+    translator = ConcreteMarkdownTranslator(root_dir=tmp_path)
+    sent = []
+
+    async def fake_prompt(prompt, index, total):
+        source = prompt.split("Please write the output from left to right.\n\n")[1]
+        sent.append(source)
+        return "\n\n".join(f"[ko] {p}" for p in split_paragraphs(source))
+
+    original = [("First paragraph.\n\nSecond paragraph.\n\nThird paragraph.", 12)]
+    edited = [("First paragraph.\n\nSecond paragraph, fixed.\n\nThird paragraph.", 13)]
+
+    with patch.object(translator, "_run_prompt", side_effect=fake_prompt):
+        first = await translator._translate_chunks(original, "ko", tmp_path / "a.md")
+        second = await translator._translate_chunks(edited, "ko", tmp_path / "a.md")
+        third = await translator._translate_chunks(edited, "ko", tmp_path / "a.md")
+
+    assert first == [
+        "[ko] First paragraph.\n\n[ko] Second paragraph.\n\n[ko] Third paragraph."
+    ]
+    assert second == [
+        "[ko] First paragraph.\n\n[ko] Second paragraph, fixed.\n\n[ko] Third paragraph."
+    ]
+    assert third == second
+    assert len(sent) == 2
+    assert sent[1] == "Second paragraph, fixed."
@@ -32,7 +32,6 @@ def mock_translation_manager(temp_project_dir):
     manager.translate_image = AsyncMock()
     manager.translate_all_markdown_files = AsyncMock()
     manager.translate_all_image_files = AsyncMock()
-    manager.process_api_requests_parallel = AsyncMock()
     manager.process_api_requests_sequential = AsyncMock()
 
     # Set up common attributes
@@ -40,6 +39,8 @@ def mock_translation_manager(temp_project_dir):
     manager.translations_dir = temp_project_dir / "translations"
     manager.image_dir = temp_project_dir / "translated_images"
     manager.language_codes = ["ko", "ja"]
+    manager.incremental = False
+    manager.translation_state = None
 
     return manager
 
@@ -122,21 +123,6 @@ async def test_translate_all_image_files(mock_translation_manager, temp_project_
     mock_translation_manager.translate_all_image_files.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_process_api_requests_parallel(mock_translation_manager):
-    """Tests parallel API request processing."""
-    mock_tasks = [AsyncMock() for _ in range(3)]
-    mock_translation_manager.process_api_requests_parallel = AsyncMock()
-
-    await mock_translation_manager.process_api_requests_parallel(
-        mock_tasks, "Test tasks"
-    )
-
-    mock_translation_manager.process_api_requests_parallel.assert_called_once_with(
-        mock_tasks, "Test tasks"
-    )
-
-
 @pytest.mark.asyncio
 async def test_process_api_requests_sequential(mock_translation_manager):
     """Tests sequential API request processing."""
@@ -257,3 +243,131 @@ async def test_translate_project_async_with_outdated(
     mock_translation_manager.get_outdated_translations.assert_called_once()
     mock_translation_manager.retranslate_outdated_files.assert_called_once()
     mock_translation_manager.translate_all_markdown_files.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_all_markdown_files_multi_language(temp_project_dir):
+    """Tests that multi-language mode batches languages per file and retries failures."""
+    markdown_translator = MagicMock()
+    markdown_translator.translate_markdown_multilingual = AsyncMock(
+        return_value={"ko": "# 테스트\n번역", "ja": "broken" + "\n" * 40}
+    )
+    manager = TranslationManager(
+        temp_project_dir,
+        temp_project_dir / "translations",
+        temp_project_dir / "translated_images",
+        ["ko", "ja"],
+        [],
+        [".png"],
+        [".ipynb"],
+        markdown_translator,
+        multi_language=True,
+    )
+    manager.translate_markdown = AsyncMock(return_value="ja-path")
+
+    modified_count, errors = await manager.translate_all_markdown_files()
+
+    markdown_translator.translate_markdown_multilingual.assert_awaited_once()
+    manager.translate_markdown.assert_awaited_once()
+    assert manager.translate_markdown.await_args.args[1] == "ja"
+    assert modified_count == 2
+    assert errors == []
+    assert (temp_project_dir / "translations" / "ko" / "docs" / "test.md").read_text(
+        encoding="utf-8"
+    ) == "# 테스트\n번역"
+
+
+@pytest.mark.asyncio
+async def test_translate_markdown_multilingual_records_failures(temp_project_dir):
+    """Tests that a failed multi-language request is recorded for every language."""
+    from co_op_translator.core.project.translation_state import FAILED
+
+    markdown_translator = MagicMock()
+    markdown_translator.translate_markdown_multilingual = AsyncMock(
+        side_effect=RuntimeError("request failed")
+    )
+    manager = TranslationManager(
+        temp_project_dir,
+        temp_project_dir / "translations",
+        temp_project_dir / "translated_images",
+        ["ko", "ja"],
+        [],
+        [".png"],
+        [".ipynb"],
+        markdown_translator,
+        multi_language=True,
+    )
+    source = temp_project_dir / "docs" / "test.md"
+
+    results = await manager.translate_markdown_multilingual(source, ["ko", "ja"])
+
+    assert results == ["", ""]
+    for language_code in ("ko", "ja"):
+        record = manager.translation_state.get(source, language_code)
+        assert record.status == FAILED
+
+
+@pytest.mark.asyncio
+async def test_check_outdated_files_uses_recorded_hashes(temp_project_dir):
+    """Tests that only translations of changed sources are retranslated."""
+    markdown_translator = MagicMock()
+    markdown_translator.translate_markdown = AsyncMock(return_value="# 새 번역")
+    manager = TranslationManager(
+        temp_project_dir,
+        temp_project_dir / "translations",
+        temp_project_dir / "translated_images",
+        ["ko"],
+        ["translations"],
+        [".png"],
+        [".ipynb"],
+        markdown_translator,
+    )
+    changed = temp_project_dir / "docs" / "changed.md"
+    changed.write_text("# Old", encoding="utf-8")
+    for name in ("test.md", "changed.md"):
+        source = temp_project_dir / "docs" / name
+        manager._save_translation(source, "ko", "# 번역")
+    changed.write_text("# New", encoding="utf-8")
+
+    modified_count, errors = await manager.check_outdated_files()
+
+    assert (modified_count, errors) == (1, [])
+    markdown_translator.translate_markdown.assert_awaited_once()
+    assert markdown_translator.translate_markdown.await_args.args[2] == changed
+    ko_dir = temp_project_dir / "translations" / "ko" / "docs"
+    assert (ko_dir / "changed.md").read_text(encoding="utf-8") == "# 새 번역"
+    assert (ko_dir / "test.md").read_text(encoding="utf-8") == "# 번역"
+    assert not manager._is_translation_outdated(changed, ko_dir / "changed.md")
+
+
+@pytest.mark.asyncio
+async def test_retranslate_outdated_files_incremental(temp_project_dir):
+    """Tests that incremental mode updates outdated markdown from the existing translation."""
+    test_md = temp_project_dir / "test.md"
+    test_md.write_text("# Test Document\nThis is a test.", encoding="utf-8")
+    ko_test_md = temp_project_dir / "translations" / "ko" / "test.md"
+    ko_test_md.parent.mkdir(parents=True, exist_ok=True)
+    ko_test_md.write_text("# 테스트 문서\n오래된 번역", encoding="utf-8")
+
+    markdown_translator = MagicMock()
+    markdown_translator.translate_markdown_incremental = AsyncMock(
+        return_value="# 테스트 문서\n새 번역"
+    )
+    manager = TranslationManager(
+        temp_project_dir,
+        temp_project_dir / "translations",
+        temp_project_dir / "translated_images",
+        ["ko"],
+        [],
+        [".png"],
+        [".ipynb"],
+        markdown_translator,
+        incremental=True,
+    )
+
+    await manager.retranslate_outdated_files([(test_md, ko_test_md)])
+
+    call_args = markdown_translator.translate_markdown_incremental.await_args.args
+    assert call_args[1] == "# 테스트 문서\n오래된 번역"
+    assert call_args[2] == "ko"
+    assert ko_test_md.read_text(encoding="utf-8") == "# 테스트 문서\n새 번역"
@@ -0,0 +1,160 @@
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from co_op_translator.core.project.directory_manager import DirectoryManager
+from co_op_translator.core.project.translation_manager import TranslationManager
+from co_op_translator.core.project.translation_state import (
+    EMPTY,
+    FAILED,
+    TRANSLATED,
+    TranslationState,
+)
+from co_op_translator.utils.common.metadata_utils import (
+    calculate_file_hash,
+    format_metadata_comment,
+)
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    root = tmp_path / "project"
+    (root / "docs").mkdir(parents=True)
+    (root / "docs" / "guide.md").write_text("# Guide", encoding="utf-8")
+    (root / "translations" / "ko" / "docs").mkdir(parents=True)
+    return root
+
+
+@pytest.fixture
+def state(project_dir):
+    state = TranslationState(":memory:", project_dir)
+    yield state
+    state.close()
+
+
+def make_manager(project_dir, state):
+    manager = TranslationManager(
+        project_dir,
+        project_dir / "translations",
+        project_dir / "translated_images",
+        ["ko"],
+        [],
+        [".png"],
+        [".ipynb"],
+        MagicMock(),
+    )
+    manager.translation_state = state
+    return manager
+
+
+def test_record_get_and_evaluation(project_dir, state):
+    """Test that records keep the source stat, model and latest evaluation."""
+    source = project_dir / "docs" / "guide.md"
+    translation = project_dir / "translations" / "ko" / "docs" / "guide.md"
+    state.record(source, "ko", translation, "abc", "gpt-4o", "1")
+    state.record_evaluation(source, "ko", 0.5)
+
+    record = state.get(source, "ko")
+    assert record.translation_path == translation
+    assert (record.source_hash, record.model, record.status) == (
+        "abc",
+        "gpt-4o",
+        TRANSLATED,
+    )
+    assert record.matches_stat(source.stat())
+    assert record.evaluation_score == 0.5
+    assert state.get_by_translation(translation).source_file == source
+    assert state.get(source, "ja") is None
+
+    # Retranslating clears the score of the previous translation
+    state.record(source, "ko", translation, "def", status=EMPTY)
+    assert state.get_records("ko")[source].evaluation_score is None
+
+    # A failure keeps the recorded translation
+    state.record_failure(source, "ko", translation)
+    record = state.get(source, "ko")
+    assert (record.source_hash, record.status) == ("def", FAILED)
+    assert not record.is_written
+
+    state.remove(source, "ko")
+    assert state.get_records("ko") == {}
+
+
+def test_rebuild_from_embedded_metadata(project_dir, state):
+    """Test that the state of a language is regenerated from translated files."""
+    translation = project_dir / "translations" / "ko" / "docs" / "guide.md"
+    metadata = {
+        "original_hash": "abc",
+        "source_file": "docs/guide.md",
+        "language_code": "ko",
+        "evaluation": {"confidence_score": 0.4},
+    }
+    translation.write_text(
+        format_metadata_comment(metadata) + "# 가이드\n", encoding="utf-8"
+    )
+    (project_dir / "translations" / "ko" / "untracked.md").write_text("# 없음")
+    state.record(project_dir / "docs" / "guide.md", "ko", translation, "old")
+
+    assert state.rebuild(project_dir / "translations", ["ko"]) == 1
+
+    record = state.get(project_dir / "docs" / "guide.md", "ko")
+    assert (record.source_hash, record.evaluation_score) == ("abc", 0.4)
+    assert record.source_size is None
+
+
+def test_outdated_check_uses_state_without_reading_translations(project_dir, state):
+    """Test that recorded translations are checked by source stat and hash only."""
+    source = project_dir / "docs" / "guide.md"
+    translation = project_dir / "translations" / "ko" / "docs" / "guide.md"
+    translation.write_text("# 가이드", encoding="utf-8")
+    state.record(source, "ko", translation, calculate_file_hash(source))
+    manager = make_manager(project_dir, state)
+
+    with patch.object(type(translation), "read_text") as read_text:
+        assert manager.get_outdated_translations() == []
+        # A touched but unchanged source is current; its new stat is recorded
+        os.utime(source, ns=(0, 0))
+        assert manager.get_outdated_translations() == []
+        assert state.get(source, "ko").source_mtime_ns == 0
+        read_text.assert_not_called()
+
+    source.write_text("# Changed guide", encoding="utf-8")
+    assert manager.get_outdated_translations() == [(source, translation)]
+
+
+def test_outdated_check_backfills_state_from_metadata(project_dir, state):
+    """Test that a current translation missing from the state gets recorded."""
+    source = project_dir / "docs" / "guide.md"
+    translation = project_dir / "translations" / "ko" / "docs" / "guide.md"
+    metadata = {"original_hash": calculate_file_hash(source)}
+    translation.write_text(
+        format_metadata_comment(metadata) + "# 가이드\n", encoding="utf-8"
+    )
+    manager = make_manager(project_dir, state)
+
+    assert manager.get_outdated_translations() == []
+    assert state.get(source, "ko").source_hash == metadata["original_hash"]
+
+
+def test_cleanup_uses_recorded_sources(project_dir, state):
+    """Test that orphans are found from the state and forgotten with their files."""
+    source = project_dir / "docs" / "guide.md"
+    translation = project_dir / "translations" / "ko" / "docs" / "guide.md"
+    translation.write_text("# 가이드 without metadata", encoding="utf-8")
+    state.record(source, "ko", translation, "abc")
+    manager = DirectoryManager(
+        project_dir,
+        project_dir / "translations",
+        ["ko"],
+        [],
+        translation_state=state,
+    )
+
+    assert manager.cleanup_orphaned_translations(images=False) == 0
+    assert translation.exists()
+
+    source.unlink()
+    assert manager.cleanup_orphaned_translations(images=False) == 1
+    assert not translation.exists()
+    assert state.get(source, "ko") is None
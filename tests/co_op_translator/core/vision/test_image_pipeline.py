@@ -0,0 +1,275 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+from co_op_translator.core.vision.image_pipeline import ImagePipeline
+from co_op_translator.utils.common.concurrency_controller import (
+    PixelBudgetController,
+)
+
+BOUNDING_BOXES = [
+    {
+        "text": "LIFE IS LIKE",
+        "bounding_box": [10, 10, 150, 10, 150, 40, 10, 40],
+        "confidence": 0.99,
+    }
+]
+
+
+@pytest.fixture
+def image_translator(tmp_path):
+    """Image translator double whose OCR, translation and fallbacks are recorded."""
+    translator = MagicMock()
+    translator.root_dir = tmp_path
+    translator.extract_line_bounding_boxes.return_value = BOUNDING_BOXES
+    translator.text_translator.translate_image_text_multilingual_async = AsyncMock(
+        side_effect=lambda texts, langs: {
+            lang: [f"[{lang}] {t}" for t in texts] for lang in langs
+        }
+    )
+    translator._save_untranslated_image.side_effect = (
+        lambda path, lang, dest: f"untranslated-{lang}"
+    )
+    translator._save_failed_image.side_effect = (
+        lambda path, lang, error: f"failed-{lang}"
+    )
+    return translator
+
+
+@pytest.mark.asyncio
+async def test_run_returns_results_in_job_order(image_translator, tmp_path):
+    """Test that every job goes through OCR, translation and rendering."""
+    rendered = []
+
+    def fake_render(root_dir, image_path, boxes, translations, dest, fast_mode):
+        paths = {}
+        for lang, texts in translations.items():
+            rendered.append((image_path.name, texts, lang))
+            paths[lang] = f"{image_path.stem}-{lang}"
+        return paths, {}
+
+    jobs = [(tmp_path / f"img{i}.png", ["ko", "ja"]) for i in range(5)]
+    pipeline = ImagePipeline(
+        image_translator,
+        ocr_concurrency=2,
+        translation_concurrency=2,
+        render_executor=ThreadPoolExecutor(2),
+        queue_size=1,
+    )
+    progress_bar = MagicMock()
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        side_effect=fake_render,
+    ):
+        results = await pipeline.run(jobs, tmp_path, progress_bar=progress_bar)
+
+    assert results == [{"ko": f"img{i}-ko", "ja": f"img{i}-ja"} for i in range(5)]
+    assert ("img0.png", ["[ja] LIFE IS LIKE"], "ja") in rendered
+    # One OCR and one translation request per image, then each language is rendered
+    assert image_translator.extract_line_bounding_boxes.call_count == 5
+    text_translator = image_translator.text_translator
+    assert text_translator.translate_image_text_multilingual_async.await_count == 5
+    assert len(rendered) == 10
+    assert progress_bar.update.call_count == 10
+
+
+@pytest.mark.asyncio
+async def test_run_saves_originals_without_text_or_on_failure(
+    image_translator, tmp_path
+):
+    """Test the fallbacks for images without text and for failing stages."""
+    image_translator.extract_line_bounding_boxes.side_effect = lambda path: (
+        [] if path.name == "empty.png" else BOUNDING_BOXES
+    )
+    text_translator = image_translator.text_translator
+    text_translator.translate_image_text_multilingual_async.side_effect = RuntimeError(
+        "translation failed"
+    )
+    pipeline = ImagePipeline(image_translator, render_executor=ThreadPoolExecutor(1))
+
+    results = await pipeline.run(
+        [(tmp_path / "empty.png", ["ko"]), (tmp_path / "text.png", ["ja", "fr"])]
+    )
+
+    assert results == [
+        {"ko": "untranslated-ko"},
+        {"ja": "failed-ja", "fr": "failed-fr"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_ocr_stage_respects_its_concurrency_limit(image_translator, tmp_path):
+    """Test that OCR requests in flight never exceed the OCR limit."""
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_ocr(path):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return BOUNDING_BOXES
+
+    image_translator.extract_line_bounding_boxes.side_effect = slow_ocr
+    pipeline = ImagePipeline(
+        image_translator,
+        ocr_concurrency=3,
+        translation_concurrency=1,
+        render_executor=ThreadPoolExecutor(1),
+    )
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        return_value=({"ko": "done"}, {}),
+    ):
+        results = await pipeline.run(
+            [(tmp_path / f"img{i}.png", ["ko"]) for i in range(12)]
+        )
+
+    assert results == [{"ko": "done"}] * 12
+    assert 1 < peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_render_stage_runs_in_worker_processes(image_translator, tmp_path):
+    """Test rendering a real image in the default process pool."""
+    image_path = tmp_path / "sign.png"
+    Image.new("RGBA", (160, 50), (255, 255, 255, 255)).save(image_path)
+    output_dir = tmp_path / "translated_images"
+
+    pipeline = ImagePipeline(image_translator, render_workers=1)
+    results = await asyncio.wait_for(
+        pipeline.run([(image_path, ["ko"])], output_dir, fast_mode=True), timeout=120
+    )
+
+    output_path = Path(results[0]["ko"])
+    assert output_path.parent == output_dir
+    assert output_path.exists()
+    image_translator._save_failed_image.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_render_stage_stays_within_pixel_budget(image_translator, tmp_path):
+    """Test that renders are admitted by image area rather than by worker count."""
+    lock = threading.Lock()
+    rendering = set()
+    overlaps = []
+
+    def slow_render(root_dir, image_path, boxes, translations, dest, fast_mode):
+        with lock:
+            rendering.add(image_path.name)
+            overlaps.append(set(rendering))
+        time.sleep(0.02)
+        with lock:
+            rendering.discard(image_path.name)
+        return {lang: image_path.name for lang in translations}, {}
+
+    # 1000x1000 images are 1 megapixel each, the poster is 3 megapixels
+    jobs = []
+    for name, size in [("a", 1000), ("b", 1000), ("poster", 1732), ("c", 1000)]:
+        path = tmp_path / f"{name}.png"
+        Image.new("RGB", (size, size)).save(path)
+        jobs.append((path, ["ko"]))
+    budget = PixelBudgetController(budget_megapixels=2)
+    pipeline = ImagePipeline(
+        image_translator,
+        render_workers=4,
+        render_executor=ThreadPoolExecutor(4),
+        pixel_budget=budget,
+    )
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        side_effect=slow_render,
+    ):
+        results = await pipeline.run(jobs)
+
+    assert [result["ko"] for result in results] == [
+        "a.png",
+        "b.png",
+        "poster.png",
+        "c.png",
+    ]
+    assert {"poster.png"} in overlaps
+    assert all("poster.png" not in s or len(s) == 1 for s in overlaps)
+    assert all(len(s) <= 2 for s in overlaps)
+    assert budget.peak_jobs == 2
+    assert budget.in_use == 0
+
+
+@pytest.mark.asyncio
+async def test_images_without_local_text_skip_ocr(image_translator, tmp_path):
+    """Test that images ruled out by the local text detector never reach OCR."""
+    image_translator.has_text.side_effect = lambda path: path.name != "photo.png"
+    pipeline = ImagePipeline(image_translator, render_executor=ThreadPoolExecutor(1))
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        return_value=({"ko": "done"}, {}),
+    ):
+        results = await pipeline.run(
+            [(tmp_path / "photo.png", ["ko"]), (tmp_path / "text.png", ["ko"])]
+        )
+
+    assert results == [{"ko": "untranslated-ko"}, {"ko": "done"}]
+    image_translator.extract_line_bounding_boxes.assert_called_once_with(
+        tmp_path / "text.png"
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_language_does_not_fail_the_others(image_translator, tmp_path):
+    """Test that only the languages that failed to render are saved as originals."""
+    pipeline = ImagePipeline(image_translator, render_executor=ThreadPoolExecutor(1))
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        return_value=({"ko": "done-ko"}, {"ja": "font not found"}),
+    ):
+        results = await pipeline.run([(tmp_path / "text.png", ["ko", "ja"])])
+
+    assert results == [{"ko": "done-ko", "ja": "failed-ja"}]
+    image_translator._save_failed_image.assert_called_once_with(
+        tmp_path / "text.png", "ja", "font not found"
+    )
+
+
+@pytest.mark.asyncio
+async def test_languages_of_few_images_are_split_across_workers(
+    image_translator, tmp_path
+):
+    """Test that idle render workers take part of an image's languages."""
+    groups = []
+
+    def fake_render(root_dir, image_path, boxes, translations, dest, fast_mode):
+        groups.append(sorted(translations))
+        if "fr" in translations:
+            raise RuntimeError("worker crashed")
+        return {lang: f"done-{lang}" for lang in translations}, {}
+
+    languages = ["ko", "ja", "fr", "de"]
+    pipeline = ImagePipeline(
+        image_translator, render_workers=4, render_executor=ThreadPoolExecutor(4)
+    )
+
+    with patch(
+        "co_op_translator.core.vision.image_pipeline.render_annotated_images",
+        side_effect=fake_render,
+    ):
+        results = await pipeline.run([(tmp_path / "text.png", languages)])
+
+    assert sorted(groups) == [["de"], ["fr"], ["ja"], ["ko"]]
+    assert results == [
+        {"ko": "done-ko", "ja": "done-ja", "fr": "failed-fr", "de": "done-de"}
+    ]
@@ -0,0 +1,144 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+from co_op_translator.core.vision.image_renderer import ImageRenderer
+
+LINES = [
+    {
+        "text": "LIFE IS LIKE",
+        "bounding_box": [20, 20, 220, 20, 220, 60, 20, 60],
+        "confidence": 0.99,
+    },
+    {
+        "text": "RIDING A BICYCLE",
+        "bounding_box": [120, 100, 380, 100, 380, 140, 120, 140],
+        "confidence": 0.99,
+    },
+]
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "sign.png"
+    image = Image.new("RGBA", (400, 200), (30, 60, 200, 255))
+    draw = ImageDraw.Draw(image)
+    for line in LINES:
+        draw.rectangle(
+            line["bounding_box"][:2] + line["bounding_box"][4:6], fill=(240, 240, 240)
+        )
+    image.save(path)
+    return path
+
+
+def test_render_plan_erases_text_regions(tmp_path, image_path):
+    """Test that the plan's canvas has every line filled with its background color."""
+    plan = ImageRenderer(tmp_path).build_render_plan(image_path, LINES)
+
+    assert [line.index for line in plan.lines] == [0, 1]
+    canvas = np.array(plan.canvas)
+    for line in plan.lines:
+        x0, y0, x1, y1 = line.bounding_box[:2] + line.bounding_box[4:6]
+        region = canvas[y0 : y1 + 1, x0 : x1 + 1, :3]
+        assert (region == line.bg_color).all()
+        assert line.text_color == (0, 0, 0)
+
+
+@pytest.mark.parametrize("fast_mode", [False, True])
+def test_languages_share_one_render_plan(tmp_path, image_path, fast_mode):
+    """Test that the language-independent plan is built once for all languages."""
+    renderer = ImageRenderer(tmp_path)
+    translations = {
+        "fr": ["LA VIE EST COMME", "FAIRE DU VÉLO"],
+        "es": ["LA VIDA ES COMO", "ANDAR EN BICICLETA"],
+    }
+
+    with patch.object(
+        renderer, "build_render_plan", wraps=renderer.build_render_plan
+    ) as build:
+        paths, errors = renderer.render_languages(
+            image_path, LINES, translations, tmp_path / "out", fast_mode=fast_mode
+        )
+
+    build.assert_called_once()
+    assert errors == {}
+    assert set(paths) == {"fr", "es"}
+    for path in paths.values():
+        assert Path(path).exists()
+    assert not np.array_equal(
+        np.array(Image.open(paths["fr"])), np.array(Image.open(paths["es"]))
+    )
+
+
+def test_failed_language_does_not_stop_the_others(tmp_path, image_path):
+    """Test that a language failing to render is reported and the rest rendered."""
+    renderer = ImageRenderer(tmp_path)
+    translations = {"fr": ["LA VIE", "VÉLO"], "es": ["LA VIDA", "BICICLETA"]}
+    plot = renderer.plot_annotated_image
+
+    def plot_or_fail(image_path, boxes, texts, language_code, *args, **kwargs):
+        if language_code == "fr":
+            raise OSError("font not found")
+        return plot(image_path, boxes, texts, language_code, *args, **kwargs)
+
+    with patch.object(renderer, "plot_annotated_image", side_effect=plot_or_fail):
+        paths, errors = renderer.render_languages(
+            image_path, LINES, translations, tmp_path / "out", fast_mode=True
+        )
+
+    assert list(paths) == ["es"]
+    assert errors == {"fr": "font not found"}
+
+
+def test_render_plan_is_rebuilt_when_image_changes(tmp_path, image_path):
+    """Test that plans are keyed by the image file and detected lines."""
+    renderer = ImageRenderer(tmp_path)
+
+    first = renderer.get_render_plan(image_path, LINES)
+    assert renderer.get_render_plan(image_path, LINES) is first
+    assert renderer.get_render_plan(image_path, LINES[:1]) is not first
+
+    Image.new("RGBA", (400, 200), (0, 0, 0, 255)).save(image_path)
+    assert renderer.get_render_plan(image_path, LINES) is not first
+
+
+def test_invalid_bounding_boxes_are_skipped(tmp_path, image_path):
+    """Test that malformed boxes are left out of the plan, keeping text indices."""
+    lines = [{"text": "broken", "bounding_box": [1, 2, 3]}] + LINES
+
+    plan = ImageRenderer(tmp_path).build_render_plan(image_path, lines)
+
+    assert [line.index for line in plan.lines] == [1, 2]
+
+
+@pytest.mark.parametrize("fast_mode", [False, True])
+@pytest.mark.parametrize("suffix", [".png", ".jpg"])
+def test_tiled_rendering_matches_whole_image(tmp_path, image_path, fast_mode, suffix):
+    """Test that images above the tiling threshold render to the same pixels."""
+    source = tmp_path / f"source{suffix}"
+    Image.open(image_path).convert("RGB" if suffix == ".jpg" else "RGBA").save(source)
+    texts = ["LA VIE EST COMME", "FAIRE DU VÉLO"]
+    # 400x200 is 0.08 megapixels: tiles of 0.01 megapixels are 25 rows high
+    tiled = ImageRenderer(
+        tmp_path, tile_megapixels=0.01, tiled_threshold_megapixels=0.05
+    )
+    whole = ImageRenderer(tmp_path)
+
+    plan = tiled.get_render_plan(source, LINES)
+    assert plan.tile_height == 25
+    assert plan.canvas.mode == ("RGB" if suffix == ".jpg" else "RGBA")
+    assert whole.get_render_plan(source, LINES).tile_height == 0
+
+    tiled_path = tiled.plot_annotated_image(
+        source, LINES, texts, "fr", tmp_path / "tiled", fast_mode=fast_mode
+    )
+    whole_path = whole.plot_annotated_image(
+        source, LINES, texts, "fr", tmp_path / "whole", fast_mode=fast_mode
+    )
+
+    assert np.array_equal(
+        np.array(Image.open(tiled_path)), np.array(Image.open(whole_path))
+    )
@@ -3,6 +3,7 @@ from unittest.mock import patch, MagicMock
 from pathlib import Path
 from PIL import Image
 from co_op_translator.core.vision.image_translator import ImageTranslator
+from co_op_translator.core.vision.text_detector import TextPresenceDetector
 from co_op_translator.core.llm.text_translator import TextTranslator
 
 TEST_IMAGE_PATH = Path("test_image.png").resolve()
@@ -21,6 +22,9 @@ class MockTextTranslator(TextTranslator):
     def get_model_name(self):
         return "gpt-4"
 
+    def get_chat_client(self):
+        return MagicMock()
+
     def translate_batch(self, texts, target_language):
         """Mock implementation of translate_batch."""
         return [f"Translated: {text}" for text in texts]
@@ -33,6 +37,7 @@ class MockImageTranslator(ImageTranslator):
         self.text_translator = MockTextTranslator()
         self.default_output_dir = default_output_dir
         self.root_dir = Path(root_dir)
+        self.text_detector = TextPresenceDetector(None, threshold=0)
         Path(default_output_dir).mkdir(parents=True, exist_ok=True)
 
     def get_image_analysis_client(self):
@@ -280,3 +285,61 @@ def test_extract_text_with_low_confidence(image_translator):
     assert len(result) == 1
     assert result[0]["confidence"] < 0.5
     assert result[0]["text"] == "Low confidence text"
+
+
+@pytest.mark.asyncio
+async def test_translate_image_async_copies_image_without_recognized_text(tmp_path):
+    """
+    Test that an image whose OCR finds no lines is copied rather than failed.
+    """
+    translator = MockImageTranslator(default_output_dir=tmp_path, root_dir=ROOT_DIR)
+    translator.extract_line_bounding_boxes = MagicMock(return_value=[])
+    translator._save_untranslated_image = MagicMock(return_value="untranslated")
+    translator._save_failed_image = MagicMock(return_value="failed")
+
+    result = await translator.translate_image_async(tmp_path / "image.png", "ko")
+
+    assert result == "untranslated"
+    translator._save_failed_image.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_image_async_runs_images_concurrently(tmp_path):
+    """
+    Test that translate_image_async lets several images wait on the LLM at once.
+    """
+    import asyncio
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_translate_image_text_async(text_data, target_language):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return [f"Translated: {text}" for text in text_data]
+
+    translator = MockImageTranslator(default_output_dir=tmp_path, root_dir=ROOT_DIR)
+    translator.text_translator.translate_image_text_async = (
+        fake_translate_image_text_async
+    )
+    translator.extract_line_bounding_boxes = translator.extract_text_from_image
+    translator.plot_annotated_image = MagicMock(
+        side_effect=lambda image_path, *args, **kwargs: str(
+            tmp_path / f"{Path(image_path).stem}_ko.png"
+        )
+    )
+
+    results = await asyncio.gather(
+        *(
+            translator.translate_image_async(tmp_path / f"image{i}.png", "ko")
+            for i in range(3)
+        )
+    )
+
+    assert results == [str(tmp_path / f"image{i}_ko.png") for i in range(3)]
+    assert max_in_flight == 3
+    args = translator.plot_annotated_image.call_args_list[0].args
+    assert args[2] == ["Translated: LIFE IS LIKE"]
@@ -0,0 +1,132 @@
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from co_op_translator.core.vision import ocr_upload
+from co_op_translator.core.vision.image_translator import ImageTranslator
+from co_op_translator.core.vision.ocr_cache import OcrCache
+from co_op_translator.utils.vision.image_utils import load_bounding_boxes
+
+SETTINGS = {"provider": "AzureImageTranslator", "features": ["read"]}
+LINES = [
+    {
+        "text": "LIFE IS LIKE",
+        "bounding_box": [41, 111, 963, 77, 966, 147, 41, 185],
+        "confidence": 0.988,
+    }
+]
+
+
+class CachedImageTranslator(ImageTranslator):
+    """ImageTranslator with a recorded OCR call and no API clients."""
+
+    def __init__(self, root_dir):
+        self.root_dir = Path(root_dir)
+        self.ocr_cache = OcrCache.for_project(root_dir)
+        self.recognize_line_bounding_boxes = MagicMock(return_value=LINES)
+
+    def get_image_analysis_client(self):
+        return MagicMock()
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "diagram.png"
+    path.write_bytes(b"image bytes")
+    return path
+
+
+def test_get_or_extract_reuses_result_on_disk(tmp_path, image_path):
+    """Test that OCR output is stored in the bounding box JSON format and reused."""
+    extract = MagicMock(return_value=LINES)
+
+    first = OcrCache(tmp_path / "ocr").get_or_extract(image_path, SETTINGS, extract)
+    # A new instance (e.g. the next run) reads the stored result
+    cache = OcrCache(tmp_path / "ocr")
+    second = cache.get_or_extract(image_path, SETTINGS, extract)
+
+    assert first == second == LINES
+    extract.assert_called_once_with(image_path)
+    assert (cache.hits, cache.misses) == (1, 0)
+    [entry] = (tmp_path / "ocr").glob("*.json")
+    assert load_bounding_boxes(entry) == LINES
+
+
+def test_key_depends_on_content_and_settings(tmp_path, image_path):
+    """Test that edited images and other OCR settings are recognized again."""
+    cache = OcrCache(tmp_path / "ocr")
+    extract = MagicMock(return_value=LINES)
+
+    cache.get_or_extract(image_path, SETTINGS, extract)
+    cache.get_or_extract(
+        image_path, {**SETTINGS, "features": ["read", "tags"]}, extract
+    )
+    image_path.write_bytes(b"edited image bytes")
+    cache.get_or_extract(image_path, SETTINGS, extract)
+
+    assert extract.call_count == 3
+
+
+def test_concurrent_lookups_extract_once(tmp_path, image_path):
+    """Test that languages translated at the same time share one OCR call."""
+    cache = OcrCache(tmp_path / "ocr")
+    calls = []
+
+    def slow_extract(path):
+        calls.append(path)
+        time.sleep(0.05)
+        return LINES
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(
+                cache.get_or_extract(image_path, SETTINGS, slow_extract)
+            )
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [LINES] * 4
+
+
+def test_image_translator_caches_ocr_across_languages(tmp_path, image_path):
+    """Test that extract_line_bounding_boxes only recognizes an image once."""
+    translator = CachedImageTranslator(tmp_path)
+
+    for _ in ("ko", "ja", "fr"):
+        assert translator.extract_line_bounding_boxes(image_path) == LINES
+
+    translator.recognize_line_bounding_boxes.assert_called_once_with(image_path)
+    assert (tmp_path / ".co_op_translator" / "ocr").is_dir()
+
+
+def test_image_without_text_is_cached_as_empty(tmp_path, image_path):
+    """Test that 'no text' results are cached and returned as no lines."""
+    translator = CachedImageTranslator(tmp_path / "project")
+    translator.recognize_line_bounding_boxes.return_value = []
+
+    for _ in range(2):
+        assert translator.extract_line_bounding_boxes(image_path) == []
+
+    translator.recognize_line_bounding_boxes.assert_called_once()
+
+
+def test_image_is_recognized_again_when_upload_changes(
+    tmp_path, image_path, monkeypatch
+):
+    """Test that results of uploads scaled differently are not reused."""
+    translator = CachedImageTranslator(tmp_path / "project")
+    translator.extract_line_bounding_boxes(image_path)
+    monkeypatch.setattr(ocr_upload, "OCR_MIN_TEXT_HEIGHT", 24)
+    translator.extract_line_bounding_boxes(image_path)
+
+    assert translator.recognize_line_bounding_boxes.call_count == 2
@@ -0,0 +1,130 @@
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision import ocr_upload
+from co_op_translator.core.vision.image_translator import ImageTranslator
+from co_op_translator.core.vision.ocr_upload import (
+    OCR_MIN_TEXT_HEIGHT,
+    OcrUpload,
+    get_upload_scale,
+    prepare_ocr_upload,
+)
+
+
+def _save_text_image(path, size, font_size):
+    image = Image.new("RGB", size, "white")
+    font = ImageFont.truetype(FontConfig().get_font_path("en"), font_size)
+    draw = ImageDraw.Draw(image)
+    draw.text((40, 40), "Riding a bicycle", font=font, fill="black")
+    draw.text((40, 40 + font_size * 2), "Keep moving forward", font=font, fill="black")
+    image.save(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def scale_small_files(monkeypatch):
+    """Let the small test images be scaled."""
+    monkeypatch.setattr(ocr_upload, "MIN_SCALED_UPLOAD_BYTES", 0)
+
+
+class UploadingImageTranslator(ImageTranslator):
+    """ImageTranslator whose analysis client answers in upload coordinates."""
+
+    def __init__(self):
+        self.client = MagicMock()
+        self.client.analyze.side_effect = self._analyze
+
+    def _analyze(self, image_data, visual_features):
+        width, height = Image.open(io.BytesIO(image_data)).size
+        points = [(0, 0), (width, 0), (width, height / 2), (0, height / 2)]
+        line = SimpleNamespace(
+            text="Riding a bicycle",
+            bounding_polygon=[SimpleNamespace(x=x, y=y) for x, y in points],
+            words=[SimpleNamespace(confidence=0.9)],
+        )
+        return SimpleNamespace(
+            read=SimpleNamespace(blocks=[SimpleNamespace(lines=[line])])
+        )
+
+    def get_image_analysis_client(self):
+        return self.client
+
+
+def test_large_text_is_uploaded_downscaled(tmp_path):
+    """Test that images with large text are sent smaller, keeping text legible."""
+    path = _save_text_image(tmp_path / "slide.png", (1800, 1000), 120)
+
+    upload = prepare_ocr_upload(path)
+
+    assert upload.is_scaled
+    assert len(upload.data) < path.stat().st_size
+    uploaded = Image.open(io.BytesIO(upload.data))
+    assert uploaded.format == "PNG"
+    assert uploaded.width == round(1800 * upload.scale_x)
+    assert upload.scale_x <= 0.8
+
+
+@pytest.mark.parametrize("font_size", [None, 24])
+def test_small_or_missing_text_is_uploaded_unchanged(tmp_path, font_size):
+    """Test that images are sent as they are when they cannot be made smaller."""
+    path = tmp_path / "image.png"
+    if font_size:
+        _save_text_image(path, (1800, 1000), font_size)
+    else:
+        Image.new("RGB", (1800, 1000), (40, 120, 200)).save(path)
+
+    upload = prepare_ocr_upload(path)
+
+    assert not upload.is_scaled
+    assert upload.data == path.read_bytes()
+
+
+def test_small_files_are_uploaded_unchanged(tmp_path, monkeypatch):
+    """Test that files below the size worth scaling are not decoded."""
+    path = _save_text_image(tmp_path / "slide.png", (1800, 1000), 120)
+    monkeypatch.setattr(ocr_upload, "MIN_SCALED_UPLOAD_BYTES", 1024 * 1024)
+
+    with patch.object(ocr_upload.text_detector, "estimate_text_height") as estimate:
+        upload = prepare_ocr_upload(path)
+
+    assert upload.data == path.read_bytes()
+    estimate.assert_not_called()
+
+
+def test_upload_scale_keeps_text_and_detector_resolution():
+    """Test the bounds of the upload scale."""
+    assert get_upload_scale(1000, 1000, None) == 1.0
+    assert get_upload_scale(1000, 1000, OCR_MIN_TEXT_HEIGHT * 4) == 0.25
+    assert get_upload_scale(1000, 1000, OCR_MIN_TEXT_HEIGHT * 1.1) == 1.0
+    # Text only measured on a 2048 pixel wide downscale of a 8192 pixel image
+    assert get_upload_scale(8192, 4096, OCR_MIN_TEXT_HEIGHT * 100) == 0.25
+
+
+def test_restore_line_bounding_boxes():
+    """Test that polygons are scaled back to the original image."""
+    upload = OcrUpload(b"", scale_x=0.5, scale_y=0.25)
+    lines = [{"text": "a", "bounding_box": [10, 10, 20, 10, 20, 15, 10, 15]}]
+
+    assert upload.restore_line_bounding_boxes(lines) == [
+        {"text": "a", "bounding_box": [20, 40, 40, 40, 40, 60, 20, 60]}
+    ]
+
+
+def test_recognized_lines_use_original_coordinates(tmp_path):
+    """Test that OCR on a downscaled upload returns lines in original coordinates."""
+    path = _save_text_image(tmp_path / "slide.png", (1800, 1000), 120)
+    translator = UploadingImageTranslator()
+
+    [line] = translator.recognize_line_bounding_boxes(path)
+
+    uploaded = Image.open(
+        io.BytesIO(translator.client.analyze.call_args.kwargs["image_data"])
+    )
+    assert uploaded.width < 1800
+    assert line["bounding_box"] == [0, 0, 1800, 0, 1800, 500, 0, 500]
+    assert line["confidence"] == 0.9
@@ -0,0 +1,166 @@
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+from co_op_translator.config.constants import DEFAULT_TEXT_SCORE_THRESHOLD
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision import text_detector
+from co_op_translator.core.vision.text_detector import (
+    TextPresenceDetector,
+    score_text_likelihood,
+)
+
+
+def _text_image(background="white", fill="black"):
+    image = Image.new("RGB", (800, 300), background)
+    font = ImageFont.truetype(FontConfig().get_font_path("en"), 32)
+    draw = ImageDraw.Draw(image)
+    draw.text((20, 60), "Riding a bicycle", font=font, fill=fill)
+    draw.text((20, 160), "Keep moving forward", font=font, fill=fill)
+    return image
+
+
+def _gray(image):
+    return np.array(image.convert("L"))
+
+
+@pytest.fixture
+def text_image_path(tmp_path):
+    path = tmp_path / "slide.png"
+    _text_image().save(path)
+    return path
+
+
+@pytest.fixture
+def blank_image_path(tmp_path):
+    path = tmp_path / "blank.png"
+    Image.new("RGB", (800, 300), (40, 120, 200)).save(path)
+    return path
+
+
+@pytest.mark.parametrize("colors", [("white", "black"), ((20, 20, 60), "white")])
+def test_text_scores_above_threshold(colors):
+    """Test that dark and light text lines are counted as lined-up glyphs."""
+    assert score_text_likelihood(_gray(_text_image(*colors))) >= (
+        DEFAULT_TEXT_SCORE_THRESHOLD
+    )
+
+
+def test_dense_page_scores_above_threshold():
+    """Test that a page full of small text counts as text, however dense."""
+    image = Image.new("L", (2048, 2048), 255)
+    font = ImageFont.truetype(FontConfig().get_font_path("en"), 14)
+    draw = ImageDraw.Draw(image)
+    line = "The quick brown fox jumps over the lazy dog and keeps moving " * 4
+    for i in range(150):
+        draw.text((10, i * 13.6), line, font=font, fill=0)
+
+    glyphs, _ = text_detector.find_text_glyphs(np.array(image))
+
+    assert len(glyphs) > text_detector.MAX_GLYPH_CANDIDATES
+    assert score_text_likelihood(np.array(image)) >= DEFAULT_TEXT_SCORE_THRESHOLD
+    assert text_detector.estimate_text_height(np.array(image)) is not None
+
+
+@pytest.mark.parametrize("word", ["OK", "API", "Yes"])
+def test_short_label_scores_above_threshold(word):
+    """Test that a single short word is enough to send an image to OCR."""
+    image = Image.new("L", (300, 120), 255)
+    font = ImageFont.truetype(FontConfig().get_font_path("en"), 32)
+    ImageDraw.Draw(image).text((40, 30), word, font=font, fill=0)
+
+    assert score_text_likelihood(np.array(image)) >= DEFAULT_TEXT_SCORE_THRESHOLD
+
+
+def test_images_without_text_score_below_threshold():
+    """Test that flat, smooth and geometric images score below the threshold."""
+    yy, xx = np.mgrid[0:300, 0:800]
+    gradient = ((xx + yy) / 1100 * 255).astype(np.uint8)
+    boxes = Image.new("RGB", (800, 300), "white")
+    draw = ImageDraw.Draw(boxes)
+    for i in range(6):
+        draw.rectangle(
+            [50 + i * 120, 100, 140 + i * 120, 200], outline="black", width=3
+        )
+
+    for gray in (np.full((300, 800), 255, np.uint8), gradient, _gray(boxes)):
+        assert score_text_likelihood(gray) < DEFAULT_TEXT_SCORE_THRESHOLD
+
+
+def test_has_text_skips_images_below_threshold(
+    tmp_path, text_image_path, blank_image_path
+):
+    """Test that only images with text are sent to OCR."""
+    detector = TextPresenceDetector(tmp_path / "scores.json")
+
+    assert detector.has_text(text_image_path)
+    assert not detector.has_text(blank_image_path)
+
+
+def test_scores_are_cached_by_content(tmp_path, text_image_path):
+    """Test that scores are kept on disk and reused for identical images."""
+    cache_path = tmp_path / "scores.json"
+    detector = TextPresenceDetector(cache_path)
+    score = detector.score(text_image_path)
+    detector.close()
+    copy_path = tmp_path / "copy.png"
+    copy_path.write_bytes(text_image_path.read_bytes())
+
+    with patch.object(text_detector, "score_text_likelihood") as scorer:
+        detector = TextPresenceDetector(cache_path, threshold=score + 1)
+        assert detector.score(copy_path) == score
+        assert not detector.has_text(copy_path)
+
+    scorer.assert_not_called()
+
+
+def test_scores_are_written_once_on_close(tmp_path, text_image_path, blank_image_path):
+    """Test that new scores are batched into one cache write when closing."""
+    cache_path = tmp_path / "scores.json"
+    detector = TextPresenceDetector(cache_path)
+
+    with patch.object(
+        detector, "_save_scores", wraps=detector._save_scores
+    ) as save_scores:
+        detector.score(text_image_path)
+        detector.score(blank_image_path)
+        assert not cache_path.exists()
+        detector.close()
+        detector.close()
+
+    save_scores.assert_called_once()
+    assert len(json.loads(cache_path.read_text())["scores"]) == 2
+
+
+def test_threshold_zero_disables_detection(tmp_path, blank_image_path):
+    """Test that a threshold of 0 sends every image to OCR without scoring it."""
+    detector = TextPresenceDetector(tmp_path / "scores.json", threshold=0)
+
+    with patch.object(text_detector, "score_text_likelihood") as scorer:
+        assert detector.has_text(blank_image_path)
+
+    scorer.assert_not_called()
+
+
+def test_unreadable_images_are_assumed_to_have_text(tmp_path):
+    """Test that images the detector cannot decode still go to OCR."""
+    path = tmp_path / "broken.png"
+    path.write_bytes(b"not an image")
+
+    assert TextPresenceDetector(None).has_text(path)
+
+
+def test_scores_of_older_versions_are_discarded(tmp_path, text_image_path):
+    """Test that scores cached before a scoring change are computed again."""
+    cache_path = tmp_path / "scores.json"
+    detector = TextPresenceDetector(cache_path)
+    detector.score(text_image_path)
+    detector.close()
+    cache = json.loads(cache_path.read_text())
+    assert cache["version"] == text_detector.SCORE_VERSION
+    cache_path.write_text(json.dumps({key: 0 for key in cache["scores"]}))
+
+    assert TextPresenceDetector(cache_path).has_text(text_image_path)
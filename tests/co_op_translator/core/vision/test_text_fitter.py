@@ -0,0 +1,52 @@
+import pytest
+
+from co_op_translator.config.font_config import FontConfig
+from co_op_translator.core.vision.text_fitter import TextFitter, load_font
+
+
+@pytest.fixture
+def fitter():
+    return TextFitter.for_font(FontConfig().get_font_path("en"))
+
+
+def test_fonts_and_fitters_are_cached(fitter):
+    """Test that fonts are loaded once per (path, size) and fitters once per path."""
+    assert fitter.get_font(32) is fitter.get_font(32)
+    assert fitter.get_font(32) is load_font(fitter.font_path, 32)
+    assert TextFitter.for_font(fitter.font_path) is fitter
+
+
+@pytest.mark.parametrize(
+    "text, max_width, max_height",
+    [
+        ("Hello world", 200, 40),
+        ("A much longer line of translated text", 150, 60),
+        ("Tall", 400, 25),
+        ("Wide text in a huge box", 3000, 2000),
+    ],
+)
+def test_fit_returns_largest_fitting_size(fitter, text, max_width, max_height):
+    """Test that the fitted text fits its box and one size larger does not."""
+    fitted = fitter.fit(text, max_width, max_height)
+
+    assert (fitted.width, fitted.height) == fitter.measure(text, fitted.size)
+    assert fitted.width <= max_width and fitted.height <= max_height
+    larger_width, larger_height = fitter.measure(text, fitted.size + 1)
+    assert larger_width > max_width or larger_height > max_height
+
+
+def test_fit_falls_back_to_smallest_size(fitter):
+    """Test that text too long for its box still gets a font."""
+    fitted = fitter.fit("x" * 500, 10, 10)
+
+    assert fitted.size == 1
+
+
+def test_estimate_is_close_to_measure(fitter):
+    """Test that cached glyph metrics predict the measured text size."""
+    text = "Translated diagram label"
+    estimated_width, estimated_height = fitter.estimate(text, 40)
+    width, height = fitter.measure(text, 40)
+
+    assert estimated_width == pytest.approx(width, rel=0.1)
+    assert estimated_height == pytest.approx(height, rel=0.1)
@@ -0,0 +1,192 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from co_op_translator.utils.common.concurrency_controller import (
+    AdaptiveConcurrencyController,
+    PixelBudgetController,
+    get_retry_after,
+    is_throttling_error,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic controller tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAPIError(Exception):
+    """Exception shaped like an HTTP client error."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def test_limit_increases_additively_while_latency_is_flat():
+    """Test that each healthy round of requests raises the limit by one."""
+    controller = AdaptiveConcurrencyController(
+        initial_limit=2, max_limit=4, clock=FakeClock()
+    )
+
+    for _ in range(2):
+        controller.record_success(1.0)
+    assert controller.current_limit == 3
+
+    for _ in range(3):
+        controller.record_success(1.0)
+    assert controller.current_limit == 4
+
+    for _ in range(4):
+        controller.record_success(1.0)
+    assert controller.current_limit == 4  # Capped at max_limit
+
+
+def test_limit_holds_when_latency_rises():
+    """Test that the limit does not grow when p95 latency degrades."""
+    controller = AdaptiveConcurrencyController(
+        initial_limit=2, max_limit=8, latency_window=2, clock=FakeClock()
+    )
+
+    controller.record_success(1.0)
+    controller.record_success(1.0)
+    assert controller.current_limit == 3
+
+    for _ in range(3):
+        controller.record_success(5.0)
+    assert controller.current_limit == 3
+
+
+def test_throttle_decreases_multiplicatively_with_cooldown():
+    """Test that throttling halves the limit once per cooldown period."""
+    clock = FakeClock()
+    controller = AdaptiveConcurrencyController(
+        initial_limit=8, max_limit=8, decrease_cooldown=1.0, clock=clock
+    )
+
+    controller.record_throttle()
+    assert controller.current_limit == 4
+
+    controller.record_throttle()  # Same burst of 429s
+    assert controller.current_limit == 4
+
+    clock.now = 2.0
+    controller.record_throttle()
+    assert controller.current_limit == 2
+
+    clock.now = 4.0
+    controller.record_throttle()
+    controller.record_throttle()
+    clock.now = 6.0
+    controller.record_throttle()
+    assert controller.current_limit == 1  # Never below min_limit
+
+
+@pytest.mark.asyncio
+async def test_acquire_respects_current_limit():
+    """Test that no more than `current_limit` requests are in flight."""
+    controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+    in_flight = 0
+    peak = 0
+
+    async def request():
+        nonlocal in_flight, peak
+        async with controller.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_new_requests():
+    """Test that a Retry-After delay blocks acquisition until it expires."""
+    controller = AdaptiveConcurrencyController(initial_limit=2, max_limit=2)
+
+    controller.record_throttle(retry_after=0.05)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await controller.acquire()
+    controller.release()
+
+    assert loop.time() - start >= 0.04
+
+
+def test_throttling_error_detection():
+    """Test detection of 429/503 responses and Retry-After headers."""
+    assert is_throttling_error(FakeAPIError(429))
+    assert is_throttling_error(FakeAPIError(503))
+    assert not is_throttling_error(FakeAPIError(400))
+    assert not is_throttling_error(ValueError("bad input"))
+
+    # Wrapped errors are detected through the exception chain
+    try:
+        try:
+            raise FakeAPIError(429, {"retry-after": "3"})
+        except FakeAPIError as inner:
+            raise RuntimeError("service call failed") from inner
+    except RuntimeError as outer:
+        assert is_throttling_error(outer)
+        assert get_retry_after(outer) == 3.0
+
+
+def test_get_retry_after_prefers_milliseconds_header():
+    """Test that retry-after-ms takes precedence over retry-after."""
+    error = FakeAPIError(429, {"retry-after-ms": "1500", "retry-after": "2"})
+    assert get_retry_after(error) == 1.5
+    assert get_retry_after(FakeAPIError(429)) is None
+
+
+@pytest.mark.asyncio
+async def test_pixel_budget_runs_small_images_together_and_large_ones_alone():
+    """Test that jobs are admitted by image area, in arrival order."""
+    budget = PixelBudgetController(budget_megapixels=10)
+    running = []
+    log = []
+
+    async def job(name, megapixels, duration):
+        async with budget.reserve(megapixels):
+            running.append(name)
+            log.append(sorted(running))
+            await asyncio.sleep(duration)
+            running.remove(name)
+
+    await asyncio.gather(
+        job("small1", 4, 0.02),
+        job("small2", 4, 0.02),
+        job("poster", 40, 0.01),
+        job("small3", 4, 0.01),
+    )
+
+    assert log == [["small1"], ["small1", "small2"], ["poster"], ["small3"]]
+    assert budget.peak_in_use == 40
+    assert budget.peak_jobs == 2
+    assert budget.in_use == 0 and budget.jobs == 0
+    assert "40.0 of 10.0 megapixels" in budget.report()
+
+
+@pytest.mark.asyncio
+async def test_pixel_budget_cancelled_waiter_does_not_block_others():
+    """Test that a cancelled waiting job gives way to the jobs behind it."""
+    budget = PixelBudgetController(budget_megapixels=10)
+    await budget.acquire(8)
+
+    waiting = asyncio.ensure_future(budget.acquire(5))
+    await asyncio.sleep(0)
+    behind = asyncio.ensure_future(budget.acquire(1))
+    await asyncio.sleep(0)
+    assert not behind.done()  # Queued behind the earlier waiter
+
+    waiting.cancel()
+    await asyncio.wait_for(behind, timeout=1)
+    assert budget.in_use == 9
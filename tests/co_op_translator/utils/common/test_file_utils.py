@@ -5,6 +5,7 @@ from co_op_translator.utils.common.file_utils import (
     write_output_file,
     handle_empty_document,
     get_unique_id,
+    get_unique_ids,
     get_filename_and_extension,
     filter_files,
     generate_translated_filename,
@@ -73,6 +74,18 @@ def test_get_unique_id(temp_dir):
     assert len(unique_id) > 0
 
 
+def test_get_unique_ids(temp_dir):
+    """Test that bulk unique IDs match single IDs and skip paths outside the root."""
+    files = [temp_dir / "dir" / "a.png", temp_dir / "b.png"]
+    files[0].parent.mkdir(parents=True)
+    for file_path in files:
+        file_path.touch()
+
+    unique_ids = get_unique_ids(files + [temp_dir.parent / "outside.png"], temp_dir)
+
+    assert unique_ids == {f: get_unique_id(f, temp_dir) for f in files}
+
+
 def test_cross_platform_path_hash_consistency(temp_dir, monkeypatch):
     """Test that path hashing is consistent across different OS path separators."""
     import os
@@ -0,0 +1,93 @@
+import hashlib
+import os
+from unittest.mock import patch
+
+import pytest
+
+from co_op_translator.utils.common import hash_cache
+from co_op_translator.utils.common.hash_cache import FileHashCache, hash_file
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "README.md"
+    path.write_bytes(b"# Title\n" * 300_000)
+    os.utime(path, ns=(10**18, 10**18))  # Outside the racy window
+    return path
+
+
+def test_hash_file_matches_hashlib(source):
+    """Test that block-wise hashing gives the digest of the whole content."""
+    content = source.read_bytes()
+    assert hash_file(source) == hashlib.md5(content).hexdigest()
+    assert hash_file(source, "sha256") == hashlib.sha256(content).hexdigest()
+
+
+def test_unchanged_files_are_hashed_once(source):
+    """Test that a file is hashed again only after its stat changed."""
+    cache = FileHashCache()
+    with patch.object(hash_cache, "hash_file", wraps=hash_file) as hashed:
+        first = cache.get_hash(source)
+        assert cache.get_hash(source) == first
+        assert cache.get_hash(source, "sha256") != first
+        assert hashed.call_count == 2
+
+        source.write_bytes(b"# Changed\n")
+        os.utime(source, ns=(10**18, 10**18 + 1))
+        assert cache.get_hash(source) == hashlib.md5(b"# Changed\n").hexdigest()
+        assert hashed.call_count == 3
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_recently_modified_files_are_not_memoized(tmp_path):
+    """Test that files modified within the racy window are always read."""
+    path = tmp_path / "draft.md"
+    path.write_text("draft")
+    cache = FileHashCache()
+
+    cache.get_hash(path)
+    path.write_text("final")  # Same size, possibly the same mtime
+    assert cache.get_hash(path) == hashlib.md5(b"final").hexdigest()
+
+
+def test_hashes_persist_between_runs(tmp_path, source):
+    """Test that a new cache on the same database reuses the stored hashes."""
+    FileHashCache(tmp_path / "hashes.sqlite").get_hash(source)
+
+    cache = FileHashCache(tmp_path / "hashes.sqlite")
+    with patch.object(hash_cache, "hash_file") as hashed:
+        assert cache.get_hash(source) == hash_file(source)
+        hashed.assert_not_called()
+
+
+def test_bulk_hashes_match_single_hashes(tmp_path, source):
+    """Test that bulk hashing agrees with single hashes and memoizes results."""
+    files = [source]
+    for i in range(20):
+        path = tmp_path / f"file{i}.md"
+        path.write_bytes(f"content {i}".encode() * (i * 1000 + 1))
+        os.utime(path, ns=(10**18, 10**18))
+        files.append(path)
+    missing = tmp_path / "missing.md"
+    cache = FileHashCache()
+
+    digests = cache.get_hashes(files + [missing], max_workers=4)
+
+    assert missing not in digests
+    assert digests == {path: hash_file(path) for path in files}
+    assert cache.get_hashes(files) == digests
+    assert cache.hits == len(files)
+
+
+@pytest.mark.parametrize("algorithm", sorted({hash_cache.FAST_HASH_ALGORITHM, "crc32"}))
+def test_fast_digest_detects_changes(tmp_path, algorithm):
+    """Test that the non-cryptographic digest tells different contents apart."""
+    first = tmp_path / "first.bin"
+    second = tmp_path / "second.bin"
+    first.write_bytes(b"a" * 3_000_000)
+    second.write_bytes(b"a" * 2_999_999 + b"b")
+
+    digests = FileHashCache().get_hashes([first, second], algorithm)
+
+    assert digests[first] != digests[second]
+    assert digests[first] == hash_file(first, algorithm)
@@ -1,12 +1,17 @@
+import io
 import json
 from freezegun import freeze_time
 from pathlib import Path
 from unittest.mock import patch
 
+from co_op_translator.utils.common import metadata_utils
 from co_op_translator.utils.common.metadata_utils import (
+    METADATA_HEADER_BYTES,
+    NOTEBOOK_TAIL_BYTES,
     calculate_file_hash,
     create_metadata,
     format_metadata_comment,
+    read_metadata,
 )
 
 
@@ -148,3 +153,69 @@ def test_format_metadata_comment():
 
     # Verify the indentation
     assert "  " in result  # Should have 2-space indentation
+
+
+def test_read_metadata_reads_only_the_header(tmp_path):
+    """Test that metadata is read from the start of a large translated file."""
+    metadata = {"original_hash": "abc", "source_file": "docs/guide.md"}
+    translated = tmp_path / "guide.md"
+    translated.write_text(
+        format_metadata_comment(metadata) + "# 가이드\n" * 1_000_000, encoding="utf-8"
+    )
+
+    read_sizes = []
+
+    class TrackedFile(io.BytesIO):
+        def read(self, size=-1):
+            read_sizes.append(size)
+            return super().read(size)
+
+    with patch.object(
+        metadata_utils,
+        "open",
+        lambda path, mode: TrackedFile(Path(path).read_bytes()),
+        create=True,
+    ):
+        assert read_metadata(translated) == metadata
+    assert read_sizes == [METADATA_HEADER_BYTES]
+
+
+def test_read_metadata_falls_back_to_full_read(tmp_path):
+    """Test that a metadata block longer than the header is still read."""
+    metadata = {"original_hash": "abc", "section_hashes": ["x" * 64] * 500}
+    translated = tmp_path / "guide.md"
+    translated.write_bytes(
+        format_metadata_comment(metadata).replace("\n", "\r\n").encode() + b"# Body"
+    )
+    assert read_metadata(translated) == metadata
+
+    # An unterminated block or a comment without the marker is not metadata
+    (tmp_path / "open.md").write_text("<!--\nCO_OP_TRANSLATOR_METADATA:\n{}")
+    (tmp_path / "legacy.md").write_text('<!--\n{"source_file": "a.md"}\n-->\n# A')
+    assert read_metadata(tmp_path / "open.md") == {}
+    assert read_metadata(tmp_path / "legacy.md") == {}
+    assert read_metadata(tmp_path / "legacy.md", allow_unmarked=True) == {
+        "source_file": "a.md"
+    }
+
+
+def test_read_notebook_metadata(tmp_path):
+    """Test that notebook metadata is found at the end or by parsing the notebook."""
+    metadata = {"original_hash": "abc", "source_file": "lab.ipynb"}
+    cell = {"cell_type": "markdown", "metadata": {}, "source": ["# 실습\n"] * 5000}
+    notebook = {"cells": [cell], "metadata": {"co_op_translator": metadata}}
+    translated = tmp_path / "lab.ipynb"
+    translated.write_text(json.dumps(notebook, indent=1), encoding="utf-8")
+    assert translated.stat().st_size > NOTEBOOK_TAIL_BYTES
+
+    with patch.object(metadata_utils.json, "load") as load:
+        assert read_metadata(translated) == metadata
+        load.assert_not_called()
+
+    # Notebook metadata written before the cells is found by a full parse
+    reordered = {"metadata": notebook["metadata"], "cells": [cell]}
+    translated.write_text(json.dumps(reordered, indent=1), encoding="utf-8")
+    assert read_metadata(translated) == metadata
+
+    translated.write_text(json.dumps({"cells": [cell], "metadata": {}}))
+    assert read_metadata(translated) == {}
@@ -0,0 +1,83 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from co_op_translator.utils.common.project_index import ProjectIndex
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    root = tmp_path / "project"
+    for relative in [
+        "README.md",
+        "docs/guide.md",
+        "docs/images/diagram.PNG",
+        "docs/images/photo.jpg",
+        "notebooks/intro.ipynb",
+        "node_modules/pkg/README.md",
+        "translations/ko/README.md",
+    ]:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(relative)
+    (root / "empty").mkdir()
+    return root
+
+
+def test_files_are_grouped_by_extension(project_dir):
+    """Test that files are queried by case-insensitive extension."""
+    index = ProjectIndex(project_dir, {"node_modules", "translations"})
+
+    assert sorted(p.relative_to(project_dir).as_posix() for p in index.files) == [
+        "README.md",
+        "docs/guide.md",
+        "docs/images/diagram.PNG",
+        "docs/images/photo.jpg",
+        "notebooks/intro.ipynb",
+    ]
+    assert {p.name for p in index.get_files(".md")} == {"README.md", "guide.md"}
+    assert {p.name for p in index.get_files(".png", ".JPG")} == {
+        "diagram.PNG",
+        "photo.jpg",
+    }
+    assert index.get_files(".gif") == []
+
+
+def test_excluded_directories_are_never_scanned(project_dir):
+    """Test that excluded directories are pruned before descending into them."""
+    scanned = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(os.path.basename(path))
+        return scandir(path)
+
+    with patch("os.scandir", side_effect=recording_scandir):
+        index = ProjectIndex(project_dir, {"node_modules", "translations"})
+
+    assert "node_modules" not in scanned and "pkg" not in scanned
+    assert "translations" not in scanned
+    assert {p.name for p in index.dirs} == {"docs", "images", "notebooks", "empty"}
+
+
+def test_dirs_containing_and_stats(project_dir):
+    """Test directory lookups by content and the recorded file stats."""
+    index = ProjectIndex(project_dir, {"node_modules", "translations"})
+
+    assert index.get_dirs_containing(".png") == {project_dir / "docs" / "images"}
+    assert index.get_dirs_containing(".png", recursive=True) == {
+        project_dir / "docs",
+        project_dir / "docs" / "images",
+    }
+    assert index.get_dirs_containing(".md") == {project_dir / "docs"}
+    readme = project_dir / "README.md"
+    assert index.stat(readme).st_size == readme.stat().st_size
+    assert index.stat(project_dir / "missing.md") is None
+
+
+def test_missing_root_gives_empty_index(tmp_path):
+    """Test that indexing a directory that does not exist yet finds nothing."""
+    index = ProjectIndex(tmp_path / "translations" / "ko")
+
+    assert index.files == [] and index.dirs == []
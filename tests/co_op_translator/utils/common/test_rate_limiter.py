@@ -0,0 +1,85 @@
+import pytest
+from unittest.mock import patch
+from co_op_translator.utils.common.rate_limiter import RateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic rate limit tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    """Test that the bucket refills at its configured rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=60, refill_per_second=1, clock=clock)
+
+    bucket.consume(60)
+    assert bucket.wait_time(10) == pytest.approx(10)
+
+    clock.now = 10
+    assert bucket.wait_time(10) == 0
+
+
+def test_token_bucket_clamps_oversized_requests():
+    """Test that a request larger than the capacity only waits for a full bucket."""
+    clock = FakeClock()
+    bucket = TokenBucket(capacity=100, refill_per_second=10, clock=clock)
+
+    assert bucket.wait_time(1000) == 0
+    bucket.consume(1000)
+    assert bucket.wait_time(1000) == pytest.approx(10)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_unlimited_does_not_wait():
+    """Test that a limiter without budgets never sleeps."""
+    limiter = RateLimiter()
+    assert not limiter.enabled
+
+    with patch("asyncio.sleep") as mock_sleep:
+        for _ in range(100):
+            await limiter.acquire(10_000)
+        mock_sleep.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_request_budget():
+    """Test that exceeding the requests-per-minute budget waits for a refill."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=2, clock=clock)
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        clock.now += seconds
+
+    with patch("asyncio.sleep", side_effect=fake_sleep):
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.acquire()
+
+    assert waits == [pytest.approx(30)]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_waits_for_token_budget():
+    """Test that token-heavy requests wait for the tokens-per-minute budget."""
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=6000, clock=clock)
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+        clock.now += seconds
+
+    with patch("asyncio.sleep", side_effect=fake_sleep):
+        await limiter.acquire(6000)
+        await limiter.acquire(3000)
+
+    # 3000 tokens refill at 100 tokens per second
+    assert waits == [pytest.approx(30)]
@@ -0,0 +1,32 @@
+from unittest.mock import MagicMock
+
+from co_op_translator.utils.common.shared_instances import (
+    close_shared_instances,
+    get_shared_instance,
+)
+
+
+class Store:
+    def __init__(self, key):
+        self.key = key
+        self.close = MagicMock()
+
+
+def test_instances_are_shared_per_class_and_key():
+    """Test that an instance is created once per key and closed at the end."""
+    create = MagicMock(side_effect=lambda: Store("a"))
+    store = get_shared_instance(Store, "a", create)
+
+    assert get_shared_instance(Store, "a", create) is store
+    assert get_shared_instance(Store, "b", lambda: Store("b")) is not store
+    assert create.call_count == 1
+
+    close_shared_instances()
+    store.close.assert_called_once()
+    assert get_shared_instance(Store, "a", lambda: Store("a")) is not store
+
+
+def test_failed_creation_is_retried():
+    """Test that a None result is not kept, so the next call creates again."""
+    assert get_shared_instance(Store, "a", lambda: None) is None
+    assert get_shared_instance(Store, "a", lambda: Store("a")).key == "a"
@@ -1,7 +1,7 @@
 import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from co_op_translator.utils.common.task_utils import worker
+from co_op_translator.utils.common.task_utils import worker, run_tasks_concurrently
 
 
 @pytest.mark.asyncio
@@ -71,3 +71,45 @@ async def test_worker_handles_task_error():
     # Verify the queue is empty despite the error
     assert task_queue.empty()
     mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_concurrently_limits_in_flight_tasks():
+    """Test that results keep input order and concurrency stays bounded."""
+    in_flight = 0
+    max_in_flight = 0
+
+    def make_task(value):
+        async def task():
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01 * (5 - value))
+            in_flight -= 1
+            return value
+
+        return task
+
+    mock_progress = MagicMock()
+    results = await run_tasks_concurrently(
+        [make_task(i) for i in range(5)], 2, mock_progress
+    )
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max_in_flight == 2
+    assert mock_progress.update.call_count == 5
+
+
+@pytest.mark.asyncio
+async def test_run_tasks_concurrently_handles_task_error():
+    """Test that a failing task yields None without affecting the others."""
+
+    async def failing_task():
+        raise ValueError("Task failed")
+
+    async def ok_task():
+        return "ok"
+
+    results = await run_tasks_concurrently([failing_task, ok_task], 2)
+
+    assert results == [None, "ok"]
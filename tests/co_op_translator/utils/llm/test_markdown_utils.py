@@ -8,6 +8,11 @@ from co_op_translator.utils.llm.markdown_utils import (
     process_markdown,
     process_markdown_with_many_links,
     generate_prompt_template,
+    generate_multilingual_prompt_template,
+    parse_multilingual_response,
+    validate_translated_chunk,
+    split_markdown_sections,
+    compute_section_hashes,
     count_links_in_markdown,
     split_markdown_content,
 )
@@ -509,3 +514,60 @@ def test_image_paths_in_nested_structure(complex_dir_structure):
     assert (
         expected_root_markup in result_md_only
     ), f"Expected root image markup: '{expected_root_markup}' not found"
+
+
+def test_generate_multilingual_prompt_template():
+    """Test that the multi-language prompt lists every target and the source chunk once."""
+    chunk = "# Title\nSome text @@CODE_BLOCK_0@@"
+    prompt = generate_multilingual_prompt_template(
+        [("ko", "Korean", False), ("ar", "Arabic", True)], chunk
+    )
+
+    assert "- ko: Korean (left-to-right)" in prompt
+    assert "- ar: Arabic (right-to-left)" in prompt
+    assert '{"ko": "...", "ar": "..."}' in prompt
+    assert prompt.count(chunk) == 1
+
+
+def test_parse_multilingual_response():
+    """Test splitting a JSON response, including one wrapped in a code fence."""
+    response = '```json\n{"ko": "\uc548\ub155", "ja": 3, "fr": "Bonjour"}\n```'
+
+    assert parse_multilingual_response(response, ["ko", "ja", "es"]) == {"ko": "안녕"}
+    assert parse_multilingual_response("not json", ["ko"]) == {}
+    assert parse_multilingual_response('["ko"]', ["ko"]) == {}
+
+
+def test_validate_translated_chunk():
+    """Test that translations must be non-empty and keep code block placeholders."""
+    source = "Intro @@CODE_BLOCK_0@@ and @@CODE_BLOCK_1@@"
+
+    assert validate_translated_chunk(
+        source, "소개 @@CODE_BLOCK_0@@ 그리고 @@CODE_BLOCK_1@@"
+    )
+    assert not validate_translated_chunk(source, "소개 @@CODE_BLOCK_0@@")
+    assert not validate_translated_chunk(source, "   ")
+
+
+def test_split_markdown_sections():
+    """Test splitting at headings while ignoring heading-like lines in code fences."""
+    document = (
+        "Intro\n\n# Title\nText\n\n```bash\n# not a heading\n```\n\n## Sub\nMore\n"
+    )
+
+    assert split_markdown_sections(document) == [
+        "Intro",
+        "# Title\nText\n\n```bash\n# not a heading\n```",
+        "## Sub\nMore",
+    ]
+    assert split_markdown_sections("# Only\n") == ["# Only"]
+
+
+def test_compute_section_hashes_ignores_trailing_whitespace():
+    """Test that only sections with real edits get a different hash."""
+    original = compute_section_hashes("# A\nOne\n\n# B\nTwo\n")
+    edited = compute_section_hashes("# A\nOne  \n\n# B\nTwo, edited\n")
+
+    assert len(original) == 2
+    assert original[0] == edited[0]
+    assert original[1] != edited[1]
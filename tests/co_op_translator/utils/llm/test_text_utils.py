@@ -2,6 +2,8 @@ from co_op_translator.utils.llm.text_utils import (
     remove_code_backticks,
     extract_yaml_lines,
     gen_image_translation_prompt,
+    gen_multilingual_image_translation_prompt,
+    parse_multilingual_image_translation,
 )
 
 
@@ -69,3 +71,25 @@ def test_gen_image_translation_prompt_special_chars():
 
     assert isinstance(prompt, str)
     assert all(line in prompt for line in text_data)
+
+
+def test_gen_multilingual_image_translation_prompt():
+    """Test that the multi-language prompt lists every language and line."""
+    text_data = ["Line 1", "Line 2"]
+    prompt = gen_multilingual_image_translation_prompt(
+        text_data, [("ko", "Korean"), ("ja", "Japanese")]
+    )
+
+    assert "ko: Korean" in prompt
+    assert "ja: Japanese" in prompt
+    assert '["Line 1", "Line 2"]' in prompt
+
+
+def test_parse_multilingual_image_translation():
+    """Test splitting a JSON response and dropping languages with wrong line counts."""
+    response = '```json\n{"ko": ["하나", "둘"], "ja": ["一"], "fr": "un"}\n```'
+
+    result = parse_multilingual_image_translation(response, ["ko", "ja", "fr"], 2)
+
+    assert result == {"ko": ["하나", "둘"]}
+    assert parse_multilingual_image_translation("not json", ["ko"], 2) == {}
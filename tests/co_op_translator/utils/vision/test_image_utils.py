@@ -1,12 +1,21 @@
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 from PIL import Image
 from co_op_translator.utils.vision.image_utils import (
+    PngStreamWriter,
+    adjust_bg_color,
+    adjust_bg_colors,
     get_average_color,
+    get_dominant_colors,
     get_text_color,
+    get_text_colors,
     draw_text_on_image,
     create_filled_polygon_mask,
     get_image_mode,
+    get_bounding_box_region,
+    warp_image_to_bounding_box,
+    warp_image_to_bounding_box_region,
 )
 
 
@@ -102,3 +111,107 @@ def test_get_image_mode():
 
     with pytest.raises(ValueError):
         get_image_mode("test.bmp")
+
+
+def test_get_bounding_box_region_is_clipped():
+    """
+    Test that box regions get a margin and stay within the image.
+    """
+    assert get_bounding_box_region([10, 20, 50, 20, 50, 40, 10, 40], 100, 100) == (
+        9,
+        19,
+        52,
+        42,
+    )
+    assert get_bounding_box_region([-5, -5, 120, -5, 120, 30, -5, 30], 100, 100) == (
+        0,
+        0,
+        100,
+        32,
+    )
+
+
+def test_warp_image_to_bounding_box_region_matches_full_frame():
+    """
+    Test that warping into the box region gives the same pixels as a full-frame warp.
+    """
+    rng = np.random.default_rng(0)
+    text_img = rng.integers(0, 256, size=(30, 120, 4), dtype=np.uint8)
+    bounding_box = [40.5, 60, 180, 52, 183, 90, 43, 98.5]
+
+    full = warp_image_to_bounding_box(text_img, bounding_box, 300, 200)
+    region, (left, top) = warp_image_to_bounding_box_region(
+        text_img, bounding_box, 300, 200
+    )
+
+    height, width = region.shape[:2]
+    assert (
+        np.abs(full[top : top + height, left : left + width].astype(int) - region).max()
+        <= 1
+    )
+    # Nothing is drawn outside the region
+    full[top : top + height, left : left + width] = 0
+    assert not full.any()
+
+
+def test_get_dominant_colors_matches_per_box_results():
+    """
+    Test that the vectorized colours agree with the per-box helpers.
+    """
+    image = np.zeros((120, 200, 3), dtype=np.uint8)
+    image[:60] = (250, 240, 10)
+    image[60:] = (20, 30, 140)
+    image[20:30, 20:80] = (0, 0, 0)  # Text strokes inside the first box
+    boxes = np.array(
+        [
+            [10, 10, 100, 10, 100, 50, 10, 50],
+            [10, 70, 190, 70, 190, 110, 10, 110],
+            [-20, 100, 260, 100, 260, 180, -20, 180],  # Partly outside the image
+        ]
+    )
+
+    colors = get_dominant_colors(image, boxes)
+    assert colors.tolist() == [[250, 240, 10], [20, 30, 140], [20, 30, 140]]
+
+    adjusted = adjust_bg_colors(colors)
+    assert adjusted.tolist() == [list(adjust_bg_color(c)) for c in colors.tolist()]
+    assert get_text_colors(adjusted).tolist() == [
+        list(get_text_color(c)) for c in adjusted.tolist()
+    ]
+
+
+def test_get_dominant_colors_without_boxes():
+    """
+    Test that an empty box array yields an empty colour array.
+    """
+    image = np.zeros((10, 10, 3), dtype=np.uint8)
+    assert get_dominant_colors(image, np.empty((0, 8))).shape == (0, 3)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA"])
+def test_png_stream_writer_round_trip(tmp_path, mode):
+    """
+    Test that an image written strip by strip reads back unchanged.
+    """
+    rng = np.random.default_rng(0)
+    pixels = rng.integers(0, 256, (50, 30, len(mode)), dtype=np.uint8)
+    image = Image.fromarray(pixels, mode)
+    output_path = tmp_path / "streamed.png"
+
+    with PngStreamWriter(output_path, 30, 50, mode) as writer:
+        for top in range(0, 50, 16):
+            writer.write(image.crop((0, top, 30, min(top + 16, 50))))
+
+    with Image.open(output_path) as streamed:
+        assert streamed.mode == mode
+        assert np.array_equal(np.array(streamed), pixels)
+
+
+def test_png_stream_writer_rejects_missing_rows(tmp_path):
+    """
+    Test that closing a stream with fewer rows than declared fails.
+    """
+    writer = PngStreamWriter(tmp_path / "short.png", 10, 10, "RGB")
+    writer.write(Image.new("RGB", (10, 5)))
+    with pytest.raises(ValueError):
+        writer.close()
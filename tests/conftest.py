@@ -0,0 +1,10 @@
+import pytest
+
+from co_op_translator.utils.common.shared_instances import close_shared_instances
+
+
+@pytest.fixture(autouse=True)
+def isolate_shared_instances():
+    """Close the caches and stores shared during a test, so none outlive it."""
+    yield
+    close_shared_instances()